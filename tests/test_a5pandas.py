@@ -0,0 +1,27 @@
+"""A5Pandas polyfill compaction tests."""
+
+import a5
+from shapely.geometry import box
+from vgrid.conversion.dggscompact.a5compact import a5_compact
+
+from vgridpandas.a5pandas import a5_compact_u64, poly2a5
+
+SAMPLE_BOX = box(100.0, 10.0, 106.0, 16.0)
+
+
+def test_poly2a5_compact_matches_vgrid_compact():
+    cells = poly2a5(SAMPLE_BOX, 7, predicate="intersect")
+    result = poly2a5(SAMPLE_BOX, 7, predicate="intersect", compact=True)
+    assert len(result) < len(cells)
+    assert sorted(result) == sorted(a5_compact(cells, verbose=False))
+
+
+def test_compact_u64_expands_back_to_input():
+    cells = [a5.hex_to_u64(h) for h in poly2a5(SAMPLE_BOX, 7, predicate="within")]
+    compacted = a5_compact_u64(cells)
+    assert sorted(a5.uncompact(compacted, 7)) == sorted(set(cells))
+
+
+def test_compact_u64_stops_at_resolution_zero():
+    res0_cells = a5.get_res0_cells()
+    assert a5_compact_u64(res0_cells) == sorted(res0_cells)
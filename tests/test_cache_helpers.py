@@ -0,0 +1,88 @@
+"""Tests for the shared cell-geometry cache."""
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely.geometry import box
+from vgrid.conversion.dggs2geo.geohash2geo import geohash2geo
+
+import vgridpandas.h3pandas  # noqa: F401
+from vgridpandas.utils.cache_helpers import (
+    CellGeometryCache,
+    disable_geometry_cache,
+    enable_geometry_cache,
+    geometry_cache_info,
+    geometry_cache_key,
+)
+from vgridpandas.utils.geo_helpers import dggs_ids_to_geometries
+
+
+@pytest.fixture
+def geometry_cache():
+    yield enable_geometry_cache(maxsize=1000)
+    disable_geometry_cache()
+
+
+def test_lru_eviction_and_counters():
+    cache = CellGeometryCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b", None) is None
+    assert cache.get("c") == 3
+    assert cache.info() == (2, 1, 2, 2)
+
+
+def test_cache_disabled_by_default():
+    assert geometry_cache_info() is None
+
+
+def test_dggs_ids_to_geometries_reuses_cached_cells(geometry_cache):
+    calls = []
+
+    def counting_to_geo(dggs_id):
+        calls.append(dggs_id)
+        return geohash2geo(dggs_id)
+
+    ids = ["w3gvk1", "w3gvk2"]
+    first = dggs_ids_to_geometries(ids, counting_to_geo, dggs="geohash")
+    second = dggs_ids_to_geometries(ids + ["w3gvk3"], counting_to_geo, dggs="geohash")
+    assert calls == ["w3gvk1", "w3gvk2", "w3gvk3"]
+    assert second[0].equals_exact(first[0], 0)
+    assert geometry_cache.info().hits == 2
+
+
+def test_cache_key_includes_antimeridian_option(geometry_cache):
+    df = pd.DataFrame({"h3": ["8f65b56628e0d4f"]})
+    df.h3.h32geo()
+    df.h3.h32geo(fix_antimeridian="shift")
+    assert geometry_cache.info().currsize == 2
+
+
+def test_polyfill_consults_cache(geometry_cache):
+    df = gpd.GeoDataFrame(geometry=[box(14.0, 50.0, 14.1, 50.1)], crs="epsg:4326")
+    first = df.h3.polyfill(7, predicate="largest_overlap")
+    hits, misses = geometry_cache.info()[:2]
+    second = df.h3.polyfill(7, predicate="largest_overlap")
+    assert geometry_cache.info().misses == misses
+    assert geometry_cache.info().hits - hits == misses
+    assert first["h3"].tolist() == second["h3"].tolist()
+
+
+def test_polyfill_and_h32geo_share_cache_entries(geometry_cache):
+    df = gpd.GeoDataFrame(geometry=[box(14.0, 50.0, 14.1, 50.1)], crs="epsg:4326")
+    ids = df.h3.polyfill(7, predicate="largest_overlap", explode=True)["h3"]
+    # only boundary cells get a polygon built during polyfill; h32geo keys them
+    # without passing fix_antimeridian
+    cached = [
+        h3_id
+        for h3_id in ids
+        if geometry_cache.get(geometry_cache_key("h3", h3_id, {}), None) is not None
+    ]
+    assert cached
+    before = geometry_cache.info()
+    pd.DataFrame({"h3": cached}).h3.h32geo()
+    after = geometry_cache.info()
+    assert after.hits - before.hits == len(cached)
+    assert after.misses == before.misses
@@ -0,0 +1,68 @@
+"""DGGALPandas tests against the vgrid DGGAL converters."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point
+from vgrid.conversion.dggs2geo.dggal2geo import dggal2geo
+from vgrid.conversion.latlon2dggs import latlon2dggal
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.dggalpandas import dggal_boundaries, get_dggrs, poly2dggal
+from vgridpandas.utils.geo_helpers import polygons_from_boundaries
+
+DGGS_TYPES = [("isea3h", 6), ("gnosis", 8), ("rhealpix", 4), ("healpix", 4)]
+
+
+def test_get_dggrs_reuses_instance():
+    assert get_dggrs("isea3h") is get_dggrs("ISEA3H ")
+    assert get_dggrs("isea3h") is not get_dggrs("gnosis")
+
+
+@pytest.mark.parametrize("dggs_type, resolution", DGGS_TYPES)
+def test_latlon_and_geometry_match_vgrid(dggs_type, resolution):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {"lat": rng.uniform(-89, 89, 50), "lon": rng.uniform(-180, 180, 50)}
+    )
+    result = df.dggal.latlon2dggal(dggs_type, resolution)
+    zone_ids = result[f"dggal_{dggs_type}"].tolist()
+    assert zone_ids == [
+        latlon2dggal(dggs_type, lat, lon, resolution)
+        for lat, lon in zip(df["lat"], df["lon"])
+    ]
+    gdf = result.dggal.dggal2geo(dggs_type)
+    for geometry, zone_id in zip(gdf.geometry, zone_ids):
+        assert geometry.equals_exact(dggal2geo(dggs_type, zone_id), 1e-9)
+
+
+@pytest.mark.parametrize("dggs_type, resolution", DGGS_TYPES)
+def test_dggal_boundaries_match_dggal2geo(dggs_type, resolution):
+    rng = np.random.default_rng(11)
+    zone_ids = [
+        latlon2dggal(dggs_type, lat, lon, res)
+        for res in range(resolution + 1)
+        for lat, lon in zip(rng.uniform(-89, 89, 8), rng.uniform(-180, 180, 8))
+    ]
+    polygons = polygons_from_boundaries(*dggal_boundaries(dggs_type, zone_ids))
+    for polygon, zone_id in zip(polygons, zone_ids):
+        assert polygon.equals_exact(dggal2geo(dggs_type, zone_id), 1e-9)
+
+
+def test_dggal2geo_invalid_id_is_empty():
+    df = pd.DataFrame({"dggal_isea3h": ["not-a-zone", "A4-0-A"]})
+    gdf = df.dggal.dggal2geo("isea3h")
+    assert gdf.geometry[0].is_empty
+    assert gdf.geometry[1].equals_exact(dggal2geo("isea3h", "A4-0-A"), 1e-9)
+
+
+@pytest.mark.parametrize("predicate", ["within", "centroid_within", "largest_overlap"])
+def test_poly2dggal_predicates(predicate):
+    polygon = Point(5, 45).buffer(1.5)
+    covering = poly2dggal("gnosis", polygon, 9, predicate="intersect")
+    expected = [
+        zone_id
+        for zone_id in covering
+        if check_predicate(dggal2geo("gnosis", zone_id), polygon, predicate)
+    ]
+    assert poly2dggal("gnosis", polygon, 9, predicate=predicate) == expected
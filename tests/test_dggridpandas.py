@@ -0,0 +1,106 @@
+"""DGGRIDPandas tests against a local stand-in for the DGGRID executable."""
+
+import sys
+import textwrap
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from dggrid4py import DGGRIDv8
+from vgrid.conversion.latlon2dggs import latlon2dggrid
+
+import vgridpandas.dggridpandas  # noqa: F401
+
+STAND_IN = textwrap.dedent(
+    """\
+    #!{python}
+    # Stand-in for the DGGRID executable: ids are cells of a 10 degree lat/lon grid.
+    import sys
+
+    meta = {{}}
+    with open(sys.argv[1]) as metafile:
+        for line in metafile:
+            key, _, value = line.strip().partition(" ")
+            meta[key] = value
+
+    with open("calls.log", "a") as log:
+        log.write(meta["dggrid_operation"] + "\\n")
+
+    if meta["dggrid_operation"] == "TRANSFORM_POINTS":
+        with open(meta["input_file_name"]) as src, open(
+            meta["output_file_name"], "w"
+        ) as dst:
+            for line in src:
+                lon, lat = map(float, line.split())
+                seqnum = int((lat + 90) // 10) * 36 + int((lon + 180) // 10) + 1
+                dst.write(f"{{seqnum}}\\n")
+
+    if meta["dggrid_operation"] == "GENERATE_GRID":
+        import geopandas as gpd
+        from shapely.geometry import box
+
+        with open(meta["clip_region_files"]) as src:
+            seqnums = [int(line) for line in src if line.strip()]
+        cells = []
+        for seqnum in seqnums:
+            row, col = divmod(seqnum - 1, 36)
+            lon, lat = col * 10 - 180, row * 10 - 90
+            cells.append(box(lon, lat, lon + 10, lat + 10))
+        gpd.GeoDataFrame({{"name": seqnums}}, geometry=cells, crs=4326).to_file(
+            meta["cell_output_file_name"], driver=meta["cell_output_gdal_format"]
+        )
+    """
+)
+
+
+@pytest.fixture
+def dggrid_instance(tmp_path):
+    executable = tmp_path / "dggrid"
+    executable.write_text(STAND_IN.format(python=sys.executable))
+    executable.chmod(0o755)
+    return DGGRIDv8(executable=str(executable), working_dir=str(tmp_path), silent=True)
+
+
+def dggrid_calls(dggrid_instance):
+    with open(f"{dggrid_instance.working_dir}/calls.log") as log:
+        return log.read().split()
+
+
+@pytest.fixture
+def basic_dataframe():
+    return pd.DataFrame({"lat": [50, 51, -33.9, 10.7], "lon": [14, 15, 18.4, 106.7]})
+
+
+def test_latlon2dggrid_single_run(dggrid_instance, basic_dataframe):
+    result = basic_dataframe.dggrid.latlon2dggrid(dggrid_instance, "ISEA7H", 5)
+    assert dggrid_calls(dggrid_instance) == ["TRANSFORM_POINTS"]
+
+    expected = [
+        latlon2dggrid(dggrid_instance, "ISEA7H", lat, lon, 5)
+        for lat, lon in zip(basic_dataframe["lat"], basic_dataframe["lon"])
+    ]
+    assert result["dggrid_isea7h"].tolist() == expected
+    assert result["dggrid_isea7h_res"].tolist() == [5] * 4
+
+
+def test_latlon2dggrid_missing_coordinates(dggrid_instance):
+    df = pd.DataFrame({"lat": [50, None], "lon": [14, 15]})
+    result = df.dggrid.latlon2dggrid(dggrid_instance, "ISEA7H", 5)
+    assert result["dggrid_isea7h"].iloc[0] == "524"
+    assert pd.isna(result["dggrid_isea7h"].iloc[1])
+
+
+def test_dggrid2geo_single_run(dggrid_instance, basic_dataframe):
+    df = pd.concat([basic_dataframe] * 3, ignore_index=True)
+    df = df.dggrid.latlon2dggrid(dggrid_instance, "ISEA7H", 5)
+    result = df.dggrid.dggrid2geo(dggrid_instance, "ISEA7H", 5)
+    assert dggrid_calls(dggrid_instance) == ["TRANSFORM_POINTS", "GENERATE_GRID"]
+    points = gpd.GeoSeries.from_xy(df["lon"], df["lat"], crs=4326)
+    assert result.geometry.covers(points).all()
+
+
+def test_dggridbin_counts(dggrid_instance, basic_dataframe):
+    result = basic_dataframe.dggrid.dggridbin(dggrid_instance, "ISEA7H", 5)
+    assert dggrid_calls(dggrid_instance) == ["TRANSFORM_POINTS", "GENERATE_GRID"]
+    assert sorted(result["count"].tolist()) == [1, 1, 2]
+    assert not result.geometry.is_empty.any()
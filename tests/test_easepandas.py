@@ -0,0 +1,80 @@
+"""EASEPandas polyfill tests against the ease_dggs candidate search."""
+
+import numpy as np
+import pytest
+from ease_dggs.constants import ease_crs, geo_crs, levels_specs
+from ease_dggs.dggs.grid_addressing import geo_polygon_to_grid_ids, grid_ids_to_ease
+from shapely.geometry import LineString, Point, box
+from vgrid.conversion.dggs2geo.ease2geo import ease2geo
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.easepandas import (
+    ease_cell_centers,
+    ease_cell_ids,
+    ease_polyfill_cells,
+    poly2ease,
+)
+
+SAMPLE_POLYGON = Point(106.7, 10.8).buffer(0.06)
+
+
+def ease_candidates(geometry, resolution):
+    response = geo_polygon_to_grid_ids(
+        box(*geometry.bounds).wkt,
+        resolution,
+        geo_crs,
+        ease_crs,
+        levels_specs,
+        return_centroids=True,
+        wkt_geom=True,
+    )
+    return [str(ease_id) for ease_id in response["result"]["data"]]
+
+
+@pytest.fixture(scope="module")
+def sample_candidates():
+    return ease_candidates(SAMPLE_POLYGON, 3)
+
+
+def test_cell_ids_and_centers_match_ease_dggs():
+    rng = np.random.default_rng(5)
+    rows = rng.integers(0, levels_specs[4]["n_row"], 50)
+    cols = rng.integers(0, levels_specs[4]["n_col"], 50)
+    ids = ease_cell_ids(rows, cols, 4)
+    centers = grid_ids_to_ease(ids)
+    assert np.array_equal(ease_cell_centers(cols, 4, "x"), centers.x.to_numpy())
+    assert np.array_equal(ease_cell_centers(rows, 4, "y"), centers.y.to_numpy())
+
+
+def test_polyfill_cells_cover_candidates(sample_candidates):
+    inside, boundary = ease_polyfill_cells(SAMPLE_POLYGON, 3)
+    found = set(ease_cell_ids(inside[0], inside[1], 3))
+    found |= set(ease_cell_ids(boundary[0], boundary[1], 3))
+    expected = [
+        ease_id
+        for ease_id in sample_candidates
+        if check_predicate(ease2geo(ease_id), SAMPLE_POLYGON, "intersect")
+    ]
+    assert found == set(expected)
+
+
+@pytest.mark.parametrize(
+    "predicate", ["intersect", "within", "centroid_within", "largest_overlap"]
+)
+def test_poly2ease_matches_candidate_filter(sample_candidates, predicate):
+    expected = [
+        ease_id
+        for ease_id in sample_candidates
+        if check_predicate(ease2geo(ease_id), SAMPLE_POLYGON, predicate)
+    ]
+    assert poly2ease(SAMPLE_POLYGON, 3, predicate) == expected
+
+
+def test_poly2ease_line():
+    line = LineString([(0, 0), (0.2, 0.15), (0.3, -0.05)])
+    expected = [
+        ease_id
+        for ease_id in ease_candidates(line, 3)
+        if ease2geo(ease_id).intersects(line)
+    ]
+    assert poly2ease(line, 3) == expected
@@ -0,0 +1,36 @@
+"""Basic GARSPandas accessor tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from vgrid.conversion.latlon2dggs import latlon2gars
+
+from vgridpandas.garspandas import latlon2gars_array
+
+
+@pytest.mark.parametrize("resolution", range(1, 5))
+def test_latlon2gars_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    minutes = rng.integers(-5400, 5400, 100) / 60.0
+    lats = np.concatenate([rng.uniform(-90, 90, 200), minutes, [0.0, -90.0, 90.0]])
+    lons = np.concatenate(
+        [rng.uniform(-180, 180, 200), 2 * minutes, [0.0, -180.0, 179.9]]
+    )
+    expected = [latlon2gars(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2gars_array(lats, lons, resolution).tolist() == expected
+
+
+def test_latlon2gars_array_missing_coordinates():
+    result = latlon2gars_array([np.nan, 10.77], [0, 106.7], 4)
+    assert result.tolist() == [None, "574JK1917"]
+
+
+def test_latlon2gars_array_rejects_antimeridian_band():
+    with pytest.raises(ValueError, match="721"):
+        latlon2gars_array([0.0], [180.0], 1)
+
+
+def test_garsbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.gars.garsbin(3)
+    assert dict(zip(result["gars"], result["count"])) == {"389MS37": 2, "391MU37": 1}
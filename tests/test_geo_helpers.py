@@ -0,0 +1,72 @@
+"""Tests for the shared DGGS id to geometry helpers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from vgrid.conversion.dggs2geo.geohash2geo import geohash2geo
+from vgrid.conversion.dggs2geo.h32geo import h32geo
+from vgrid.conversion.dggs2geo.quadkey2geo import quadkey2geo
+from vgrid.conversion.dggs2geo.tilecode2geo import tilecode2geo
+
+from vgridpandas import geohashpandas, h3pandas, quadkeypandas, tilecodepandas
+from vgridpandas.utils.geo_helpers import dggs_ids_to_geometries
+
+BULK_CASES = [
+    ("h3", 9, h32geo, h3pandas.h3_boundaries),
+    ("geohash", 7, geohash2geo, geohashpandas.geohash_boundaries),
+    ("quadkey", 17, quadkey2geo, quadkeypandas.quadkey_boundaries),
+    ("tilecode", 17, tilecode2geo, tilecodepandas.tilecode_boundaries),
+]
+
+
+@pytest.fixture
+def random_dataframe():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"lat": rng.uniform(-80, 80, 200), "lon": rng.uniform(-180, 180, 200)}
+    )
+
+
+@pytest.mark.parametrize("name, resolution, to_geo, to_boundaries", BULK_CASES)
+def test_bulk_geometries_match_per_cell(
+    random_dataframe, name, resolution, to_geo, to_boundaries
+):
+    accessor = getattr(random_dataframe, name)
+    ids = getattr(accessor, f"latlon2{name}")(resolution)[name].tolist()
+    ids[1] = None
+    ids[2] = ids[3:6]
+    ids[6] = []
+
+    expected = dggs_ids_to_geometries(ids, to_geo)
+    result = dggs_ids_to_geometries(ids, to_geo, to_boundaries=to_boundaries)
+    assert len(result) == len(expected)
+    for got, want in zip(result, expected):
+        assert got.geom_type == want.geom_type
+        assert got.equals_exact(want, 1e-9)
+    assert result[1].is_empty and result[6].is_empty
+
+
+def test_bulk_geometries_fall_back_on_invalid_ids():
+    ids = ["w3gvk1", "not-a-geohash!"]
+    result = dggs_ids_to_geometries(
+        ids, geohash2geo, to_boundaries=geohashpandas.geohash_boundaries
+    )
+    assert result[0].equals_exact(geohash2geo("w3gvk1"), 0)
+    assert result[1].is_empty
+
+
+def test_repeated_ids_are_converted_once():
+    calls = []
+
+    def counting_to_geo(dggs_id):
+        calls.append(dggs_id)
+        return geohash2geo(dggs_id)
+
+    ids = ["w3gvk1", "w3gvk1", None, ["w3gvk1", "w3gvk2"], "w3gvk2"]
+    result = dggs_ids_to_geometries(ids, counting_to_geo)
+    assert sorted(calls) == ["w3gvk1", "w3gvk2"]
+    assert result[0].equals_exact(geohash2geo("w3gvk1"), 0)
+    assert result[1].equals_exact(result[0], 0)
+    assert result[2].is_empty
+    assert result[3].geom_type == "MultiPolygon"
+    assert len(result[3].geoms) == 2
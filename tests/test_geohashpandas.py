@@ -0,0 +1,71 @@
+"""Basic GeohashPandas accessor tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Polygon
+from vgrid.conversion.dggs2geo.geohash2geo import geohash2geo
+from vgrid.conversion.dggscompact.geohashcompact import geohash_compact
+from vgrid.conversion.latlon2dggs import latlon2geohash
+from vgrid.dggs import geohash
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.geohashpandas import (
+    geohash_descendants,
+    latlon2geohash_array,
+    poly2geohash,
+)
+
+
+@pytest.mark.parametrize("resolution", range(1, 11))
+def test_latlon2geohash_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    lats = np.append(rng.uniform(-90, 90, 200), [0.0, -90.0, 45.0])
+    lons = np.append(rng.uniform(-360, 360, 200), [0.0, 180.0, -180.0])
+    expected = [latlon2geohash(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2geohash_array(lats, lons, resolution).tolist() == expected
+
+
+def test_latlon2geohash_array_missing_coordinates():
+    result = latlon2geohash_array([np.nan, 10.775275567242561], [0, 106.7067], 6)
+    assert result.tolist() == [None, "w3gvk1"]
+
+
+def test_geohashbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.geohash.geohashbin(5)
+    assert dict(zip(result["geohash"], result["count"])) == {"u2cuq": 2, "u34dj": 1}
+    assert isinstance(df.geohash.latlon2geohash(5)["geohash"].iloc[0], str)
+
+
+SAMPLE_POLYGON = Polygon(
+    [(106.6, 10.7), (106.8, 10.72), (106.85, 10.9), (106.62, 10.86)],
+    [[(106.7, 10.78), (106.75, 10.78), (106.72, 10.82)]],
+)
+
+
+def test_geohash_descendants_match_scalar_children():
+    result = geohash_descendants(["w3", "w4"], 4)
+    expected = geohash.geohash_children("w3", 4) + geohash.geohash_children("w4", 4)
+    assert sorted(result.tolist()) == sorted(expected)
+
+
+@pytest.mark.parametrize(
+    "predicate", ["intersect", "within", "centroid_within", "largest_overlap"]
+)
+def test_poly2geohash_matches_brute_force(predicate):
+    candidates = geohash.geohash_children("w3g", 5)
+    expected = [
+        gh
+        for gh in candidates
+        if check_predicate(geohash2geo(gh), SAMPLE_POLYGON, predicate)
+    ]
+    result = poly2geohash(SAMPLE_POLYGON, 5, predicate)
+    assert sorted(result) == sorted(expected)
+
+
+def test_poly2geohash_compact_keeps_interior_prefixes():
+    cells = poly2geohash(SAMPLE_POLYGON, 6, "within")
+    compacted = poly2geohash(SAMPLE_POLYGON, 6, "within", compact=True)
+    assert any(len(gh) < 6 for gh in compacted)
+    assert sorted(geohash_compact(cells, verbose=False)) == sorted(compacted)
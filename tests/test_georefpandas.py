@@ -0,0 +1,35 @@
+"""Basic GEOREFPandas accessor tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from vgrid.conversion.latlon2dggs import latlon2georef
+from vgrid.dggs import georef
+
+from vgridpandas.georefpandas import latlon2georef_array
+
+
+@pytest.mark.parametrize("resolution", range(11))
+def test_latlon2georef_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    lats = np.append(rng.uniform(-90, 90, 200), [0.0, -90.0, 90.0, 10.5])
+    lons = np.append(rng.uniform(-180, 360, 200), [0.0, -180.0, 180.0, 359.5])
+    expected = [latlon2georef(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2georef_array(lats, lons, resolution).tolist() == expected
+
+
+def test_latlon2georef_array_missing_coordinates():
+    result = latlon2georef_array([np.nan, 10.77], [0, 106.7], 1)
+    assert result.tolist() == [None, "VGBL4246"]
+
+
+def test_latlon2georef_array_rejects_invalid_latitude():
+    with pytest.raises(georef.GeorefException):
+        latlon2georef_array([91.0], [0.0], 2)
+
+
+def test_georefbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.georef.georefbin(2)
+    counts = dict(zip(result["georef"], result["count"]))
+    assert counts == {"NKQF0000": 2, "PKAG0000": 1}
@@ -0,0 +1,82 @@
+"""Basic H3Pandas accessor tests."""
+
+import h3
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Polygon
+from vgrid.conversion.dggs2geo.h32geo import h32geo
+from vgrid.conversion.latlon2dggs import latlon2h3
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.h3pandas import latlon2h3_array, poly2h3
+
+SAMPLE_POLYGON = Polygon(
+    [(-122.5, 37.7), (-122.3, 37.72), (-122.28, 37.9), (-122.5, 37.85)]
+)
+
+
+@pytest.fixture
+def basic_dataframe():
+    return pd.DataFrame({"lat": [50, 51, 10.775], "lon": [14, 15, 106.706]})
+
+
+def test_latlon2h3_matches_scalar(basic_dataframe):
+    result = basic_dataframe.h3.latlon2h3(8)
+    expected = [
+        latlon2h3(lat, lon, 8)
+        for lat, lon in zip(basic_dataframe["lat"], basic_dataframe["lon"])
+    ]
+    assert result["h3"].tolist() == expected
+    assert result["h3_res"].tolist() == [8, 8, 8]
+
+
+def test_latlon2h3_as_int(basic_dataframe):
+    result = basic_dataframe.h3.latlon2h3(8, as_int=True)
+    assert result["h3"].dtype == np.uint64
+    hex_ids = basic_dataframe.h3.latlon2h3(8)["h3"]
+    assert [format(int(v), "x") for v in result["h3"]] == hex_ids.tolist()
+
+
+def test_latlon2h3_array_missing_coordinates():
+    result = latlon2h3_array([50, np.nan], [14, 15], 8)
+    assert result[1] is None
+    assert latlon2h3_array([50, np.nan], [14, 15], 8, as_int=True)[1] == 0
+
+
+def test_h3bin_counts(basic_dataframe):
+    result = basic_dataframe.h3.h3bin(0)
+    assert dict(zip(result["h3"], result["count"])) == {
+        "801ffffffffffff": 2,
+        "8065fffffffffff": 1,
+    }
+    assert result.geometry.notna().all()
+
+
+@pytest.mark.parametrize(
+    "predicate", ["intersect", "within", "centroid_within", "largest_overlap"]
+)
+def test_poly2h3_matches_cell_predicate(predicate):
+    cells = set(poly2h3(SAMPLE_POLYGON, 7, predicate))
+    candidates = set(h3.grid_disk(h3.latlng_to_cell(37.8, -122.4, 7), 12))
+    expected = {
+        cell
+        for cell in candidates
+        if check_predicate(h32geo(cell), SAMPLE_POLYGON, predicate)
+    }
+    assert cells == expected
+
+
+def test_poly2h3_compact():
+    cells = poly2h3(SAMPLE_POLYGON, 9, "within")
+    compacted = poly2h3(SAMPLE_POLYGON, 9, "within", compact=True)
+    assert len(compacted) < len(cells)
+    assert set(h3.uncompact_cells(compacted, 9)) == set(cells)
+
+
+def test_poly2h3_largest_overlap_keeps_h3_order():
+    interior = h3.h3shape_to_cells_experimental(
+        h3.geo_to_h3shape(SAMPLE_POLYGON), 7, "full"
+    )
+    result = poly2h3(SAMPLE_POLYGON, 7, "largest_overlap")
+    assert result[: len(interior)] == list(interior)
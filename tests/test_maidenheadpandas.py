@@ -0,0 +1,29 @@
+"""Basic MaidenheadPandas accessor tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from vgrid.conversion.latlon2dggs import latlon2maidenhead
+
+from vgridpandas.maidenheadpandas import latlon2maidenhead_array
+
+
+@pytest.mark.parametrize("resolution", range(1, 5))
+def test_latlon2maidenhead_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    lats = np.append(rng.uniform(-90, 90, 200), [0.0, -90.0, 90.0, 45.25])
+    lons = np.append(rng.uniform(-180, 180, 200), [0.0, -180.0, 180.0, 12.5])
+    expected = [latlon2maidenhead(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2maidenhead_array(lats, lons, resolution).tolist() == expected
+
+
+def test_latlon2maidenhead_array_missing_coordinates():
+    result = latlon2maidenhead_array([np.nan, 10.77], [0, 106.7], 2)
+    assert result.tolist() == [None, "OK30"]
+
+
+def test_maidenheadbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.maidenhead.maidenheadbin(3)
+    counts = dict(zip(result["maidenhead"], result["count"]))
+    assert counts == {"JO70aa": 2, "JO71ma": 1}
@@ -0,0 +1,35 @@
+"""Basic MGRSPandas accessor tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from vgrid.conversion.latlon2dggs import latlon2mgrs
+
+from vgridpandas.mgrspandas import latlon2mgrs_array
+
+
+@pytest.mark.parametrize("resolution", range(6))
+def test_latlon2mgrs_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    edges_lat = [89.0, -85.0, 84.0, -80.0, 0.0, -1e-12, 60.0, 72.0, 10.0]
+    edges_lon = [0.0, 10.0, 10.0, 10.0, 180.0, 3.0, 5.0, 9.0, 300.0]
+    lats = np.concatenate(
+        [rng.uniform(-90, 90, 200), rng.uniform(55, 85, 100), edges_lat]
+    )
+    lons = np.concatenate(
+        [rng.uniform(-180, 360, 200), rng.uniform(-5, 45, 100), edges_lon]
+    )
+    expected = [latlon2mgrs(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2mgrs_array(lats, lons, resolution).tolist() == expected
+
+
+def test_latlon2mgrs_array_missing_coordinates():
+    result = latlon2mgrs_array([np.nan, 10.775275567242561], [0, 106.70679737574993], 3)
+    assert result.tolist() == [None, "48PXS866916"]
+
+
+def test_mgrsbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.mgrs.mgrsbin(2)
+    counts = dict(zip(result["mgrs"], result["count"]))
+    assert counts == {"33UVR2839": 2, "33UWS0049": 1}
@@ -0,0 +1,116 @@
+"""OLCPandas polyfill and encoding tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+from shapely.geometry import Point, Polygon, box
+from vgrid.conversion.dggs2geo.olc2geo import olc2geo
+from vgrid.conversion.latlon2dggs import latlon2olc
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.olcpandas import latlon2olc_array, olc_base_grid, poly2olc
+
+SAMPLE_POLYGON = Polygon(
+    [(106.6, 10.7), (106.62, 10.702), (106.625, 10.72), (106.602, 10.716)]
+)
+
+
+def test_base_grid_is_built_once():
+    cell_bounds, tree = olc_base_grid()
+    assert len(cell_bounds) == 162
+    assert olc_base_grid()[1] is tree
+
+
+def test_poly2olc_covers_polygon():
+    result = poly2olc(SAMPLE_POLYGON, 8, predicate="intersect")
+    assert len(result) == len(set(result))
+    lons, lats = np.meshgrid(
+        np.linspace(106.6, 106.625, 12), np.linspace(10.7, 10.72, 12)
+    )
+    for lon, lat in zip(lons.ravel(), lats.ravel()):
+        if SAMPLE_POLYGON.contains(Point(lon, lat)):
+            assert latlon2olc(lat, lon, 8) in result
+
+
+@pytest.mark.parametrize("predicate", ["within", "centroid_within", "largest_overlap"])
+def test_poly2olc_predicates(predicate):
+    covering = poly2olc(SAMPLE_POLYGON, 8, predicate="intersect")
+    expected = [
+        olc_id
+        for olc_id in covering
+        if check_predicate(olc2geo(olc_id), SAMPLE_POLYGON, predicate)
+    ]
+    assert poly2olc(SAMPLE_POLYGON, 8, predicate=predicate) == expected
+
+
+@pytest.mark.parametrize("predicate", ["within", "largest_overlap"])
+def test_poly2olc_predicates_on_seed_cell_edge(predicate):
+    # latitude 50 is the edge between the 8F and 9F base cells
+    poly = box(14, 50, 14.6, 50.5).difference(box(14.2, 50.15, 14.4, 50.35))
+    covering = poly2olc(poly, 6, predicate="intersect")
+    expected = {
+        olc_id
+        for olc_id in covering
+        if check_predicate(olc2geo(olc_id), poly, predicate)
+    }
+    result = poly2olc(poly, 6, predicate=predicate)
+    assert "9F2P2200+" in result
+    assert set(result) == expected
+
+
+def test_poly2olc_matches_brute_force_on_seed_cell_edge():
+    # refined bounds must not drift across the 8F/9F edge at latitude 50
+    poly = box(14, 50, 14.6, 50.5).difference(box(14.2, 50.15, 14.4, 50.35))
+    candidates = {
+        latlon2olc(lat, lon, 6)
+        for lat in np.arange(49.9, 50.6, 0.025)
+        for lon in np.arange(13.9, 14.7, 0.025)
+    }
+    expected = {olc_id for olc_id in candidates if olc2geo(olc_id).intersects(poly)}
+    result = poly2olc(poly, 6, predicate="intersect")
+    assert len(result) == len(set(result))
+    assert set(result) == expected
+    assert "8FXMXX00+" in result
+
+
+def test_poly2olc_leaves_polygon_unprepared():
+    polygon = Polygon(SAMPLE_POLYGON.exterior)
+    poly2olc(polygon, 8, predicate="within")
+    assert not shapely.is_prepared(polygon)
+
+
+def test_poly2olc_outside_base_grid_is_empty():
+    assert poly2olc(box(200, 0, 201, 1), 6) == []
+
+
+def test_poly2olc_base_resolution_spans_base_cells():
+    result = poly2olc(box(-125.0, 5.0, -115.0, 15.0), 2, predicate="intersect")
+    expected = {latlon2olc(lat, lon, 2) for lat in (6, 14) for lon in (-124, -116)}
+    assert sorted(result) == sorted(expected)
+
+
+@pytest.mark.parametrize("resolution", [2, 4, 6, 8, 10, 11, 12, 13, 14, 15])
+def test_latlon2olc_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    grid = rng.integers(-90 * 8000, 90 * 8000, 100) / 8000.0
+    edges_lat = [90.0, -90.0, 0.0, 95.0, 45.0000004999]
+    edges_lon = [180.0, -180.0, 540.0, -540.0, 12.00000049999]
+    lats = np.concatenate([rng.uniform(-95, 95, 200), grid, edges_lat])
+    lons = np.concatenate([rng.uniform(-700, 700, 200), 2 * grid, edges_lon])
+    expected = [latlon2olc(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2olc_array(lats, lons, resolution).tolist() == expected
+
+
+def test_latlon2olc_array_missing_coordinates():
+    result = latlon2olc_array([np.nan, 10.775275567242561], [0, 106.70679737574993], 12)
+    assert result.tolist() == [
+        None,
+        latlon2olc(10.775275567242561, 106.70679737574993, 12),
+    ]
+
+
+def test_olcbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.olc.olcbin(8)
+    assert dict(zip(result["olc"], result["count"])) == {"9F2P2222+": 2, "9F3Q2222+": 1}
@@ -0,0 +1,56 @@
+"""Tests for the shared bulk predicate evaluation."""
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import LineString, Point, Polygon, box
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.utils.predicate_helpers import (
+    cells_matching_predicate,
+    filter_cells,
+    normalize_predicate,
+)
+
+
+@pytest.fixture
+def grid_cells():
+    steps = np.arange(-1.0, 1.0, 0.1)
+    return [box(x, y, x + 0.1, y + 0.1) for x in steps for y in steps] + [Polygon()]
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [None, "intersect", "within", "centroid_within", "largest_overlap", 1, 2, 3, "?"],
+)
+@pytest.mark.parametrize(
+    "geometry",
+    [Point(0.03, -0.02).buffer(0.66), LineString([(-0.95, -0.9), (0.7, 0.85)])],
+)
+def test_cells_matching_predicate_matches_check_predicate(
+    grid_cells, geometry, predicate
+):
+    expected = [check_predicate(cell, geometry, predicate) for cell in grid_cells]
+    result = cells_matching_predicate(grid_cells, geometry, predicate)
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("predicate", ["intersect", "centroid_within", "within"])
+def test_cells_matching_predicate_leaves_geometry_unprepared(grid_cells, predicate):
+    geometry = Point(0.03, -0.02).buffer(0.66)
+    cells_matching_predicate(grid_cells, geometry, predicate)
+    assert not shapely.is_prepared(geometry)
+
+
+def test_normalize_predicate_aliases():
+    assert normalize_predicate("Intersect") == "intersects"
+    assert normalize_predicate("centroid") == "centroid_within"
+    assert normalize_predicate("majority") == "largest_overlap"
+    assert normalize_predicate(None) == "intersects"
+
+
+def test_filter_cells_keeps_ids_in_order():
+    cells = [box(0, 0, 1, 1), box(5, 5, 6, 6), box(0.2, 0.2, 0.4, 0.4)]
+    kept = filter_cells(["a", "b", "c"], cells, box(0, 0, 2, 2), "within")
+    assert kept == ["a", "c"]
+    assert filter_cells([], [], box(0, 0, 1, 1), "within") == []
@@ -0,0 +1,81 @@
+"""QTMPandas polyfill tests."""
+
+import pytest
+from shapely.geometry import MultiPolygon, Polygon, box
+from vgrid.conversion.dggs2geo.qtm2geo import qtm2geo
+from vgrid.dggs.qtm import constructGeometry, divideFacet, qtm_children
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.qtmpandas import (
+    INITIAL_FACETS,
+    poly2qtm,
+    qtm_descendants,
+    qtm_divide_facets,
+    qtm_facet_polygons,
+    qtm_initial_facets,
+)
+
+SAMPLE_POLYGON = Polygon(
+    [(-10.0, 40.0), (20.0, 35.0), (30.0, 60.0), (0.0, 70.0), (-20.0, 60.0)],
+    [[(0.0, 50.0), (5.0, 50.0), (2.0, 55.0)]],
+)
+
+
+def test_divide_facets_matches_divide_facet():
+    _, vertices, kinds = qtm_initial_facets()
+    facets = list(INITIAL_FACETS)
+    for _ in range(4):
+        vertices, kinds = qtm_divide_facets(vertices, kinds)
+        facets = [child for facet in facets for child in divideFacet(facet)]
+    polygons = qtm_facet_polygons(vertices, kinds)
+    assert all(
+        polygon.equals_exact(constructGeometry(facet), 0)
+        for polygon, facet in zip(polygons, facets)
+    )
+
+
+def test_qtm_descendants_match_children():
+    result = qtm_descendants(["12", "83"], 4)
+    expected = qtm_children("12", 4) + qtm_children("83", 4)
+    assert sorted(result.tolist()) == sorted(expected)
+
+
+@pytest.fixture(scope="module")
+def bbox_cells():
+    """Every resolution 7 cell of the eight base facets meeting the sample bbox."""
+    bbox = box(*SAMPLE_POLYGON.bounds)
+    cells = {}
+    for base_id in range(1, len(INITIAL_FACETS) + 1):
+        for qtm_id in qtm_children(str(base_id), 7):
+            polygon = qtm2geo(qtm_id)
+            if polygon.intersects(bbox):
+                cells[qtm_id] = polygon
+    return cells
+
+
+@pytest.mark.parametrize(
+    "predicate", ["intersect", "within", "centroid_within", "largest_overlap"]
+)
+def test_poly2qtm_matches_brute_force(bbox_cells, predicate):
+    expected = [
+        qtm_id
+        for qtm_id, polygon in bbox_cells.items()
+        if check_predicate(polygon, SAMPLE_POLYGON, predicate)
+    ]
+    result = poly2qtm(SAMPLE_POLYGON, 7, predicate)
+    assert sorted(result) == sorted(expected)
+    assert len(result) == len(set(result))
+
+
+def test_poly2qtm_multipolygon_keeps_each_part():
+    parts = [box(0.0, 0.0, 1.0, 1.0), box(50.0, -30.0, 55.0, -25.0)]
+    result = poly2qtm(MultiPolygon(parts), 9, "within")
+    expected = set(poly2qtm(parts[0], 9, "within")) | set(
+        poly2qtm(parts[1], 9, "within")
+    )
+    assert sorted(result) == sorted(expected)
+
+
+def test_poly2qtm_first_level_spans_octants():
+    result = poly2qtm(box(-100.0, -10.0, -80.0, 10.0), 1, "intersect")
+    assert sorted(result) == ["1", "2", "5", "6"]
@@ -0,0 +1,93 @@
+"""rHEALPixPandas polyfill and point indexing tests."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Point, Polygon
+from vgrid.conversion.dggs2geo.rhealpix2geo import rhealpix2geo
+from vgrid.conversion.latlon2dggs import latlon2rhealpix
+from vgrid.dggs.rhealpixdggs.dggs import RHEALPixDGGS
+from vgrid.dggs.rhealpixdggs.ellipsoids import Ellipsoid
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.rhealpixpandas import (
+    latlon2rhealpix_array,
+    poly2rhealpix,
+    rhealpix_cell_to_geo,
+    rhealpix_dggs,
+    rhealpix_project,
+)
+
+SAMPLE_POLYGON = Polygon(
+    [(106.6, 10.7), (106.8, 10.72), (106.85, 10.9), (106.62, 10.86)]
+)
+
+
+@pytest.mark.parametrize("fix_antimeridian", [None, "shift", "split"])
+def test_cell_to_geo_matches_rhealpix2geo(fix_antimeridian):
+    cell = rhealpix_dggs.cell_from_point(4, (179.9, -10.0), plane=False)
+    for neighbor in [cell, *cell.neighbors(plane=False).values()]:
+        expected = rhealpix2geo(str(neighbor), fix_antimeridian=fix_antimeridian)
+        result = rhealpix_cell_to_geo(neighbor, fix_antimeridian)
+        assert result.equals_exact(expected, 0)
+
+
+def test_poly2rhealpix_covers_polygon():
+    result = poly2rhealpix(SAMPLE_POLYGON, 8, predicate="intersect")
+    assert len(result) == len(set(result))
+    lons, lats = np.meshgrid(
+        np.linspace(106.6, 106.85, 15), np.linspace(10.7, 10.9, 15)
+    )
+    for lon, lat in zip(lons.ravel(), lats.ravel()):
+        if SAMPLE_POLYGON.contains(Point(lon, lat)):
+            cell = rhealpix_dggs.cell_from_point(8, (lon, lat), plane=False)
+            assert str(cell) in result
+
+
+@pytest.mark.parametrize("predicate", ["within", "centroid_within", "largest_overlap"])
+def test_poly2rhealpix_predicates(predicate):
+    covering = poly2rhealpix(SAMPLE_POLYGON, 8, predicate="intersect")
+    expected = [
+        cell_id
+        for cell_id in covering
+        if check_predicate(rhealpix2geo(cell_id), SAMPLE_POLYGON, predicate)
+    ]
+    result = poly2rhealpix(SAMPLE_POLYGON, 8, predicate=predicate)
+    assert sorted(result) == sorted(expected)
+
+
+@pytest.mark.parametrize("resolution", [0, 1, 4, 9, 15])
+def test_latlon2rhealpix_array_matches_scalar(resolution):
+    rng = np.random.default_rng(resolution)
+    grid = rng.integers(-90 * 27, 90 * 27, 100) / 27.0
+    edges_lat = [90.0, -90.0, 0.0, 41.93785391016014, -60.0]
+    edges_lon = [0.0, 180.0, -180.0, 45.0, 400.0]
+    lats = np.concatenate([rng.uniform(-90, 90, 300), grid, edges_lat])
+    lons = np.concatenate([rng.uniform(-180, 180, 300), 2 * grid, edges_lon])
+    expected = [latlon2rhealpix(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+    assert latlon2rhealpix_array(lats, lons, resolution).tolist() == expected
+
+
+# f = 1/50 is past the 1/150 limit of the authalic latitude power series
+@pytest.mark.parametrize("ellipsoid", [Ellipsoid(f=1 / 298.2572), Ellipsoid(f=1 / 50)])
+def test_rhealpix_project_matches_scalar_on_other_ellipsoids(ellipsoid):
+    dggs = RHEALPixDGGS(ellipsoid=ellipsoid, north_square=1, south_square=3, N_side=3)
+    rng = np.random.default_rng(0)
+    lats, lons = rng.uniform(-90, 90, 300), rng.uniform(-180, 180, 300)
+    x, y = rhealpix_project(lats, lons, dggs)
+    expected = [dggs.rhealpix(lon, lat) for lat, lon in zip(lats, lons)]
+    assert list(zip(x.tolist(), y.tolist())) == expected
+
+
+def test_latlon2rhealpix_array_missing_coordinates():
+    result = latlon2rhealpix_array(
+        [np.nan, 10.775275567242561], [0, 106.70679737574993], 8
+    )
+    assert result.tolist() == [None, "R31260362"]
+
+
+def test_rhealpixbin_counts():
+    df = pd.DataFrame({"lat": [50, 50.0001, 51], "lon": [14, 14.0001, 15]})
+    result = df.rhealpix.rhealpixbin(6)
+    counts = dict(zip(result["rhealpix"], result["count"]))
+    assert counts == {"N850277": 2, "N826756": 1}
@@ -1,7 +1,16 @@
 """Basic S2Pandas accessor tests."""
 
+import numpy as np
 import pandas as pd
 import pytest
+import shapely
+from shapely.geometry import LineString
+from vgrid.conversion.dggs2geo.s22geo import s22geo
+from vgrid.conversion.latlon2dggs import latlon2s2
+from vgrid.dggs import s2
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.s2pandas import latlon2s2_array, poly2s2, s2_id_tokens
 
 
 @pytest.fixture
@@ -22,3 +31,74 @@ def test_latlon2s2_set_index(basic_dataframe):
     result = basic_dataframe.s2.latlon2s2(9, set_index=True)
     assert result.index.name == "s2"
     assert len(result) == 2
+
+
+@pytest.mark.parametrize(
+    "predicate", ["intersect", "within", "centroid_within", "largest_overlap"]
+)
+def test_poly2s2_matches_bbox_covering(predicate):
+    poly = LineString([(100, 5), (100.3, 5.3)]).buffer(0.01)
+    coverer = s2.RegionCoverer()
+    coverer.min_level = coverer.max_level = 12
+    min_lon, min_lat, max_lon, max_lat = poly.bounds
+    rect = s2.LatLngRect(
+        s2.LatLng.from_degrees(min_lat, min_lon),
+        s2.LatLng.from_degrees(max_lat, max_lon),
+    )
+    tokens = [s2.CellId.to_token(cell_id) for cell_id in coverer.get_covering(rect)]
+    expected = {t for t in tokens if check_predicate(s22geo(t), poly, predicate)}
+    assert set(poly2s2(poly, 12, predicate)) == expected
+
+
+def test_poly2s2_leaves_polygon_unprepared():
+    poly = LineString([(100, 5), (100.3, 5.3)]).buffer(0.01)
+    poly2s2(poly, 12, "intersect")
+    assert not shapely.is_prepared(poly)
+
+
+def test_poly2s2_compact_expands_to_uncompacted():
+    poly = LineString([(100, 5), (100.3, 5.3)]).buffer(0.05)
+    cells = poly2s2(poly, 13, "within")
+    compacted = poly2s2(poly, 13, "within", compact=True)
+    assert len(compacted) < len(cells)
+    expanded = set()
+    for token in compacted:
+        cell_id = s2.CellId.from_token(token)
+        child, end = cell_id.child_begin(13), cell_id.child_end(13)
+        while child != end:
+            expanded.add(child.to_token())
+            child = child.next()
+    assert expanded == set(cells)
+
+
+@pytest.mark.parametrize("level", [0, 1, 12, 29, 30])
+def test_s2_id_tokens_match_cell_id(level):
+    cell_ids = [
+        s2.CellId.from_lat_lng(s2.LatLng.from_degrees(lat, lon)).parent(level)
+        for lat, lon in [(50, 14), (-33.9, 151.2), (89.9, -179.9)]
+    ]
+    tokens = s2_id_tokens([cell_id.id() for cell_id in cell_ids], level)
+    assert tokens == [cell_id.to_token() for cell_id in cell_ids]
+
+
+@pytest.mark.parametrize("level", [0, 7, 16, 30])
+def test_latlon2s2_array_matches_latlon2s2(level):
+    rng = np.random.default_rng(level)
+    lats = np.concatenate([rng.uniform(-90, 90, 500), [90, -90, 0, 0, 45]])
+    lons = np.concatenate([rng.uniform(-180, 180, 500), [0, 0, 180, -180, 45]])
+    expected = [latlon2s2(lat, lon, level) for lat, lon in zip(lats, lons)]
+    assert latlon2s2_array(lats, lons, level).tolist() == expected
+    cell_ids = latlon2s2_array(lats, lons, level, as_int=True)
+    assert [s2.CellId(int(i)).to_token() for i in cell_ids] == expected
+
+
+def test_latlon2s2_array_missing_coordinates():
+    lats, lons = [np.nan, 10.0], [1.0, 20.0]
+    assert latlon2s2_array(lats, lons, 10).tolist() == [None, latlon2s2(10, 20, 10)]
+    assert latlon2s2_array(lats, lons, 10, as_int=True)[0] == 0
+
+
+def test_s22geo_accepts_int_ids(basic_dataframe):
+    tokens = basic_dataframe.s2.latlon2s2(9).s2.s22geo()
+    cell_ids = basic_dataframe.s2.latlon2s2(9, as_int=True).s2.s22geo()
+    assert cell_ids.geometry.geom_equals_exact(tokens.geometry, 0).all()
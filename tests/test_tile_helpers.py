@@ -0,0 +1,105 @@
+"""Tests for the shared Web-Mercator tile kernel."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Polygon, box
+from vgrid.conversion.latlon2dggs import latlon2quadkey, latlon2tilecode
+from vgrid.dggs import mercantile
+from vgrid.dggs.mercantile import InvalidLatitudeError
+from vgrid.utils.geometry import check_predicate
+
+from vgridpandas.quadkeypandas import poly2quadkey
+from vgridpandas.tilecodepandas import poly2tilecode
+from vgridpandas.utils.tile_helpers import (
+    bbox2tile_range,
+    latlon2tile_xy,
+    quadkey2tile_xyz,
+    tile_polyfill_xy,
+)
+
+
+@pytest.fixture
+def random_dataframe():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {"lat": rng.uniform(-85, 85, 500), "lon": rng.uniform(-180, 180, 500)}
+    )
+
+
+@pytest.mark.parametrize("resolution", [0, 1, 7, 18, 29])
+def test_latlon2quadkey_matches_scalar(random_dataframe, resolution):
+    result = random_dataframe.quadkey.latlon2quadkey(resolution)
+    expected = [
+        latlon2quadkey(lat, lon, resolution)
+        for lat, lon in zip(random_dataframe["lat"], random_dataframe["lon"])
+    ]
+    assert result["quadkey"].tolist() == expected
+
+
+@pytest.mark.parametrize("resolution", [0, 1, 7, 18, 29])
+def test_latlon2tilecode_matches_scalar(random_dataframe, resolution):
+    result = random_dataframe.tilecode.latlon2tilecode(resolution)
+    expected = [
+        latlon2tilecode(lat, lon, resolution)
+        for lat, lon in zip(random_dataframe["lat"], random_dataframe["lon"])
+    ]
+    assert result["tilecode"].tolist() == expected
+
+
+def test_latlon2tilecode_as_zxy(random_dataframe):
+    result = random_dataframe.tilecode.latlon2tilecode(12, as_zxy=True)
+    assert "tilecode" not in result.columns
+    tilecodes = [
+        f"z{z}x{x}y{y}"
+        for z, x, y in zip(
+            result["tilecode_res"], result["tilecode_x"], result["tilecode_y"]
+        )
+    ]
+    assert (
+        tilecodes == random_dataframe.tilecode.latlon2tilecode(12)["tilecode"].tolist()
+    )
+
+
+def test_latlon2tile_xy_edges():
+    x, y = latlon2tile_xy([0.0, np.nan], [180.0, 0.0], 3)
+    assert x.tolist() == [7, -1]
+    assert y.tolist() == [4, -1]
+    with pytest.raises(InvalidLatitudeError):
+        latlon2tile_xy([90.0], [0.0], 3)
+
+
+SAMPLE_POLYGON = Polygon(
+    [(106.6, 10.7), (106.8, 10.72), (106.85, 10.9), (106.62, 10.86)],
+    [[(106.7, 10.78), (106.75, 10.78), (106.72, 10.82)]],
+)
+
+
+@pytest.mark.parametrize(
+    "predicate", ["intersect", "within", "centroid_within", "largest_overlap"]
+)
+def test_tile_polyfill_xy_matches_bbox_tiles(predicate):
+    tiles = list(mercantile.tiles(*SAMPLE_POLYGON.bounds, 13))
+    expected = [
+        (tile.x, tile.y)
+        for tile in tiles
+        if check_predicate(box(*mercantile.bounds(tile)), SAMPLE_POLYGON, predicate)
+    ]
+    x, y = tile_polyfill_xy(SAMPLE_POLYGON, 13, predicate)
+    assert list(zip(x.tolist(), y.tolist())) == expected
+
+
+def test_tile_polyfill_xy_accepts_interior_blocks():
+    west, _, _, north = mercantile.bounds(128, 96, 8)
+    _, south, east, _ = mercantile.bounds(159, 127, 8)
+    x, y = tile_polyfill_xy(box(west, south, east, north), 8, "within")
+    expected = [(i, j) for i in range(128, 160) for j in range(96, 128)]
+    assert list(zip(x.tolist(), y.tolist())) == expected
+    assert bbox2tile_range(west, south, east, north, 8) == (128, 159, 96, 127)
+
+
+def test_poly2quadkey_and_tilecode_share_tiles():
+    quadkeys = poly2quadkey(SAMPLE_POLYGON, 14, "intersect")
+    tilecodes = poly2tilecode(SAMPLE_POLYGON, 14, "intersect")
+    x, y, zoom = quadkey2tile_xyz(quadkeys)
+    assert [f"z{z}x{i}y{j}" for i, j, z in zip(x, y, zoom)] == tilecodes
@@ -16,12 +16,12 @@ import geopandas as gpd
 import a5
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import cell_geometry, dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgrid.conversion.latlon2dggs import latlon2a5 as latlon_to_a5
 from vgrid.conversion.dggs2geo.a52geo import a52geo as a5_to_geo, a52geo_u64
-from vgrid.conversion.dggscompact.a5compact import a5compact
 from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import filter_cells
 from vgrid.utils.io import validate_a5_resolution
 from vgridpandas.utils.const import A5_COL
 
@@ -32,6 +32,21 @@ MultiLineOrLine = Union[LineString, MultiLineString]
 MultiPointOrPoint = Union[Point, MultiPoint]
 
 
+def a5_compact_u64(cell_ids) -> list:
+    """Compact u64 A5 cell ids by replacing complete sibling sets with parents.
+
+    Works on the ids alone with ``a5.compact`` (sibling stride and
+    ``cell_to_parent`` arithmetic), so no cell geometry is built. Like
+    ``a5compact`` in vgrid, resolution 0 cells are never merged into the
+    world cell.
+    """
+    compacted = a5.compact(list(cell_ids))
+    if a5.WORLD_CELL in compacted:
+        compacted.remove(a5.WORLD_CELL)
+        compacted = sorted(compacted + a5.get_res0_cells())
+    return compacted
+
+
 def poly2a5(
     geometry, resolution, predicate=None, compact=False, split_antimeridian: bool = False
 ):
@@ -55,7 +70,7 @@ def poly2a5(
     """
 
     resolution = validate_a5_resolution(resolution)
-    a5_hexes = []
+    a5_cells = []
     if isinstance(geometry, Polygon):
         polys = [geometry]
     elif isinstance(geometry, MultiPolygon):
@@ -73,14 +88,13 @@ def poly2a5(
         bbox_center_lon = bbox_polygon.centroid.x
         bbox_center_lat = bbox_polygon.centroid.y
         seed_cell_id = a5.lonlat_to_cell((bbox_center_lon, bbox_center_lat), resolution)
-        seed_cell_polygon = a52geo_u64(
-            seed_cell_id, split_antimeridian=split_antimeridian
+        seed_cell_polygon = cell_geometry(
+            "a5", seed_cell_id, a52geo_u64, split_antimeridian=split_antimeridian
         )
 
         if seed_cell_polygon is not None and seed_cell_polygon.contains(bbox_polygon):
-            seed_cell_hex = a5.u64_to_hex(seed_cell_id)
             if check_predicate(seed_cell_polygon, poly, predicate):
-                a5_hexes.append(seed_cell_hex)
+                a5_cells.append(seed_cell_id)
             continue
 
         intersecting_cells = {}  # {cell_u64: cell_polygon}
@@ -93,8 +107,11 @@ def poly2a5(
                 continue
             covered_cells.add(current_cell_id)
 
-            cell_polygon = a52geo_u64(
-                current_cell_id, split_antimeridian=split_antimeridian
+            cell_polygon = cell_geometry(
+                "a5",
+                current_cell_id,
+                a52geo_u64,
+                split_antimeridian=split_antimeridian,
             )
             if cell_polygon is None or cell_polygon.is_empty:
                 continue
@@ -108,36 +125,19 @@ def poly2a5(
                     if neighbor_id not in covered_cells:
                         queue.append(neighbor_id)
 
-        for cell_id, cell_polygon in intersecting_cells.items():
-            if check_predicate(cell_polygon, poly, predicate):
-                a5_hexes.append(a5.u64_to_hex(cell_id))
-
-    a5_hexes = list(dict.fromkeys(a5_hexes))
-
-    if compact and a5_hexes:
-        # Create a GeoDataFrame with A5 hex codes and their geometries
-        a5_data = []
-        for a5_hex in a5_hexes:
-            try:
-                # Convert A5 hex to geometry
-                geometry = a5_to_geo(a5_hex, split_antimeridian=split_antimeridian)
-                a5_data.append({"a5": a5_hex, "geometry": geometry})
-            except Exception:
-                # Skip invalid A5 hex codes
-                continue
-
-        if a5_data:
-            temp_gdf = gpd.GeoDataFrame(a5_data, crs="EPSG:4326")
-
-            # Use a5compact function directly
-            compacted_gdf = a5compact(temp_gdf, a5_hex="a5", output_format="gpd")
+        kept_cells = filter_cells(
+            list(intersecting_cells),
+            list(intersecting_cells.values()),
+            poly,
+            predicate,
+        )
+        a5_cells.extend(kept_cells)
 
-            if compacted_gdf is not None:
-                # Extract A5 hex codes from compacted result
-                a5_hexes = compacted_gdf["a5"].tolist()
-            # If compaction failed, keep original results
+    a5_cells = list(dict.fromkeys(a5_cells))
+    if compact and a5_cells:
+        a5_cells = a5_compact_u64(a5_cells)
 
-    return a5_hexes
+    return [a5.u64_to_hex(cell_id) for cell_id in a5_cells]
 
 
 def linetrace(geometry: MultiLineOrLine, resolution: int) -> Iterator[str]:
@@ -255,6 +255,7 @@ class A5Pandas:
             ids,
             a5_to_geo,
             to_geo_kwargs={"split_antimeridian": split_antimeridian},
+            dggs="a5",
         )
 
     def polyfill(
@@ -1,6 +1,8 @@
 """S2Pandas module for S2 cell operations on pandas DataFrames and GeoDataFrames."""
 
+from functools import lru_cache, partial
 from typing import Union
+import numpy as np
 from shapely.geometry import (
     Polygon,
     MultiPolygon,
@@ -11,10 +13,12 @@ import pandas as pd
 import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    dggs_ids_to_geodataframe,
+    dggs_ids_to_polygons,
+    polygons_from_boundaries,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
-from vgrid.conversion.latlon2dggs import latlon2dggal as latlon_to_dggal
-from vgrid.conversion.dggs2geo.dggal2geo import dggal2geo as dggal_to_geo
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
@@ -25,9 +29,10 @@ from shapely.geometry import (
     MultiPoint,
 )
 from dggal import *
-from vgrid.utils.geometry import check_predicate
-from vgrid.conversion.dggs2geo.dggal2geo import dggal2geo
-from vgrid.utils.io import validate_dggal_resolution
+from dggal import ffi as dggal_ffi
+from ecrt import ffi
+from vgridpandas.utils.predicate_helpers import filter_cells
+from vgrid.utils.io import validate_dggal_resolution, validate_dggal_type
 from vgrid.conversion.dggscompact.dggalcompact import dggal_compact
 from vgrid.utils.constants import DGGAL_TYPES
 
@@ -36,6 +41,92 @@ MultiLineOrLine = Union[LineString, MultiLineString]
 MultiPointOrPoint = Union[Point, MultiPoint]
 
 
+def dggal_geopoint_dtype() -> np.dtype:
+    """Return the NumPy dtype of the binding's ``GeoPoint`` struct.
+
+    Field offsets and the item size are read from the cffi struct layout, so
+    vertex arrays can be viewed in place. ``TypeError`` is raised if ``lat``
+    and ``lon`` are not both doubles.
+    """
+    fields = dict(dggal_ffi.typeof("eC_GeoPoint").fields)
+    if any(
+        name not in fields or fields[name].type.cname != "double"
+        for name in ("lat", "lon")
+    ):
+        raise TypeError("Unsupported DGGAL GeoPoint layout")
+    return np.dtype(
+        {
+            "names": ["lat", "lon"],
+            "formats": [np.float64, np.float64],
+            "offsets": [fields["lat"].offset, fields["lon"].offset],
+            "itemsize": dggal_ffi.sizeof("eC_GeoPoint"),
+        }
+    )
+
+
+DGGAL_GEOPOINT_DTYPE = dggal_geopoint_dtype()
+
+
+def get_dggrs(dggs_type):
+    """Return the DGGRS instance of ``dggs_type``, created once and then reused."""
+    return dggrs_instance(validate_dggal_type(dggs_type))
+
+
+@lru_cache(maxsize=None)
+def dggrs_instance(dggs_type):
+    """Create the DGGRS of a validated ``dggs_type``; cached by ``get_dggrs``."""
+    return globals()[DGGAL_TYPES[dggs_type]["class_name"]]()
+
+
+def dggal_zone_boundaries(dggrs, zones):
+    """Return ``(coords, offsets)`` rings of DGGAL zones of a live ``dggrs``.
+
+    The refined WGS84 vertices used by ``dggal2geo`` are copied straight from
+    each vertex array, viewed as ``DGGAL_GEOPOINT_DTYPE`` radians and converted
+    to degrees at once. ``ValueError`` is raised for null zones and zones
+    without vertices.
+    """
+    itemsize = DGGAL_GEOPOINT_DTYPE.itemsize
+    chunks, counts = [], []
+    for zone in zones:
+        if zone == nullZone:
+            raise ValueError("Invalid DGGAL zone")
+        vertices = dggrs.getZoneRefinedWGS84Vertices(zone, 0)
+        if not vertices or not vertices.count:
+            raise ValueError("DGGAL zone has no vertices")
+        chunks.append(bytes(ffi.buffer(vertices.array, itemsize * vertices.count)))
+        counts.append(vertices.count)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    points = np.frombuffer(b"".join(chunks), dtype=DGGAL_GEOPOINT_DTYPE)
+    return np.degrees(np.column_stack([points["lon"], points["lat"]])), offsets
+
+
+def dggal_zone_polygon(dggrs, zone) -> Polygon:
+    """Return the polygon of one DGGAL zone, or an empty one if it is invalid."""
+    try:
+        return polygons_from_boundaries(*dggal_zone_boundaries(dggrs, [zone]))[0]
+    except ValueError:
+        return Polygon()
+
+
+def dggal_listed_polygon(dggrs, zones_by_id, zone_id) -> Polygon:
+    """Return the polygon of a zone id found by ``listZones``."""
+    return dggal_zone_polygon(dggrs, zones_by_id[zone_id])
+
+
+def dggal_listed_boundaries(dggrs, zones_by_id, zone_ids):
+    """Return ``(coords, offsets)`` rings of zone ids found by ``listZones``."""
+    return dggal_zone_boundaries(dggrs, [zones_by_id[i] for i in zone_ids])
+
+
+def dggal_boundaries(dggs_type, zone_ids):
+    """Return ``(coords, offsets)`` cell rings for an array of DGGAL zone ids."""
+    dggrs = get_dggrs(dggs_type)
+    zones = [dggrs.getZoneFromTextID(zone_id) for zone_id in zone_ids]
+    return dggal_zone_boundaries(dggrs, zones)
+
+
 def poly2dggal(dggs_type, geometry, resolution, predicate=None, compact=False):
     """
     Convert polygon geometries (Polygon, MultiPolygon) to DGGAL grid cells.
@@ -58,9 +149,7 @@ def poly2dggal(dggs_type, geometry, resolution, predicate=None, compact=False):
         True
     """
 
-    dggs_class_name = DGGAL_TYPES[dggs_type]["class_name"]
-    dggrs = globals()[dggs_class_name]()
-
+    dggrs = get_dggrs(dggs_type)
     resolution = validate_dggal_resolution(dggs_type, resolution)
     dggal_ids = []
     if isinstance(geometry, (Polygon, LineString)):
@@ -76,12 +165,15 @@ def poly2dggal(dggs_type, geometry, resolution, predicate=None, compact=False):
         ur = GeoPoint(max_lat, max_lon)
         geo_extent = GeoExtent(ll, ur)
         zones = dggrs.listZones(resolution, geo_extent)
-        for zone in zones:
-            zone_id = dggrs.getZoneTextID(zone)
-            cell_polygon = dggal2geo(dggs_type, zone_id)
-            if not check_predicate(cell_polygon, poly, predicate):
-                continue
-            dggal_ids.append(zone_id)
+        zones_by_id = {dggrs.getZoneTextID(zone): zone for zone in zones}
+        zone_ids = list(zones_by_id)
+        cell_polygons = dggs_ids_to_polygons(
+            np.array(zone_ids, dtype=object),
+            partial(dggal_listed_polygon, dggrs, zones_by_id),
+            partial(dggal_listed_boundaries, dggrs, zones_by_id),
+            dggs=f"dggal_{dggs_type}",
+        )
+        dggal_ids.extend(filter_cells(zone_ids, cell_polygons, poly, predicate))
     if compact:
         dggal_ids = dggal_compact(dggs_type, dggal_ids)
     return dggal_ids
@@ -150,8 +242,14 @@ class DGGALPandas:
             lons = self._df[lon_col]
             lats = self._df[lat_col]
 
+        dggrs = get_dggrs(dggs_type)
+        if resolution is None:
+            resolution = DGGAL_TYPES[validate_dggal_type(dggs_type)]["default_res"]
+        resolution = validate_dggal_resolution(dggs_type, resolution)
         dggal_ids = [
-            latlon_to_dggal(dggs_type, lat, lon, resolution)
+            dggrs.getZoneTextID(
+                dggrs.getZoneFromWGS84Centroid(resolution, GeoPoint(lat, lon))
+            )
             for lat, lon in zip(lats, lons)
         ]
 
@@ -169,10 +267,18 @@ class DGGALPandas:
         if dggal_col not in self._df.columns:
             raise ValueError(f"Column '{dggal_col}' not found in DataFrame")
 
-        def to_geo(token):
-            return dggal_to_geo(dggs_type, token)
+        dggrs = get_dggrs(dggs_type)
+
+        def to_geo(zone_id):
+            return dggal_zone_polygon(dggrs, dggrs.getZoneFromTextID(zone_id))
 
-        return dggs_ids_to_geodataframe(self._df, self._df[dggal_col], to_geo)
+        return dggs_ids_to_geodataframe(
+            self._df,
+            self._df[dggal_col],
+            to_geo,
+            to_boundaries=lambda zone_ids: dggal_boundaries(dggs_type, zone_ids),
+            dggs=f"dggal_{dggs_type}",
+        )
 
     def polyfill(
         self,
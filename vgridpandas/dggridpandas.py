@@ -2,18 +2,126 @@
 
 from typing import Union
 from shapely.geometry import Polygon
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
-from vgrid.conversion.latlon2dggs import latlon2dggrid as latlon_to_dggrid
-from vgrid.conversion.dggs2geo.dggrid2geo import dggrid2geo as dggrid_to_geo
+from vgridpandas.utils.latlon_helpers import (
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
+from vgrid.utils.io import validate_dggrid_type, validate_dggrid_resolution
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
+def latlon2dggrid_array(
+    dggrid_instance,
+    dggs_type: str,
+    lats,
+    lons,
+    resolution: int,
+    address_type: str = "SEQNUM",
+):
+    """Convert arrays of latitudes and longitudes to DGGRID ids in one DGGRID run.
+
+    All coordinates are written to a single DGGRID input file and indexed by one
+    TRANSFORM_POINTS job, instead of launching DGGRID once per point.
+    Rows with non-finite coordinates get ``None``.
+
+    Args:
+        dggrid_instance (DGGRIDv7): DGGRID instance
+        dggs_type (str): DGGRID type
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): DGGRID resolution
+        address_type (str): Output address type, default 'SEQNUM'
+
+    Returns:
+        numpy.ndarray: Object array of DGGRID ids
+    """
+    dggs_type = validate_dggrid_type(dggs_type)
+    resolution = validate_dggrid_resolution(dggs_type, resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    if not valid.any():
+        return scatter_ids([], valid)
+
+    points = gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy(lons[valid], lats[valid]), crs="EPSG:4326"
+    )
+    dggrid_cells = dggrid_instance.cells_for_geo_points(
+        geodf_points_wgs84=points,
+        cell_ids_only=True,
+        dggs_type=dggs_type,
+        resolution=resolution,
+        output_address_type=address_type,
+    )
+    return scatter_ids(dggrid_cells["name"].to_numpy(), valid)
+
+
+def dggrid2geo_lookup(
+    dggrid_instance,
+    dggs_type: str,
+    dggrid_ids,
+    resolution: int,
+    address_type: str = "SEQNUM",
+) -> dict:
+    """Build ``{dggrid_id: cell polygon}`` for the unique ids in one DGGRID run.
+
+    The ids are deduplicated, converted to SEQNUM with a single address
+    transform when needed, and all cell boundaries are generated by one
+    DGGRID job clipped to that SEQNUM list.
+
+    Args:
+        dggrid_instance (DGGRIDv7): DGGRID instance
+        dggs_type (str): DGGRID type
+        dggrid_ids (iterable): DGGRID ids, duplicates and missing values allowed
+        resolution (int): DGGRID resolution
+        address_type (str): Address type of ``dggrid_ids``, default 'SEQNUM'
+
+    Returns:
+        dict: Cell polygon per unique DGGRID id; ids DGGRID does not return
+        are left out
+    """
+    dggs_type = validate_dggrid_type(dggs_type)
+    resolution = validate_dggrid_resolution(dggs_type, resolution)
+    unique_ids = pd.unique(pd.Series(dggrid_ids, dtype=object).dropna())
+    if len(unique_ids) == 0:
+        return {}
+
+    if address_type == "SEQNUM":
+        seqnums = unique_ids.astype(np.int64)
+    else:
+        address_type_transform = dggrid_instance.address_transform(
+            unique_ids,
+            dggs_type=dggs_type,
+            resolution=resolution,
+            mixed_aperture_level=None,
+            input_address_type=address_type,
+            output_address_type="SEQNUM",
+        )
+        seqnums = address_type_transform["SEQNUM"].to_numpy().astype(np.int64)
+
+    dggrid_cells = dggrid_instance.grid_cell_polygons_from_cellids(
+        seqnums, dggs_type, resolution, split_dateline=False
+    )
+    name_col = "name" if "name" in dggrid_cells.columns else "global_id"
+    cell_by_seqnum = dict(
+        zip(dggrid_cells[name_col].astype(np.int64), dggrid_cells.geometry)
+    )
+    return {
+        dggrid_id: cell_by_seqnum[seqnum]
+        for dggrid_id, seqnum in zip(unique_ids, seqnums.tolist())
+        if seqnum in cell_by_seqnum
+    }
+
+
 @pd.api.extensions.register_dataframe_accessor("dggrid")
 class DGGRIDPandas:
     def __init__(self, df: DataFrame):
@@ -58,19 +166,10 @@ class DGGRIDPandas:
 
         """
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        dggrid_ids = [
-            latlon_to_dggrid(
-                dggrid_instance, dggs_type, lat, lon, resolution, address_type
-            )
-            for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        dggrid_ids = latlon2dggrid_array(
+            dggrid_instance, dggs_type, lats, lons, resolution, address_type
+        )
 
         dggrid_col = f"dggrid_{dggs_type.lower()}"
         assign_arg = {dggrid_col: dggrid_ids, f"{dggrid_col}_res": resolution}
@@ -89,6 +188,9 @@ class DGGRIDPandas:
     ) -> GeoDataFrame:
         """Add geometry with DGGRID geometry to the DataFrame. Assumes DGGRID id.
 
+        Repeated ids are converted once: all distinct cell boundaries are
+        generated by a single DGGRID run and mapped back onto the rows.
+
         Parameters
         ----------
         dggrid_instance : DGGRIDv7
@@ -116,13 +218,15 @@ class DGGRIDPandas:
         if dggrid_col not in self._df.columns:
             raise ValueError(f"Column '{dggrid_col}' not found in DataFrame")
 
+        ids = self._df[dggrid_col]
+        cell_polygons = dggrid2geo_lookup(
+            dggrid_instance, dggs_type, ids.explode(), resolution, address_type
+        )
+
         def to_geo(token):
-            gdf = dggrid_to_geo(
-                dggrid_instance, dggs_type, token, resolution, address_type
-            )
-            return gdf.geometry.iloc[0] if gdf is not None and len(gdf) else Polygon()
+            return cell_polygons.get(token, Polygon())
 
-        return dggs_ids_to_geodataframe(self._df, self._df[dggrid_col], to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, to_geo)
 
     def dggridbin(
         self,
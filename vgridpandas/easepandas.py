@@ -1,28 +1,205 @@
 from typing import Union
+import numpy as np
+import shapely
+from pyproj import Transformer
 from shapely.geometry import (
     Polygon,
     MultiPolygon,
     LineString,
     MultiLineString,
-    box,
 )
 import pandas as pd
 import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    box_boundaries,
+    dggs_ids_to_geodataframe,
+    polygons_from_boundaries,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import EASE_COL
 from vgrid.conversion.latlon2dggs import latlon2ease as latlon_to_ease
 from vgrid.conversion.dggs2geo.ease2geo import ease2geo as ease_to_geo
 from vgrid.conversion.dggscompact.easecompact import ease_compact
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import (
+    cells_matching_predicate,
+    classify_cells,
+)
 from vgrid.utils.io import validate_ease_resolution
-from ease_dggs.constants import levels_specs, geo_crs, ease_crs
-from ease_dggs.dggs.grid_addressing import geo_polygon_to_grid_ids
+from ease_dggs.constants import (
+    cell_scale_factors,
+    ease_crs,
+    geo_crs,
+    grid_spec,
+    levels_specs,
+)
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
+EASE_EXTENT = grid_spec["ease"]
+GEO_TO_EASE = Transformer.from_crs(geo_crs, ease_crs, always_xy=True)
+EASE_TO_GEO = Transformer.from_crs(ease_crs, geo_crs, always_xy=True)
+
+
+def ease_digits(index, resolution: int) -> list:
+    """Split row or column indices at ``resolution`` into per-level id digits.
+
+    The first array holds the level 0 index, the others the position inside
+    the parent cell at each finer level.
+    """
+    index = np.asarray(index, dtype=np.int64)
+    digits = []
+    for level in range(resolution, 0, -1):
+        refine_ratio = levels_specs[level - 1]["refine_ratio"]
+        digits.append(index % refine_ratio)
+        index = index // refine_ratio
+    digits.append(index)
+    return digits[::-1]
+
+
+def ease_cell_centers(index, resolution: int, axis: str) -> np.ndarray:
+    """Return the projected x (``axis="x"``) or y centres of cell columns or rows.
+
+    The arithmetic follows ``grid_ids_to_ease`` step by step, so the centres
+    are bit-identical to those of the matching EASE ids.
+    """
+    digits = ease_digits(index, resolution)
+    grid = digits[0] * cell_scale_factors[0]
+    for level in range(1, resolution + 1):
+        grid = grid + digits[level] * cell_scale_factors[level]
+    grid = grid + cell_scale_factors[resolution] * 0.5
+    if axis == "x":
+        n_col = levels_specs[0]["n_col"]
+        return (EASE_EXTENT["max_x"] - EASE_EXTENT["min_x"]) / n_col * grid + (
+            EASE_EXTENT["min_x"]
+        )
+    n_row = levels_specs[0]["n_row"]
+    return (EASE_EXTENT["min_y"] - EASE_EXTENT["max_y"]) / n_row * grid + (
+        EASE_EXTENT["max_y"]
+    )
+
+
+def ease_index_range(low: float, high: float, resolution: int, axis: str):
+    """Return the indices of the columns or rows with centres in ``(low, high)``.
+
+    ``axis`` is ``"x"`` for columns and ``"y"`` for rows, and ``low`` and
+    ``high`` are projected coordinates along it.
+    """
+    extent_x = EASE_EXTENT["max_x"] - EASE_EXTENT["min_x"]
+    extent_y = EASE_EXTENT["max_y"] - EASE_EXTENT["min_y"]
+    if axis == "x":
+        count = levels_specs[resolution]["n_col"]
+        start = (low - EASE_EXTENT["min_x"]) / extent_x * count
+        stop = (high - EASE_EXTENT["min_x"]) / extent_x * count
+    else:
+        count = levels_specs[resolution]["n_row"]
+        start = (EASE_EXTENT["max_y"] - high) / extent_y * count
+        stop = (EASE_EXTENT["max_y"] - low) / extent_y * count
+    first = min(max(int(np.floor(start)) - 1, 0), count)
+    last = min(max(int(np.ceil(stop)) + 1, 0), count)
+    index = np.arange(first, last, dtype=np.int64)
+    centers = ease_cell_centers(index, resolution, axis)
+    return index[(centers > low) & (centers < high)]
+
+
+def ease_cell_ids(rows, cols, resolution: int) -> list:
+    """Format row and column indices at ``resolution`` as EASE ids."""
+    digits = [
+        digit
+        for pair in zip(ease_digits(rows, resolution), ease_digits(cols, resolution))
+        for digit in pair
+    ]
+    template = "L{}.{:03d}{:03d}" + ".{}{}" * resolution
+    return [
+        template.format(resolution, *cell_digits)
+        for cell_digits in np.stack(digits, axis=1).tolist()
+    ]
+
+
+def ease_polyfill_cells(geometry, resolution: int):
+    """Find the EASE cells of ``geometry`` on its projected candidate raster.
+
+    Candidates are the cells whose centre lies inside the projected bounds of
+    ``geometry``, as for ``geo_polygon_to_grid_ids``. Their row and column
+    ranges come straight from those bounds. Each cell is tested through the
+    lon/lat box ``ease2geo`` builds for it. Blocks of the raster are
+    classified in bulk and split in four until they are inside, outside or a
+    single boundary cell, so interior cells never need a polygon.
+
+    Returns ``(inside, boundary)``. Each is a ``(rows, cols, cells)`` tuple of
+    global row and column indices; ``cells`` holds the boundary cell polygons
+    and is ``None`` for inside cells.
+    """
+    min_lon, min_lat, max_lon, max_lat = geometry.bounds
+    (min_x, max_x), (min_y, max_y) = GEO_TO_EASE.transform(
+        [min_lon, max_lon], [min_lat, max_lat]
+    )
+    rows = ease_index_range(min_y, max_y, resolution, "y")
+    cols = ease_index_range(min_x, max_x, resolution, "x")
+    empty = np.zeros(0, dtype=np.int64)
+    if not len(rows) or not len(cols):
+        return (empty, empty, None), (empty, empty, [])
+
+    lons = EASE_TO_GEO.transform(
+        ease_cell_centers(cols, resolution, "x"), np.zeros(len(cols))
+    )[0]
+    lats = EASE_TO_GEO.transform(
+        np.zeros(len(rows)), ease_cell_centers(rows, resolution, "y")
+    )[1]
+    half_width = 360 / (2 * levels_specs[resolution]["n_col"])
+    half_height = 180 / (2 * levels_specs[resolution]["n_row"])
+    west, east = lons - half_width, lons + half_width
+    south, north = lats - half_height, lats + half_height
+
+    # Blocks are [r0, r1) x [c0, c1) ranges of positions in rows and cols;
+    # rows run from north to south.
+    r0, r1 = np.array([0]), np.array([len(rows)])
+    c0, c1 = np.array([0]), np.array([len(cols)])
+    inside_rows, inside_cols, boundary_rows, boundary_cols = [], [], [], []
+    while len(r0):
+        blocks = shapely.box(west[c0], south[r1 - 1], east[c1 - 1], north[r0])
+        inside, boundary = classify_cells(blocks, geometry)
+        for i in np.flatnonzero(inside):
+            block_rows, block_cols = np.meshgrid(
+                np.arange(r0[i], r1[i]), np.arange(c0[i], c1[i]), indexing="ij"
+            )
+            inside_rows.append(block_rows.ravel())
+            inside_cols.append(block_cols.ravel())
+        single = boundary & (r1 - r0 == 1) & (c1 - c0 == 1)
+        boundary_rows.append(r0[single])
+        boundary_cols.append(c0[single])
+
+        split = boundary & ~single
+        r0, r1, c0, c1 = r0[split], r1[split], c0[split], c1[split]
+        rm, cm = (r0 + r1 + 1) // 2, (c0 + c1 + 1) // 2
+        children = [
+            np.concatenate(bounds)
+            for bounds in zip(
+                (r0, rm, c0, cm), (r0, rm, cm, c1), (rm, r1, c0, cm), (rm, r1, cm, c1)
+            )
+        ]
+        r0, r1, c0, c1 = children
+        nonempty = (r0 < r1) & (c0 < c1)
+        r0, r1, c0, c1 = r0[nonempty], r1[nonempty], c0[nonempty], c1[nonempty]
+
+    inside_rows = np.concatenate(inside_rows or [empty])
+    inside_cols = np.concatenate(inside_cols or [empty])
+    boundary_rows = np.concatenate(boundary_rows)
+    boundary_cols = np.concatenate(boundary_cols)
+    boundary_cells = polygons_from_boundaries(
+        *box_boundaries(
+            west[boundary_cols],
+            south[boundary_rows],
+            east[boundary_cols],
+            north[boundary_rows],
+        )
+    )
+    return (
+        (rows[inside_rows], cols[inside_cols], None),
+        (rows[boundary_rows], cols[boundary_cols], boundary_cells),
+    )
+
 
 def poly2ease(
     geometry,
@@ -33,9 +210,10 @@ def poly2ease(
     """
     Convert polygon or line geometries to EASE grid cells.
 
-    Mirrors ``polygon2ease`` and ``polyline2ease`` in vgrid: bbox discovery via
-    ``geo_polygon_to_grid_ids``, then filter with ``ease2geo`` cell polygons.
-    Polygons use ``predicate``; lines use intersection.
+    Mirrors ``polygon2ease`` and ``polyline2ease`` in vgrid: the candidates of
+    ``geo_polygon_to_grid_ids`` are found by :func:`ease_polyfill_cells` and
+    filtered with their ``ease2geo`` cell polygons, only boundary cells being
+    tested one by one. Polygons use ``predicate``; lines use intersection.
     Compact mode applies to polygons after predicate filtering only (not lines).
 
     Args:
@@ -69,35 +247,14 @@ def poly2ease(
         if poly is None or poly.is_empty:
             continue
 
-        poly_bbox = box(*poly.bounds)
-        cells_bbox = geo_polygon_to_grid_ids(
-            poly_bbox.wkt,
-            resolution,
-            geo_crs,
-            ease_crs,
-            levels_specs,
-            return_centroids=True,
-            wkt_geom=True,
+        inside, boundary = ease_polyfill_cells(poly, resolution)
+        keep = cells_matching_predicate(
+            boundary[2], poly, "intersects" if is_line else predicate
         )
-        candidate_ids = cells_bbox["result"]["data"]
-        if not candidate_ids:
-            continue
-
-        if compact and is_line:
-            candidate_ids = ease_compact(candidate_ids)
-
-        poly_ids = []
-        for ease_id in candidate_ids:
-            ease_id_str = str(ease_id)
-            cell_polygon = ease_to_geo(ease_id_str)
-            if not cell_polygon:
-                continue
-            if is_line:
-                if cell_polygon.intersects(poly):
-                    poly_ids.append(ease_id_str)
-            elif check_predicate(cell_polygon, poly, predicate):
-                poly_ids.append(ease_id_str)
-
+        rows = np.concatenate([inside[0], boundary[0][keep]])
+        cols = np.concatenate([inside[1], boundary[1][keep]])
+        order = np.lexsort((cols, rows))
+        poly_ids = ease_cell_ids(rows[order], cols[order], resolution)
         if compact and poly_ids and not is_line:
             poly_ids = [str(cell_id) for cell_id in ease_compact(poly_ids)]
 
@@ -181,7 +338,7 @@ class EASEPandas:
             if EASE_COL not in self._df.columns:
                 raise ValueError(f"Column '{EASE_COL}' not found in DataFrame")
             ids = self._df[EASE_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, ease_to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, ease_to_geo, dggs="ease")
 
     def polyfill(
         self,
@@ -1,16 +1,87 @@
 from typing import Union
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-from vgrid.conversion.latlon2dggs import latlon2gars as latlon_to_gars
+from gars_field.garsgrid import GARSGrid
+from vgrid.utils.io import validate_gars_resolution
 from vgrid.conversion.dggs2geo.gars2geo import gars2geo as gars_to_geo
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import GARS_COL
+from vgridpandas.utils.latlon_helpers import (
+    ascii_strings,
+    digit_columns,
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
+def gars_subdivision_indices(degrees, inverse: bool = False):
+    """Return the 1-based 15, 5 and 1 minute indices of coordinate arrays.
+
+    Same as ``index_from_degrees`` in ``GARSGrid.from_latlon``; ``inverse``
+    counts latitude bands from the north.
+    """
+    minutes = (degrees - np.floor(degrees)) * 60
+    idx_15 = np.floor((minutes % 30) / 15.0).astype(np.int64) + 1
+    idx_5 = np.floor((minutes % 15) / 5.0).astype(np.int64) + 1
+    idx_1 = np.floor(minutes % 5).astype(np.int64) + 1
+    if inverse:
+        return 3 - idx_15, 4 - idx_5, 6 - idx_1
+    return idx_15, idx_5, idx_1
+
+
+def latlon2gars_array(lats, lons, resolution: int) -> np.ndarray:
+    """Convert arrays of latitudes and longitudes to GARS ids.
+
+    Follows ``GARSGrid.from_latlon`` on whole arrays: the 30 minute band
+    number and letters, then the 15 minute quadrant, 5 minute keypad and
+    1 minute key down to ``resolution``. Rows with non-finite coordinates get
+    ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): GARS resolution [1..4] (30, 15, 5 and 1 minutes)
+
+    Returns:
+        numpy.ndarray: object array of GARS ids
+    """
+    resolution = validate_gars_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat, lon = lats[valid], lons[valid]
+
+    # convert from (-180, 180) to (0, 360) and from (-90, 90) to (0, 180)
+    lon = np.where(lon != 180, (lon + 180) % 360, 360)
+    lat = np.where(lat != 90, (lat + 90) % 180, 179.9999999999)
+    lon_band = (lon * 2.0 + 1).astype(np.int64)
+    if (lon_band > 720).any():
+        raise ValueError(
+            f'"{lon_band.max():03d}" is not a valid GARS grid ID. '
+            "Longitude numbers can only be between 001-720."
+        )
+    lat_idx = lat * 2.0
+    letters = np.frombuffer(GARSGrid.LETTERS.encode(), dtype=np.uint8)
+    columns = digit_columns(lon_band, 3) + [
+        letters[np.floor(lat_idx // 24).astype(np.int64)],
+        letters[np.floor(lat_idx % 24).astype(np.int64)],
+    ]
+    if resolution > 1:
+        lon_15, lon_5, lon_1 = gars_subdivision_indices(lon)
+        lat_15, lat_5, lat_1 = gars_subdivision_indices(lat, inverse=True)
+        columns += digit_columns((lat_15 - 1) * 2 + lon_15, 1)
+        if resolution > 2:
+            columns += digit_columns((lat_5 - 1) * 3 + lon_5, 1)
+        if resolution > 3:
+            columns += digit_columns((lat_1 - 1) * 5 + lon_1, 2)
+    return scatter_ids(ascii_strings(columns), valid)
+
+
 @pd.api.extensions.register_dataframe_accessor("gars")
 class GARSPandas:
     def __init__(self, df: DataFrame):
@@ -49,16 +120,8 @@ class GARSPandas:
         (Geo)DataFrame with gars IDs added
         """
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        gars_ids = [
-            latlon_to_gars(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        gars_ids = latlon2gars_array(lats, lons, resolution)
 
         gars_col = GARS_COL
         assign_arg = {gars_col: gars_ids, f"{gars_col}_res": resolution}
@@ -77,7 +140,7 @@ class GARSPandas:
             if GARS_COL not in self._df.columns:
                 raise ValueError(f"Column '{GARS_COL}' not found in DataFrame")
             ids = self._df[GARS_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, gars_to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, gars_to_geo, dggs="gars")
 
     def garsbin(
         self,
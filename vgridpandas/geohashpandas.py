@@ -5,14 +5,23 @@ from shapely.geometry import (
     LineString,
     MultiLineString,
 )
+import warnings
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-from vgrid.conversion.latlon2dggs import latlon2geohash as latlon_to_geohash
 from vgrid.conversion.dggs2geo.geohash2geo import geohash2geo as geohash_to_geo
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    box_boundaries,
+    dggs_ids_to_geodataframe,
+    polygons_from_boundaries,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import (
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 from vgridpandas.utils.const import GEOHASH_COL
 
 
@@ -22,14 +31,173 @@ AnyDataFrame = Union[DataFrame, GeoDataFrame]
 from typing import Union, Set
 from vgrid.utils.io import validate_geohash_resolution
 from vgrid.conversion.dggscompact.geohashcompact import geohash_compact
-from vgrid.generator.geohashgrid import expand_geohash_bbox
-from vgrid.utils.constants import INITIAL_GEOHASHES
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import (
+    cells_matching_predicate,
+    classify_cells,
+)
 
 
 MultiPolyOrPoly = Union[Polygon, MultiPolygon]
 MultiLineOrLine = Union[LineString, MultiLineString]
 
+GEOHASH_BASE32 = np.frombuffer(b"0123456789bcdefghjkmnpqrstuvwxyz", dtype=np.uint8)
+GEOHASH_BASE32_INDEX = np.full(256, -1, dtype=np.int64)
+GEOHASH_BASE32_INDEX[GEOHASH_BASE32] = np.arange(32)
+
+
+def latlon2geohash_array(lats, lons, resolution: int):
+    """Encode arrays of latitudes and longitudes to geohashes in one batch.
+
+    Coordinates are quantized with the same exact floor arithmetic as
+    ``vgrid.dggs.geohash.encode``, bits are interleaved (longitude first) over
+    whole arrays and every 5-bit group is mapped through the base32 alphabet,
+    so results match the scalar encoder character for character.
+    Rows with non-finite coordinates get ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): Geohash resolution level [1..10]
+
+    Returns:
+        numpy.ndarray: Object array of geohash ids
+
+    Example:
+        >>> latlon2geohash_array([10.775275567242561], [106.70679737574993], 6)
+        array(['w3gvk1'], dtype=object)
+    """
+    resolution = validate_geohash_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat = lats[valid]
+    lon = lons[valid].copy()
+
+    if (lat > 90.0).any() or (lat < -90.0).any():
+        raise ValueError("invalid latitude.")
+    north_pole = lat == 90.0
+    if north_pole.any():
+        warnings.warn(
+            "latitude 90.0 is outside the geohash latitude range [-90.0, 90.0); "
+            "encoding the adjacent cell at nextafter(90.0, -inf)",
+            stacklevel=2,
+        )
+        lat = np.where(north_pole, np.nextafter(90.0, -np.inf), lat)
+    while (low := lon < -180.0).any():
+        lon[low] += 360.0
+    while (high := lon >= 180.0).any():
+        lon[high] -= 360.0
+
+    n_bits = 5 * resolution
+    lon_bits = (n_bits + 1) // 2
+    lat_bits = n_bits // 2
+    # floor(f * 2**(bits - 1)) + 2**(bits - 1) is exact for f in [-1, 1)
+    lon_half = 1 << (lon_bits - 1)
+    lat_half = 1 << (lat_bits - 1)
+    lon_q = np.floor(lon / 180.0 * lon_half).astype(np.int64) + lon_half
+    lat_q = np.floor(lat / 90.0 * lat_half).astype(np.int64) + lat_half
+
+    code = np.zeros(len(lat), dtype=np.int64)
+    for bit in range(n_bits):
+        if bit % 2 == 0:
+            value = (lon_q >> (lon_bits - 1 - bit // 2)) & 1
+        else:
+            value = (lat_q >> (lat_bits - 1 - bit // 2)) & 1
+        code = (code << 1) | value
+
+    shifts = 5 * np.arange(resolution - 1, -1, -1, dtype=np.int64)
+    chars = GEOHASH_BASE32[(code[:, None] >> shifts) & 31]
+    geohash_ids = chars.view(f"S{resolution}").ravel().astype(str)
+    return scatter_ids(geohash_ids, valid)
+
+
+def geohash_boundaries(geohash_ids):
+    """Return ``(coords, offsets)`` cell rings for an array of geohash ids.
+
+    Bounds are decoded with the same exact arithmetic as
+    ``vgrid.dggs.geohash.bbox``.
+
+    Raises
+    ------
+    ValueError
+        When an id is empty or holds a character outside the geohash alphabet
+    """
+    geohash_ids = np.asarray(geohash_ids, dtype=str)
+    lengths = np.char.str_len(geohash_ids)
+    if (lengths == 0).any():
+        raise ValueError("Empty geohash")
+    west, south, east, north = (np.empty(len(geohash_ids)) for _ in range(4))
+    for length in np.unique(lengths):
+        rows = lengths == length
+        chars = geohash_ids[rows].astype(f"S{length}").view(np.uint8)
+        values = GEOHASH_BASE32_INDEX[chars.reshape(-1, length)]
+        if (values < 0).any():
+            raise ValueError("Invalid geohash character")
+
+        n_bits = 5 * length
+        lon_bits = (n_bits + 1) // 2
+        lat_bits = n_bits // 2
+        lon_q = np.zeros(len(values), dtype=np.int64)
+        lat_q = np.zeros(len(values), dtype=np.int64)
+        for bit in range(n_bits):
+            value = (values[:, bit // 5] >> (4 - bit % 5)) & 1
+            if bit % 2 == 0:
+                lon_q = (lon_q << 1) | value
+            else:
+                lat_q = (lat_q << 1) | value
+
+        lon_half = 1 << (lon_bits - 1)
+        lat_half = 1 << (lat_bits - 1)
+        south[rows] = (lat_q - lat_half) / lat_half * 90.0
+        north[rows] = south[rows] + 180.0 / (1 << lat_bits)
+        west[rows] = (lon_q - lon_half) / lon_half * 180.0
+        east[rows] = west[rows] + 360.0 / (1 << lon_bits)
+    return box_boundaries(west, south, east, north)
+
+
+def geohash_descendants(geohash_ids, resolution: int) -> np.ndarray:
+    """Return every descendant at ``resolution`` of same-length geohash ids.
+
+    Children are enumerated arithmetically, by appending each base32 suffix
+    of the missing length to every prefix, in prefix then suffix order.
+    """
+    geohash_ids = np.asarray(geohash_ids, dtype=str)
+    length = len(geohash_ids[0]) if len(geohash_ids) else resolution
+    suffix_length = resolution - length
+    if suffix_length <= 0 or len(geohash_ids) == 0:
+        return geohash_ids
+    shifts = 5 * np.arange(suffix_length - 1, -1, -1, dtype=np.int64)
+    suffixes = GEOHASH_BASE32[(np.arange(32**suffix_length)[:, None] >> shifts) & 31]
+    prefixes = geohash_ids.astype(f"S{length}").view(np.uint8).reshape(-1, length)
+    chars = np.empty((len(prefixes), len(suffixes), resolution), dtype=np.uint8)
+    chars[:, :, :length] = prefixes[:, None, :]
+    chars[:, :, length:] = suffixes[None, :, :]
+    return chars.view(f"S{resolution}").ravel().astype(str)
+
+
+def geohash_polyfill_cells(geometry, resolution: int):
+    """Descend geohash cells 32 ways from the one-character cells.
+
+    Each level is classified in bulk against ``geometry``: cells fully inside
+    are accepted whole as prefixes, cells outside are dropped and only cells
+    on the boundary are split further. Returns ``(interior, boundary,
+    boundary_cells)``: a list of accepted prefix arrays (one per level), the
+    boundary ids at ``resolution`` and their polygons.
+    """
+    interior = []
+    geohash_ids = GEOHASH_BASE32.view("S1").astype(str)
+    for length in range(1, resolution + 1):
+        if len(geohash_ids) == 0:
+            break
+        cells = polygons_from_boundaries(*geohash_boundaries(geohash_ids))
+        inside, boundary = classify_cells(cells, geometry)
+        if inside.any():
+            interior.append(geohash_ids[inside])
+        if length == resolution:
+            return interior, geohash_ids[boundary], cells[boundary]
+        geohash_ids = geohash_descendants(geohash_ids[boundary], length + 1)
+    return interior, geohash_ids, np.empty(0, dtype=object)
+
 
 def poly2geohash(
     geometry: MultiPolyOrPoly,
@@ -66,17 +234,15 @@ def poly2geohash(
         return []
 
     for poly in polys:
-        intersected_geohashes = {
-            gh for gh in INITIAL_GEOHASHES if geohash_to_geo(gh).intersects(poly)
-        }
-        geohashes_bbox = set()
-        for gh in intersected_geohashes:
-            expand_geohash_bbox(gh, resolution, geohashes_bbox, poly)
-        for gh in geohashes_bbox:
-            cell_polygon = geohash_to_geo(gh)
-            if not check_predicate(cell_polygon, poly, predicate):
-                continue
-            geohash_ids.append(gh)
+        interior, boundary_ids, boundary_cells = geohash_polyfill_cells(
+            poly, resolution
+        )
+        kept = cells_matching_predicate(boundary_cells, poly, predicate)
+        for prefixes in interior:
+            if not compact:
+                prefixes = geohash_descendants(prefixes, resolution)
+            geohash_ids.extend(prefixes.tolist())
+        geohash_ids.extend(boundary_ids[kept].tolist())
     if compact:
         return geohash_compact(geohash_ids)
     return geohash_ids
@@ -133,16 +299,8 @@ class GeohashPandas:
         (Geo)DataFrame with geohash IDs added
         """
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        geohash_ids = [
-            latlon_to_geohash(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        geohash_ids = latlon2geohash_array(lats, lons, resolution)
 
         geohash_col = GEOHASH_COL
         assign_arg = {geohash_col: geohash_ids, f"{geohash_col}_res": resolution}
@@ -161,7 +319,13 @@ class GeohashPandas:
             if GEOHASH_COL not in self._df.columns:
                 raise ValueError(f"Column '{GEOHASH_COL}' not found in DataFrame")
             ids = self._df[GEOHASH_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, geohash_to_geo)
+        return dggs_ids_to_geodataframe(
+            self._df,
+            ids,
+            geohash_to_geo,
+            to_boundaries=geohash_boundaries,
+            dggs="geohash",
+        )
 
     def polyfill(
         self,
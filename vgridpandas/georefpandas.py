@@ -1,17 +1,77 @@
+import sys
 from typing import Union
+import numpy as np
 import pandas as pd
-import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import GEOREF_COL
-from vgrid.conversion.latlon2dggs import latlon2georef as latlon_to_georef
+from vgridpandas.utils.latlon_helpers import (
+    ascii_strings,
+    digit_columns,
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 from vgrid.conversion.dggs2geo.georef2geo import georef2geo as georef_to_geo
+from vgrid.dggs import georef
+from vgrid.utils.io import validate_georef_resolution
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
+def latlon2georef_array(lats, lons, resolution: int) -> np.ndarray:
+    """Convert arrays of latitudes and longitudes to GEOREF codes.
+
+    Follows ``georef.encode`` on whole arrays: coordinates are scaled to
+    integer units of 1e-11 degree (in int64, exactly as the scalar code does
+    with Python ints), then split into the 15 degree tile letters, the degree
+    letters and ``resolution`` digit pairs. Rows with non-finite coordinates
+    get ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): GEOREF resolution [0..10]
+
+    Returns:
+        numpy.ndarray: object array of GEOREF codes
+    """
+    resolution = validate_georef_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat, lon = lats[valid], lons[valid]
+    if ((lat > 90) | (lat < -90)).any():
+        raise georef.GeorefException("Latitude not in -90 to 90 range")
+    if ((lon < -180) | (lon > 360)).any():
+        raise georef.GeorefException("Longitude is out of range")
+    lon = np.where(lon >= 180, lon - 360, lon)
+    lat = np.where(lat == 90, lat - sys.float_info.epsilon, lat)
+    precision = 2 if resolution == 1 else resolution
+
+    m = 60000000000
+    x = np.floor(lon * m).astype(np.int64) - georef.lonorig_ * m
+    y = np.floor(lat * m).astype(np.int64) - georef.latorig_ * m
+    ilon = (x / m).astype(np.int64)
+    ilat = (y / m).astype(np.int64)
+    lon_tiles = np.frombuffer(georef.lontile_.encode(), dtype=np.uint8)
+    lat_tiles = np.frombuffer(georef.lattile_.encode(), dtype=np.uint8)
+    degrees = np.frombuffer(georef.degrees_.encode(), dtype=np.uint8)
+    columns = [
+        lon_tiles[ilon // georef.tile_],
+        lat_tiles[ilat // georef.tile_],
+        degrees[ilon % georef.tile_],
+        degrees[ilat % georef.tile_],
+    ]
+    if precision > 0:
+        d = 10.0 ** (georef.maxprec_ - precision)
+        columns += digit_columns(((x - m * ilon) / d).astype(np.int64), precision)
+        columns += digit_columns(((y - m * ilat) / d).astype(np.int64), precision)
+    return scatter_ids(ascii_strings(columns), valid)
+
+
 @pd.api.extensions.register_dataframe_accessor("georef")
 class GEOREFPandas:
     def __init__(self, df: DataFrame):
@@ -49,16 +109,8 @@ class GEOREFPandas:
         -------
         (Geo)DataFrame with georef IDs added
         """
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        georef_ids = [
-            latlon_to_georef(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        georef_ids = latlon2georef_array(lats, lons, resolution)
 
         # georef_col = self._format_resolution(resolution)
         georef_col = GEOREF_COL
@@ -78,7 +130,7 @@ class GEOREFPandas:
             if GEOREF_COL not in self._df.columns:
                 raise ValueError(f"Column '{GEOREF_COL}' not found in DataFrame")
             ids = self._df[GEOREF_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, georef_to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, georef_to_geo, dggs="georef")
 
     def georefbin(
         self,
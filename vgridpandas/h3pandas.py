@@ -1,20 +1,25 @@
 from typing import Union, Optional, Iterator
 
 
+import numpy as np
 import pandas as pd
-import geopandas as gpd
 
 import h3
+from h3.api import basic_int as h3_int
 from shapely.geometry import Polygon, MultiPolygon, LineString, MultiLineString, box
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import cell_geometry, dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import (
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import filter_cells, normalize_predicate
 from vgrid.utils.io import validate_h3_resolution
 from vgridpandas.utils.const import H3_COL
-from vgrid.conversion.latlon2dggs import latlon2h3 as latlon_to_h3
 from vgrid.conversion.dggs2geo.h32geo import h32geo as h3_to_geo
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
@@ -23,11 +28,88 @@ AnyDataFrame = Union[DataFrame, GeoDataFrame]
 MultiPolyOrPoly = Union[Polygon, MultiPolygon]
 MultiLineOrLine = Union[LineString, MultiLineString]
 
+H3_CONTAINMENT = {
+    "intersects": "overlap",
+    "within": "full",
+    "centroid_within": "center",
+}
+
+
+def latlon2h3_array(lats, lons, resolution: int, as_int: bool = False):
+    """Convert arrays of latitudes and longitudes to H3 cell ids in one batch.
+
+    The resolution is validated once and every point goes straight through the
+    integer H3 binding, so no per-row validation or string round trip happens.
+    Rows with non-finite coordinates get ``None`` (or ``0``, the H3 null index,
+    when ``as_int`` is True).
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): H3 resolution level [0..15]
+        as_int (bool): Return uint64 cell ids instead of hex strings
+
+    Returns:
+        numpy.ndarray: uint64 array if ``as_int`` else object array of hex ids
+
+    Example:
+        >>> latlon2h3_array([50, 51], [14, 15], 8)
+        array(['881e309739fffff', '881e2659c3fffff'], dtype=object)
+    """
+    resolution = validate_h3_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    to_cell = h3_int.latlng_to_cell
+    cells = np.fromiter(
+        (
+            to_cell(lat, lon, resolution)
+            for lat, lon in zip(lats[valid].tolist(), lons[valid].tolist())
+        ),
+        dtype=np.uint64,
+        count=int(valid.sum()),
+    )
+    if as_int:
+        h3_ids = np.zeros(len(lats), dtype=np.uint64)
+        h3_ids[valid] = cells
+        return h3_ids
+    return scatter_ids([format(cell, "x") for cell in cells.tolist()], valid)
+
+
+def h3_boundaries(h3_ids):
+    """Return ``(coords, offsets)`` cell rings for an array of H3 ids.
+
+    Accepts hex strings as well as integer ids (see ``latlon2h3(as_int=True)``).
+    """
+    boundaries = [
+        h3.cell_to_boundary(h3_id if isinstance(h3_id, str) else h3.int_to_str(h3_id))
+        for h3_id in h3_ids
+    ]
+    offsets = np.zeros(len(boundaries) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(boundary) for boundary in boundaries])
+    latlngs = np.array([latlng for boundary in boundaries for latlng in boundary])
+    return latlngs[:, ::-1], offsets
+
+
+def h3_containment(predicate) -> Optional[str]:
+    """Return the H3 polygon-fill containment mode matching ``predicate``.
+
+    ``None`` is returned for ``largest_overlap``, which H3 cannot express.
+    """
+    predicate = normalize_predicate(predicate)
+    if predicate == "largest_overlap":
+        return None
+    return H3_CONTAINMENT[predicate]
+
 
 def poly2h3(geometry, resolution, predicate=None, compact=False, fix_antimeridian=None):
     """
     Convert polygon geometries (Polygon, MultiPolygon) to H3 grid cells.
 
+    Polygons are filled by H3 itself with the containment mode matching
+    ``predicate`` (see :func:`h3_containment`). Only ``largest_overlap`` builds
+    cell polygons, and only for cells crossing the polygon boundary.
+
     Args:
         resolution (int): H3 resolution level [0..15]
         geometry (shapely.geometry.Polygon or shapely.geometry.MultiPolygon): Polygon geometry to convert
@@ -52,18 +134,43 @@ def poly2h3(geometry, resolution, predicate=None, compact=False, fix_antimeridia
     else:
         return []
 
+    contain = h3_containment(predicate)
     for poly in polys:
-        bbox = box(*poly.bounds)
-        bbox_cells = h3.geo_to_cells(bbox, resolution)
-        if compact:
-            bbox_cells = h3.compact_cells(bbox_cells)
-
-        for bbox_cell in bbox_cells:
-            cell_polygon = h3_to_geo(bbox_cell, fix_antimeridian=fix_antimeridian)
-            if not check_predicate(cell_polygon, poly, predicate):
-                continue
-            h3_ids.append(bbox_cell)
-
+        if poly.is_empty:
+            continue
+        if isinstance(poly, LineString):
+            candidate_cells = h3.geo_to_cells(box(*poly.bounds), resolution)
+        elif contain is not None:
+            h3_shape = h3.geo_to_h3shape(poly)
+            h3_ids.extend(
+                h3.h3shape_to_cells_experimental(h3_shape, resolution, contain)
+            )
+            continue
+        else:
+            # largest_overlap: cells fully inside always pass, so only cells on
+            # the boundary need their geometry checked.
+            h3_shape = h3.geo_to_h3shape(poly)
+            interior_cells = h3.h3shape_to_cells_experimental(
+                h3_shape, resolution, "full"
+            )
+            interior_set = set(interior_cells)
+            candidate_cells = [
+                cell
+                for cell in h3.h3shape_to_cells_experimental(
+                    h3_shape, resolution, "overlap"
+                )
+                if cell not in interior_set
+            ]
+            h3_ids.extend(interior_cells)
+
+        cell_polygons = [
+            cell_geometry("h3", cell, h3_to_geo, fix_antimeridian=fix_antimeridian)
+            for cell in candidate_cells
+        ]
+        h3_ids.extend(filter_cells(candidate_cells, cell_polygons, poly, predicate))
+
+    if compact:
+        return h3.compact_cells(set(h3_ids))
     return h3_ids
 
 
@@ -128,6 +235,7 @@ class H3Pandas:
         lat_col: str = "lat",
         lon_col: str = "lon",
         set_index: bool = False,
+        as_int: bool = False,
     ) -> AnyDataFrame:
         """Adds H3 index to (Geo)DataFrame.
 
@@ -146,6 +254,9 @@ class H3Pandas:
             Name of the longitude column (if used), default 'lon'
         set_index : bool
             If True, the column with H3 ID is set as index, default False
+        as_int : bool
+            If True, H3 IDs are stored as uint64 instead of hex strings,
+            default False
 
         Returns
         -------
@@ -178,15 +289,8 @@ class H3Pandas:
         881e2659c3fffff    1  POINT (15.00000 51.00000)
 
         """
-        resolution = validate_h3_resolution(resolution)
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        h3_ids = [latlon_to_h3(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        h3_ids = latlon2h3_array(lats, lons, resolution, as_int=as_int)
 
         h3_col = H3_COL
         assign_arg = {h3_col: h3_ids, f"{h3_col}_res": resolution}
@@ -208,7 +312,12 @@ class H3Pandas:
                 raise ValueError(f"Column '{H3_COL}' not found in DataFrame")
             ids = self._df[H3_COL]
         return dggs_ids_to_geodataframe(
-            self._df, ids, h3_to_geo, fix_antimeridian=fix_antimeridian
+            self._df,
+            ids,
+            h3_to_geo,
+            fix_antimeridian=fix_antimeridian,
+            to_boundaries=h3_boundaries if fix_antimeridian is None else None,
+            dggs="h3",
         )
 
     def h3bin(
@@ -12,12 +12,12 @@ import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 from vgrid.conversion.latlon2dggs import latlon2isea3h as latlon_to_isea3h
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import cell_geometry, dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import ISEA3H_COL
 from vgrid.conversion.dggs2geo.isea3h2geo import isea3h2geo as isea3h_to_geo
 from vgrid.conversion.dggscompact.isea3hcompact import isea3h_compact
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import filter_cells
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
@@ -101,19 +101,18 @@ def poly2isea3h(
         is_line = isinstance(poly, LineString)
         bounding_child_cells = _isea3h_children_for_bounds(poly.bounds, resolution)
 
-        poly_ids = []
-        for child in bounding_child_cells:
-            isea3h_cell = DggsCell(child)
-            isea3h_id = isea3h_cell.get_cell_id()
-            cell_polygon = isea3h_to_geo(
-                isea3h_id, fix_antimeridian=fix_antimeridian
+        candidate_ids = [
+            DggsCell(child).get_cell_id() for child in bounding_child_cells
+        ]
+        cell_polygons = [
+            cell_geometry(
+                "isea3h", isea3h_id, isea3h_to_geo, fix_antimeridian=fix_antimeridian
             )
-            if is_line:
-                if not cell_polygon.intersects(poly):
-                    continue
-            elif not check_predicate(cell_polygon, poly, predicate):
-                continue
-            poly_ids.append(isea3h_id)
+            for isea3h_id in candidate_ids
+        ]
+        poly_ids = filter_cells(
+            candidate_ids, cell_polygons, poly, "intersects" if is_line else predicate
+        )
 
         if compact and poly_ids and not is_line:
             poly_ids = list(isea3h_compact(poly_ids))
@@ -215,7 +214,11 @@ class ISEA3HPandas:
                 raise ValueError(f"Column '{ISEA3H_COL}' not found in DataFrame")
             ids = self._df[ISEA3H_COL]
         return dggs_ids_to_geodataframe(
-            self._df, ids, isea3h_to_geo, fix_antimeridian=fix_antimeridian
+            self._df,
+            ids,
+            isea3h_to_geo,
+            fix_antimeridian=fix_antimeridian,
+            dggs="isea3h",
         )
 
     def polyfill(
@@ -12,12 +12,12 @@ import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 from vgrid.conversion.latlon2dggs import latlon2isea4t as latlon_to_isea4t
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import cell_geometry, dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import ISEA4T_COL  
 from vgrid.conversion.dggs2geo.isea4t2geo import isea4t2geo as isea4t_to_geo
 from vgrid.conversion.dggscompact.isea4tcompact import isea4t_compact
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import filter_cells
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]           
 
@@ -93,18 +93,16 @@ def poly2isea4t(
         is_line = isinstance(poly, LineString)
         bounding_child_cells = _isea4t_children_for_bounds(poly.bounds, resolution)
 
-        poly_ids = []
-        for child in bounding_child_cells:
-            isea4t_id = child
-            cell_polygon = isea4t_to_geo(
-                isea4t_id, fix_antimeridian=fix_antimeridian
+        candidate_ids = list(bounding_child_cells)
+        cell_polygons = [
+            cell_geometry(
+                "isea4t", isea4t_id, isea4t_to_geo, fix_antimeridian=fix_antimeridian
             )
-            if is_line:
-                if not cell_polygon.intersects(poly):
-                    continue
-            elif not check_predicate(cell_polygon, poly, predicate):
-                continue
-            poly_ids.append(isea4t_id)
+            for isea4t_id in candidate_ids
+        ]
+        poly_ids = filter_cells(
+            candidate_ids, cell_polygons, poly, "intersects" if is_line else predicate
+        )
 
         if compact and poly_ids and not is_line:
             poly_ids = list(isea4t_compact(poly_ids))
@@ -206,7 +204,11 @@ class ISEA4TPandas:
                 raise ValueError(f"Column '{ISEA4T_COL}' not found in DataFrame")
             ids = self._df[ISEA4T_COL]
         return dggs_ids_to_geodataframe(
-            self._df, ids, isea4t_to_geo, fix_antimeridian=fix_antimeridian
+            self._df,
+            ids,
+            isea4t_to_geo,
+            fix_antimeridian=fix_antimeridian,
+            dggs="isea4t",
         )   
 
     def polyfill(
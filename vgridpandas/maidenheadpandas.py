@@ -1,16 +1,62 @@
 from typing import Union
+import numpy as np
 import pandas as pd
-import geopandas as gpd
-from vgrid.conversion.latlon2dggs import latlon2maidenhead as latlon_to_maidenhead
+from vgrid.utils.io import validate_maidenhead_resolution
 from vgrid.conversion.dggs2geo.maidenhead2geo import maidenhead2geo as maidenhead_to_geo
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
 from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import MAIDENHEAD_COL
+from vgridpandas.utils.latlon_helpers import (
+    ascii_strings,
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
+def latlon2maidenhead_array(lats, lons, resolution: int) -> np.ndarray:
+    """Convert arrays of latitudes and longitudes to Maidenhead locators.
+
+    Follows ``maidenhead.toMaiden`` on whole arrays: each pair of characters
+    comes from a ``divmod`` of the remaining lon/lat fraction, alternating
+    letters and digits. Rows with non-finite coordinates get ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): Maidenhead resolution [1..4]
+
+    Returns:
+        numpy.ndarray: object array of Maidenhead locators
+    """
+    resolution = validate_maidenhead_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat, lon = lats[valid], lons[valid]
+    if ((lon < -180.0) | (lon > 180.0) | (lat < -90.0) | (lat > 90.0)).any():
+        raise ValueError("Maidenhead: invalid latitude and longitude")
+
+    lon_index, lon = np.divmod(lon + 180, 20)
+    lat_index, lat = np.divmod(lat + 90, 10)
+    columns = [ord("A") + lon_index, ord("A") + lat_index]
+    lon = lon / 2.0
+    for precision in range(2, resolution + 1):
+        lon_index, lon = np.divmod(lon, 1)
+        lat_index, lat = np.divmod(lat, 1)
+        if precision % 2 == 0:
+            first, scale = ord("0"), 24
+        else:
+            # Subsquares (the third pair) are written in lower case.
+            first, scale = ord("a") if precision == 3 else ord("A"), 10
+        columns += [first + lon_index, first + lat_index]
+        lon, lat = scale * lon, scale * lat
+    return scatter_ids(ascii_strings(columns), valid)
+
+
 @pd.api.extensions.register_dataframe_accessor("maidenhead")
 class MaidenheadPandas:
     def __init__(self, df: DataFrame):
@@ -52,16 +98,8 @@ class MaidenheadPandas:
         if not isinstance(resolution, int) or resolution not in range(1, 5):
             raise ValueError("Resolution must be an integer in range [1, 4]")
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        maidenhead_ids = [
-            latlon_to_maidenhead(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        maidenhead_ids = latlon2maidenhead_array(lats, lons, resolution)
 
         # maidenhead_col = self._format_resolution(resolution)
         maidenhead_col = MAIDENHEAD_COL
@@ -81,7 +119,9 @@ class MaidenheadPandas:
             if MAIDENHEAD_COL not in self._df.columns:
                 raise ValueError(f"Column '{MAIDENHEAD_COL}' not found in DataFrame")
             ids = self._df[MAIDENHEAD_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, maidenhead_to_geo)
+        return dggs_ids_to_geodataframe(
+            self._df, ids, maidenhead_to_geo, dggs="maidenhead"
+        )
 
     def maidenheadbin(
         self,
@@ -1,16 +1,192 @@
 from typing import Union
 from vgridpandas.utils.const import MGRS_COL
-from vgrid.conversion.latlon2dggs import latlon2mgrs as latlon_to_mgrs
 from vgrid.conversion.dggs2geo.mgrs2geo import mgrs2geo as mgrs_to_geo
+from vgrid.dggs import mgrs
+from vgrid.utils.io import validate_mgrs_resolution
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
+from pyproj import Transformer
 from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import (
+    ascii_strings,
+    digit_columns,
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
+import numpy as np
 import pandas as pd
-import geopandas as gpd
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
+# Letter index of the latitude bands C..X, in 8 degree steps from -80.
+MGRS_BAND_LETTERS = np.array([band[0] for band in mgrs.LATITUDE_BANDS])
+# 2nd letter low value and pattern offset of UTM zone sets 1..6 (0 is set 6).
+MGRS_SET_LOW_LETTERS = np.array([18, 0, 9, 18, 0, 9, 18])
+MGRS_SET_OFFSETS = np.array([5e5, 0.0, 5e5, 0.0, 5e5, 0.0, 5e5])
+# UPS letter, 2nd letter low value, false easting and northing by UPS_CONSTANTS key.
+MGRS_UPS_CONSTANTS = np.array(
+    [(c[0], c[1], c[4], c[5]) for _, c in sorted(mgrs.UPS_CONSTANTS.items())]
+)
+
+_mgrs_transformers = {}
+
+
+def get_mgrs_transformer(epsg: int):
+    """Return the WGS84 to UTM/UPS ``Transformer`` of ``epsg``, created once.
+
+    UPS (zone 61) keeps the authority axis order, as in ``mgrs._transform``.
+    """
+    transformer = _mgrs_transformers.get(epsg)
+    if transformer is None:
+        polar = epsg % 100 == 61
+        transformer = Transformer.from_crs(4326, epsg, always_xy=not polar)
+        _mgrs_transformers[epsg] = transformer
+    return transformer
+
+
+def mgrs_zones(lats, lons) -> np.ndarray:
+    """Return the UTM zone of each point, 61 for the UPS polar caps.
+
+    Same as ``mgrs._epsgForWgs``, including the Norway and Svalbard zones.
+    """
+    zones = np.where(lons < 180, 31 + lons / 6.0, lons / 6 - 29).astype(np.int64)
+    zones[zones > 60] = 1
+    zones[(lats >= 56) & (lats < 64) & (lons >= 3) & (lons < 12)] = 32
+    svalbard = (lats >= 72) & (lats < 84)
+    for low, high, zone in [(0, 9, 31), (9, 21, 33), (21, 33, 35), (33, 42, 37)]:
+        zones[svalbard & (lons >= low) & (lons < high)] = zone
+    zones[(lats <= -80) | (lats >= 84)] = 61
+    return zones
+
+
+def mgrs_project(lats, lons, epsg) -> tuple:
+    """Project points to easting/northing, one transform per EPSG code."""
+    eastings = np.empty(len(lats))
+    northings = np.empty(len(lats))
+    order = np.argsort(epsg, kind="stable")
+    codes, starts = np.unique(epsg[order], return_index=True)
+    for code, rows in zip(codes, np.split(order, starts[1:])):
+        transformer = get_mgrs_transformer(int(code))
+        if code % 100 == 61:
+            northings[rows], eastings[rows] = transformer.transform(
+                lats[rows], lons[rows]
+            )
+        else:
+            eastings[rows], northings[rows] = transformer.transform(
+                lons[rows], lats[rows]
+            )
+    return eastings, northings
+
+
+def skip_letters(letters, skipped):
+    """Step letter indices past each of ``skipped`` (e.g. I and O), in order."""
+    for letter, step in skipped:
+        letters = letters + np.where(letters > letter, step, 0)
+    return letters
+
+
+def latlon2mgrs_array(lats, lons, resolution: int) -> np.ndarray:
+    """Convert arrays of latitudes and longitudes to MGRS ids.
+
+    Points are grouped by UTM zone and hemisphere (or UPS polar cap) and each
+    group is projected with one vectorized ``pyproj`` transform; the 100 km
+    square letters and digits then follow ``mgrs._utmToMgrs`` and
+    ``mgrs._upsToMgrs`` over whole arrays. Rows with non-finite coordinates get
+    ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): MGRS resolution [0..5]
+
+    Returns:
+        numpy.ndarray: object array of MGRS ids
+    """
+    resolution = validate_mgrs_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat, lon = lats[valid], lons[valid]
+    if (np.abs(lat) > 90).any():
+        raise mgrs.MgrsException("Latitude outside of valid range (-90 to 90 degrees).")
+    if ((lon < -180) | (lon > 360)).any():
+        raise mgrs.MgrsException(
+            "Longitude outside of valid range (-180 to 360 degrees)."
+        )
+
+    zones = mgrs_zones(lat, lon)
+    north = lat >= 0
+    eastings, northings = mgrs_project(
+        lat, lon, 32000 + np.where(north, 600, 700) + zones
+    )
+    letters = np.empty((3, len(lat)), dtype=np.int64)
+    ups = (lat < -80) | (lat > 84)
+    utm = ~ups
+
+    # UTM, with the zone 61 of latitudes exactly -80 and 84 kept as is
+    lat_u, zone, easting, northing = lat[utm], zones[utm], eastings[utm], northings[utm]
+    equator = (lat_u <= 0) & (northing == 1.0e7)
+    lat_u = np.where(equator, 0, lat_u)
+    northing = np.where(equator, 0, northing)
+    bands = np.minimum(((lat_u + 80.0) / 8.0 + 1.0e-12).astype(np.int64), 19)
+    band_letters = np.where(
+        (lat_u >= 72) & (lat_u < 84.5), 23, MGRS_BAND_LETTERS[bands]
+    )
+    northing = np.fmod(northing, mgrs.TWOMIL) + MGRS_SET_OFFSETS[zone % 6]
+    northing = np.where(northing >= mgrs.TWOMIL, northing - mgrs.TWOMIL, northing)
+    easting = np.where(
+        (band_letters == 21) & (zone == 31) & (easting == 500000.0),
+        easting - 1.0,
+        easting,
+    )
+    low = MGRS_SET_LOW_LETTERS[zone % 6]
+    column_letters = low + (easting / mgrs.ONEHT - 1).astype(np.int64)
+    letters[:, utm] = [
+        band_letters,
+        column_letters + ((low == 9) & (column_letters > 13)),
+        skip_letters((northing / mgrs.ONEHT).astype(np.int64), [(7, 1), (13, 1)]),
+    ]
+    eastings[utm], northings[utm] = easting, northing
+
+    # UPS
+    easting, northing = eastings[ups], northings[ups]
+    if ((easting < 0) | (easting > 4e6) | (northing < 0) | (northing > 4e6)).any():
+        raise mgrs.MgrsException(
+            "Easting or northing outside of valid range (0 to 4,000,000 meters "
+            "for UPS)."
+        )
+    east = easting >= mgrs.TWOMIL
+    constants = MGRS_UPS_CONSTANTS[np.where(north[ups], 2, 0) + east]
+    column_letters = constants[:, 1] + (
+        (easting - constants[:, 2]) / mgrs.ONEHT
+    ).astype(np.int64)
+    letters[:, ups] = [
+        constants[:, 0],
+        np.where(
+            east,
+            skip_letters(column_letters, [(2, 2), (7, 1), (11, 3)]),
+            skip_letters(column_letters, [(11, 3), (20, 2)]),
+        ),
+        skip_letters(
+            ((northing - constants[:, 3]) / mgrs.ONEHT).astype(np.int64),
+            [(7, 1), (13, 1)],
+        ),
+    ]
+    if (letters > 25).any():
+        # zone 61 UTM squares of latitude -80 run past Z, as in mgrs._mgrsString
+        raise ValueError(f"{letters.max()} is not a valid MGRS letter index")
+
+    columns = digit_columns(zones, 2)
+    columns = [np.where(ups, ord(" "), column) for column in columns]
+    columns += list(ord("A") + letters)
+    for values in (eastings, northings):
+        values = np.fmod(values + 1e-8, 100000.0)
+        values = np.where(values >= 99999.5, 99999.0, values).astype(np.int64)
+        columns += digit_columns(values, 5)[:resolution]
+    return scatter_ids(ascii_strings(columns), valid)
+
 
 @pd.api.extensions.register_dataframe_accessor("mgrs")
 class MGRSPandas:
@@ -49,17 +225,8 @@ class MGRSPandas:
         -------
         (Geo)DataFrame with mgrs IDs added
         """
-
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        mgrs_ids = [
-            latlon_to_mgrs(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        mgrs_ids = latlon2mgrs_array(lats, lons, resolution)
 
         # mgrs_col = self._format_resolution(resolution)
         mgrs_col = MGRS_COL
@@ -79,7 +246,7 @@ class MGRSPandas:
             if MGRS_COL not in self._df.columns:
                 raise ValueError(f"Column '{MGRS_COL}' not found in DataFrame")
             ids = self._df[MGRS_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, mgrs_to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, mgrs_to_geo, dggs="mgrs")
 
     def mgrsbin(
         self,
@@ -1,4 +1,7 @@
+from functools import lru_cache
 from typing import Union
+import numpy as np
+import shapely
 from shapely.geometry import (
     Polygon,
     MultiPolygon,
@@ -6,12 +9,20 @@ from shapely.geometry import (
     MultiLineString,
 )
 import pandas as pd
-import geopandas as gpd
-from vgrid.conversion.latlon2dggs import latlon2olc as latlon_to_olc
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    box_boundaries,
+    dggs_ids_to_geodataframe,
+    polygons_from_boundaries,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import (
+    ascii_strings,
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 
 from vgrid.conversion.dggs2geo.olc2geo import olc2geo as olc_to_geo
 from vgridpandas.utils.const import OLC_COL
@@ -20,14 +31,104 @@ AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
 from typing import Union, Set
-from vgrid.generator.olcgrid import olc_grid, olc_refine_cell
+from vgrid.dggs import olc
 from vgrid.utils.io import validate_olc_resolution
 from vgrid.conversion.dggscompact.olccompact import olc_compact
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import filter_cells, prepared_geometry
 
 MultiPolyOrPoly = Union[Polygon, MultiPolygon]
 MultiLineOrLine = Union[LineString, MultiLineString]
 
+OLC_BASE_RESOLUTION = 2
+OLC_BASE_ROWS = 9
+
+
+@lru_cache(maxsize=None)
+def olc_base_grid():
+    """Return the level-2 OLC grid as ``(cell_bounds, tree)``.
+
+    The 162 base cells are built once, in the row-major order of
+    ``olc_grid(2)``, and indexed by a Shapely ``STRtree`` of their polygons.
+    """
+    cell_bounds = [
+        (float(lng), float(lat), float(lng + 20), float(lat + 20))
+        for lat in range(-90, 90, 20)
+        for lng in range(-180, 180, 20)
+    ]
+    cells = polygons_from_boundaries(*box_boundaries(*np.array(cell_bounds).T))
+    return cell_bounds, shapely.STRtree(cells)
+
+
+def olc_cell_edges(indices, resolution: int, axis: int) -> tuple:
+    """Return the ``(lo, hi)`` degrees of OLC rows (``axis`` 0) or columns (1).
+
+    ``indices`` count cells of ``resolution`` from the south-west corner. The
+    edges are computed from integers and rounded exactly as in ``olc.decode``,
+    so they match ``olc2geo`` whichever parent the cell was refined from.
+    """
+    if axis == 0:
+        origin, final = olc.LATITUDE_MAX_, olc.FINAL_LAT_PRECISION_
+        grid_base = olc.GRID_ROWS_
+    else:
+        origin, final = olc.LONGITUDE_MAX_, olc.FINAL_LNG_PRECISION_
+        grid_base = olc.GRID_COLUMNS_
+    grid_unit = grid_base**olc.GRID_CODE_LENGTH_
+    if resolution <= olc.PAIR_CODE_LENGTH_:
+        place = olc.ENCODING_BASE_ ** ((olc.PAIR_CODE_LENGTH_ - resolution) // 2)
+        units = place * grid_unit
+        precision = float(place) / olc.PAIR_PRECISION_
+    else:
+        units = grid_base ** (olc.MAX_DIGIT_COUNT_ - resolution)
+        precision = float(units) / final
+    indices = np.asarray(indices, dtype=np.int64)
+    unique, inverse = np.unique(indices, return_inverse=True)
+    values = unique * units
+    starts = (values // grid_unit - origin * olc.PAIR_PRECISION_) / olc.PAIR_PRECISION_
+    starts = starts + values % grid_unit / final
+    lo = np.array([round(start, 14) for start in starts.tolist()])
+    hi = np.array([round(start + precision, 14) for start in starts.tolist()])
+    return lo[inverse], hi[inverse]
+
+
+def olc_cell_bounds(rows, cols, resolution: int) -> np.ndarray:
+    """Return the ``(west, south, east, north)`` bounds of OLC cells."""
+    south, north = olc_cell_edges(rows, resolution, 0)
+    west, east = olc_cell_edges(cols, resolution, 1)
+    return np.column_stack([west, south, east, north]).reshape(-1, 4)
+
+
+def olc_refine_cells(rows, cols, resolution, target_resolution, geometry):
+    """Refine OLC cells level by level down to ``target_resolution``.
+
+    Cells are ``rows``/``cols`` indices at ``resolution``. Each level splits
+    the cells kept by the previous one into their 20x20 (or 5x4 grid)
+    children, row by row as ``olc_refine_cell`` in vgrid does, and keeps the
+    children meeting ``geometry``, tested in bulk. Returns the bounds and
+    polygons of the target-level cells.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    bounds = olc_cell_bounds(rows, cols, resolution)
+    cells = polygons_from_boundaries(*box_boundaries(*bounds.T))
+    geometry = prepared_geometry(geometry)
+    while resolution < target_resolution and len(rows):
+        if resolution < olc.PAIR_CODE_LENGTH_:
+            resolution += 2
+            row_factor = col_factor = olc.ENCODING_BASE_
+        else:
+            resolution += 1
+            row_factor, col_factor = olc.GRID_ROWS_, olc.GRID_COLUMNS_
+        child_rows, child_cols = np.meshgrid(
+            np.arange(row_factor), np.arange(col_factor), indexing="ij"
+        )
+        rows = (rows[:, None] * row_factor + child_rows.ravel()).ravel()
+        cols = (cols[:, None] * col_factor + child_cols.ravel()).ravel()
+        bounds = olc_cell_bounds(rows, cols, resolution)
+        cells = polygons_from_boundaries(*box_boundaries(*bounds.T))
+        keep = shapely.intersects(geometry, cells)
+        rows, cols, bounds, cells = rows[keep], cols[keep], bounds[keep], cells[keep]
+    return bounds, cells
+
 
 def poly2olc(
     geometry: MultiPolyOrPoly,
@@ -63,39 +164,24 @@ def poly2olc(
     else:
         return []
 
+    base_bounds, base_tree = olc_base_grid()
     for poly in polys:
-        base_resolution = 2
-        base_cells_gdf = olc_grid(base_resolution, verbose=False)
-        seed_cells = []
-        for idx, base_cell in base_cells_gdf.iterrows():
-            base_cell_poly = base_cell["geometry"]
-            if poly.intersects(base_cell_poly):
-                seed_cells.append(base_cell)
-        refined_features = []
-        for seed_cell in seed_cells:
-            seed_cell_poly = seed_cell["geometry"]
-            if seed_cell_poly.contains(poly) and resolution == base_resolution:
-                refined_features.append(seed_cell)
-            else:
-                refined_features.extend(
-                    olc_refine_cell(
-                        seed_cell_poly.bounds, base_resolution, resolution, poly
-                    )
-                )
-        resolution_features = [
-            refined_feature
-            for refined_feature in refined_features
-            if refined_feature["resolution"] == resolution
-        ]
-        seen_olc_ids = set()
-        for resolution_feature in resolution_features:
-            olc_id = resolution_feature["olc"]
-            if olc_id not in seen_olc_ids:
-                cell_geom = resolution_feature["geometry"]
-                if not check_predicate(cell_geom, poly, predicate):
-                    continue
-                olc_ids.append(olc_id)  # Only append the OLC code string
-                seen_olc_ids.add(olc_id)
+        seed_indices = np.sort(base_tree.query(poly, predicate="intersects"))
+        if len(seed_indices) == 0:
+            continue
+        base_columns = len(base_bounds) // OLC_BASE_ROWS
+        cell_bounds, cells = olc_refine_cells(
+            seed_indices // base_columns,
+            seed_indices % base_columns,
+            OLC_BASE_RESOLUTION,
+            resolution,
+            poly,
+        )
+        west, south, east, north = cell_bounds.T
+        poly_olc_ids = latlon2olc_array(
+            south + (north - south) / 2, west + (east - west) / 2, resolution
+        ).tolist()
+        olc_ids.extend(filter_cells(poly_olc_ids, list(cells), poly, predicate))
     if compact:
         return olc_compact(olc_ids)
     return olc_ids
@@ -114,6 +200,82 @@ def polyfill_row(geometry, resolution, predicate=None, compact=False) -> list:
     return list(tokens)
 
 
+def olc_scaled_values(values, precision: int) -> np.ndarray:
+    """Return ``int(round(values * precision, 6))`` of non-negative values.
+
+    ``round(x, 6)`` only moves the truncated integer when the fraction of ``x``
+    is within 5e-7 of the next integer, so those few rows go through Python's
+    correctly rounded ``round``.
+    """
+    scaled = values * precision
+    result = np.floor(scaled).astype(np.int64)
+    near = np.flatnonzero(scaled - np.floor(scaled) > 0.999999)
+    result[near] = [int(round(x, 6)) for x in scaled[near].tolist()]
+    return result
+
+
+def latlon2olc_array(lats, lons, resolution: int) -> np.ndarray:
+    """Convert arrays of latitudes and longitudes to OLC codes.
+
+    Follows ``olc.encode`` on whole arrays: clipped and normalised coordinates
+    are scaled to integers, the 4x5 grid digits past 10 characters and the
+    base-20 pairs are extracted, then the separator and padding are added.
+    Rows with non-finite coordinates get ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): OLC code length [2,4,6,8,10..15]
+
+    Returns:
+        numpy.ndarray: object array of OLC codes
+    """
+    resolution = validate_olc_resolution(resolution)
+    if resolution < 2 or (resolution < olc.PAIR_CODE_LENGTH_ and resolution % 2):
+        raise ValueError(f"Invalid Open Location Code length - {resolution}")
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat = np.clip(lats[valid], -olc.LATITUDE_MAX_, olc.LATITUDE_MAX_)
+    lon = lons[valid]
+    # olc.normalizeLongitude steps by 360 degrees until in [-180, 180)
+    while (lon < -olc.LONGITUDE_MAX_).any():
+        lon = np.where(lon < -olc.LONGITUDE_MAX_, lon + 360, lon)
+    while (lon >= olc.LONGITUDE_MAX_).any():
+        lon = np.where(lon >= olc.LONGITUDE_MAX_, lon - 360, lon)
+    lat = np.where(
+        lat == olc.LATITUDE_MAX_,
+        lat - olc.computeLatitudePrecision(resolution),
+        lat,
+    )
+
+    lat_val = olc_scaled_values(lat + olc.LATITUDE_MAX_, olc.FINAL_LAT_PRECISION_)
+    lng_val = olc_scaled_values(lon + olc.LONGITUDE_MAX_, olc.FINAL_LNG_PRECISION_)
+    digits = []
+    if resolution > olc.PAIR_CODE_LENGTH_:
+        for _ in range(olc.GRID_CODE_LENGTH_):
+            digits.append(
+                lat_val % olc.GRID_ROWS_ * olc.GRID_COLUMNS_
+                + lng_val % olc.GRID_COLUMNS_
+            )
+            lat_val //= olc.GRID_ROWS_
+            lng_val //= olc.GRID_COLUMNS_
+    else:
+        lat_val //= olc.GRID_ROWS_**olc.GRID_CODE_LENGTH_
+        lng_val //= olc.GRID_COLUMNS_**olc.GRID_CODE_LENGTH_
+    for _ in range(olc.PAIR_CODE_LENGTH_ // 2):
+        digits += [lng_val % olc.ENCODING_BASE_, lat_val % olc.ENCODING_BASE_]
+        lat_val //= olc.ENCODING_BASE_
+        lng_val //= olc.ENCODING_BASE_
+
+    alphabet = np.frombuffer(olc.CODE_ALPHABET_.encode(), dtype=np.uint8)
+    columns = [alphabet[digit] for digit in digits[::-1][:resolution]]
+    padding = olc.SEPARATOR_POSITION_ - resolution
+    columns += [np.full(len(lat), ord(olc.PADDING_CHARACTER_))] * max(padding, 0)
+    columns.insert(olc.SEPARATOR_POSITION_, np.full(len(lat), ord(olc.SEPARATOR_)))
+    return scatter_ids(ascii_strings(columns), valid)
+
+
 @pd.api.extensions.register_dataframe_accessor("olc")
 class OLCPandas:
     def __init__(self, df: DataFrame):
@@ -151,15 +313,8 @@ class OLCPandas:
         -------
         (Geo)DataFrame with OLC IDs added
         """
-
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        olc_ids = [latlon_to_olc(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        olc_ids = latlon2olc_array(lats, lons, resolution)
 
         olc_col = OLC_COL
         assign_arg = {olc_col: olc_ids, f"{olc_col}_res": resolution}
@@ -178,7 +333,7 @@ class OLCPandas:
             if OLC_COL not in self._df.columns:
                 raise ValueError(f"Column '{OLC_COL}' not found in DataFrame")
             ids = self._df[OLC_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, olc_to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, olc_to_geo, dggs="olc")
 
     def polyfill(
         self,
@@ -1,5 +1,9 @@
+import math
+from itertools import product
 from typing import Union, List
 
+import numpy as np
+import shapely
 from shapely.geometry import (
     Polygon,
     MultiPolygon,
@@ -14,11 +18,13 @@ from geopandas.geodataframe import GeoDataFrame
 from vgrid.conversion.latlon2dggs import latlon2qtm as latlon_to_qtm
 from vgrid.conversion.dggs2geo.qtm2geo import qtm2geo as qtm_to_geo
 from vgrid.conversion.dggscompact.qtmcompact import qtm_compact
-from vgrid.dggs.qtm import constructGeometry, divideFacet
 from vgrid.utils.io import validate_qtm_resolution
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import cells_matching_predicate
 
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    dggs_ids_to_geodataframe,
+    polygons_from_boundaries,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
 from vgridpandas.utils.const import QTM_COL
 
@@ -62,6 +68,155 @@ INITIAL_FACETS = [
 ]
 
 
+# Facet kinds: "u" and "d" triangles, north and south polar rectangles.
+QTM_UP, QTM_DOWN, QTM_NORTH, QTM_SOUTH = range(4)
+
+# Per kind, the first vertex of each edge bisected by ``divideFacet``.
+QTM_EDGE_STARTS = np.array([[0, 1, 2], [0, 1, 2], [0, 1, 3], [1, 2, 3]])
+
+# Per kind, the vertices of the four children as built by ``divideFacet``:
+# 0-4 index the parent vertices and 5-7 the bisected edge midpoints.
+# Triangles repeat their closing vertex to fill the fifth slot.
+QTM_CHILD_VERTICES = np.array(
+    [
+        [[5, 6, 7, 5, 5], [7, 6, 2, 7, 7], [0, 5, 7, 0, 0], [5, 1, 6, 5, 5]],
+        [[7, 5, 6, 7, 7], [0, 5, 7, 0, 0], [7, 6, 2, 7, 7], [5, 1, 6, 5, 5]],
+        [[5, 6, 7, 5, 5], [7, 6, 2, 3, 7], [0, 5, 7, 0, 0], [5, 1, 6, 5, 5]],
+        [[7, 5, 6, 7, 7], [0, 1, 5, 7, 0], [7, 6, 3, 7, 7], [6, 5, 2, 6, 6]],
+    ]
+)
+QTM_CHILD_KINDS = np.array(
+    [
+        [QTM_DOWN, QTM_UP, QTM_UP, QTM_UP],
+        [QTM_UP, QTM_DOWN, QTM_DOWN, QTM_DOWN],
+        [QTM_DOWN, QTM_NORTH, QTM_UP, QTM_UP],
+        [QTM_UP, QTM_SOUTH, QTM_DOWN, QTM_DOWN],
+    ]
+)
+
+
+def qtm_initial_facets():
+    """Return the octahedral facets as ``(ids, vertices, kinds)`` arrays.
+
+    ``vertices`` holds five (lat, lon) rows per facet, as in ``INITIAL_FACETS``.
+    """
+    ids = np.array([str(i + 1) for i in range(len(INITIAL_FACETS))])
+    vertices = np.array([facet[:5] for facet in INITIAL_FACETS], dtype="float64")
+    kinds = np.array([QTM_NORTH if facet[5] else QTM_SOUTH for facet in INITIAL_FACETS])
+    return ids, vertices, kinds
+
+
+def qtm_edge_midpoints(start, end) -> np.ndarray:
+    """Bisect facet edges given as (lat, lon) arrays, as ``divideFacet`` does.
+
+    Edges along a parallel or a meridian are split at their coordinate mean.
+    Others are split where their great circle crosses the mean latitude, with
+    the same arithmetic as ``findCrossedMeridiansByLatitude`` and ``lonCheck``
+    (``atan2`` and ``acos`` go through ``math`` to match it bit for bit).
+    """
+    mid = (start + end) / 2
+    oblique = (start[:, 0] != end[:, 0]) & (start[:, 1] != end[:, 1])
+    if not oblique.any():
+        return mid
+    lat1, lon1 = start[oblique].T
+    lat2, lon2 = end[oblique].T
+    theta = np.radians(mid[oblique, 0])
+    theta1, lamb1 = np.radians(lat1), np.radians(lon1)
+    theta2, lamb2 = np.radians(lat2), np.radians(lon2)
+    dlamb = lamb2 - lamb1
+    x = np.sin(theta1) * np.cos(theta2) * np.cos(theta) * np.sin(dlamb)
+    y = np.sin(theta1) * np.cos(theta2) * np.cos(theta) * np.cos(dlamb) - np.cos(
+        theta1
+    ) * np.sin(theta2) * np.cos(theta)
+    z = np.cos(theta1) * np.cos(theta2) * np.sin(theta) * np.sin(dlamb)
+    lambm = np.array([math.atan2(-yi, xi) for xi, yi in zip(x, y)])
+    dlambi = np.array([math.acos(r) for r in z / np.sqrt(x * x + y * y)])
+    crossing1 = (np.degrees(lamb1 + lambm - dlambi) + 540) % 360 - 180
+    crossing2 = (np.degrees(lamb1 + lambm + dlambi) + 540) % 360 - 180
+    lesser, greater = np.minimum(lon1, lon2), np.maximum(lon1, lon2)
+    between = (crossing1 > lesser) & (crossing1 < greater)
+    mid[oblique, 1] = np.where(between, crossing1, crossing2)
+    return mid
+
+
+def qtm_divide_facets(vertices, kinds):
+    """Split facets into their four children in bulk, like ``divideFacet``.
+
+    Returns the children's ``(vertices, kinds)``, four per facet in
+    ``divideFacet`` order, so child ``j`` of facet ``i`` sits at ``4 * i + j``.
+    """
+    starts = QTM_EDGE_STARTS[kinds]
+    rows = np.arange(len(kinds))[:, None]
+    midpoints = qtm_edge_midpoints(
+        vertices[rows, starts].reshape(-1, 2),
+        vertices[rows, starts + 1].reshape(-1, 2),
+    ).reshape(-1, 3, 2)
+    points = np.concatenate([vertices, midpoints], axis=1)
+    children = points[rows[:, :, None], QTM_CHILD_VERTICES[kinds]]
+    return children.reshape(-1, 5, 2), QTM_CHILD_KINDS[kinds].ravel()
+
+
+def qtm_facet_polygons(vertices, kinds) -> np.ndarray:
+    """Build facet polygons in lon/lat, as ``constructGeometry``, in bulk."""
+    counts = np.where(kinds >= QTM_NORTH, 5, 4)
+    ring_vertices = vertices[np.arange(5) < counts[:, None]]
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return polygons_from_boundaries(ring_vertices[:, ::-1], offsets)
+
+
+def qtm_descendants(qtm_ids, resolution: int) -> np.ndarray:
+    """Return every descendant at ``resolution`` of same-length QTM ids."""
+    qtm_ids = np.asarray(qtm_ids, dtype=str)
+    if len(qtm_ids) == 0 or len(qtm_ids[0]) >= resolution:
+        return qtm_ids
+    suffix_length = resolution - len(qtm_ids[0])
+    suffixes = np.array(
+        ["".join(digits) for digits in product("0123", repeat=suffix_length)]
+    )
+    return np.char.add(
+        np.repeat(qtm_ids, len(suffixes)), np.tile(suffixes, len(qtm_ids))
+    )
+
+
+def qtm_polyfill_cells(parts, resolution: int):
+    """Traverse the QTM facet tree once over all ``parts`` of a geometry.
+
+    Facets are kept as NumPy vertex arrays and each level is tested in one
+    vectorized call against an ``STRtree`` of the parts. Facets meeting no
+    part are pruned. A facet whose bounding box lies inside a part is
+    accepted whole: descendants never leave the box spanned by their
+    ancestor's vertices, so they are all inside too. Returns ``(interior,
+    boundary, boundary_cells)``: accepted id arrays (one per level), the ids
+    of the remaining facets at ``resolution`` and their polygons.
+    """
+    tree = shapely.STRtree(parts)
+    interior = []
+    qtm_ids, vertices, kinds = qtm_initial_facets()
+    for level in range(1, resolution + 1):
+        cells = qtm_facet_polygons(vertices, kinds)
+        touching = np.zeros(len(cells), dtype=bool)
+        touching[tree.query(cells, predicate="intersects")[0]] = True
+        if level == resolution:
+            return interior, qtm_ids[touching], cells[touching]
+
+        boxes = shapely.envelope(cells)
+        box_index, part_index = tree.query(boxes, predicate="within")
+        proper = shapely.contains_properly(
+            tree.geometries[part_index], boxes[box_index]
+        )
+        inside = np.zeros(len(cells), dtype=bool)
+        inside[box_index[proper]] = True
+        if (touching & inside).any():
+            interior.append(qtm_ids[touching & inside])
+
+        split = touching & ~inside
+        vertices, kinds = qtm_divide_facets(vertices[split], kinds[split])
+        qtm_ids = np.char.add(
+            np.repeat(qtm_ids[split], 4), np.tile(list("0123"), split.sum())
+        )
+    return interior, qtm_ids, np.empty(0, dtype=object)
+
+
 def poly2qtm(
     geometry: Union[MultiPolyOrPoly, MultiLineOrLine],
     resolution: int,
@@ -71,11 +226,14 @@ def poly2qtm(
     """
     Convert polygon or line geometries to QTM cells.
 
-    Mirrors ``polygon2qtm`` / ``polyline2qtm`` in vgrid: walk the facet tree at the
-    target resolution, then optionally compact the id set (same as ``vector2qtm``).
+    Cells are found by :func:`qtm_polyfill_cells` in a single pass over all
+    parts. Facets accepted whole pass every predicate; the remaining facets at
+    ``resolution`` are checked against each part they meet (lines use
+    intersection), so a cell is kept when it satisfies ``predicate`` for one
+    part, as in ``polygon2qtm`` / ``polyline2qtm`` in vgrid. The id set is
+    then optionally compacted (same as ``vector2qtm``).
     """
     resolution = validate_qtm_resolution(resolution)
-    qtm_ids = []
     if isinstance(geometry, (Polygon, LineString)):
         polys = [geometry]
     elif isinstance(geometry, (MultiPolygon, MultiLineString)):
@@ -83,37 +241,29 @@ def poly2qtm(
     else:
         return []
 
-    is_line = isinstance(geometry, (LineString, MultiLineString))
-    for poly in polys:
-        level_facets = {}
-        qtm_id_by_level = {}
-        for lvl in range(resolution):
-            level_facets[lvl] = []
-            qtm_id_by_level[lvl] = []
-            if lvl == 0:
-                for i, facet in enumerate(INITIAL_FACETS):
-                    qtm_id_by_level[0].append(str(i + 1))
-                    level_facets[0].append(facet)
-                    facet_geom = constructGeometry(facet)
-                    if Polygon(facet_geom).intersects(poly) and resolution == 1:
-                        qtm_ids.append(qtm_id_by_level[0][i])
-                        break
-                if resolution == 1:
-                    continue
-            else:
-                for i, parent_facet in enumerate(level_facets[lvl - 1]):
-                    for j, subfacet in enumerate(divideFacet(parent_facet)):
-                        subfacet_geom = constructGeometry(subfacet)
-                        if not Polygon(subfacet_geom).intersects(poly):
-                            continue
-                        new_id = qtm_id_by_level[lvl - 1][i] + str(j)
-                        qtm_id_by_level[lvl].append(new_id)
-                        level_facets[lvl].append(subfacet)
-                        if lvl == resolution - 1:
-                            if is_line or check_predicate(
-                                Polygon(subfacet_geom), poly, predicate
-                            ):
-                                qtm_ids.append(new_id)
+    polys = [poly for poly in polys if not poly.is_empty]
+    if not polys:
+        return []
+    if isinstance(geometry, (LineString, MultiLineString)):
+        predicate = "intersects"
+
+    interior, boundary_ids, boundary_cells = qtm_polyfill_cells(polys, resolution)
+    cell_index, part_index = shapely.STRtree(polys).query(
+        boundary_cells, predicate="intersects"
+    )
+    kept = np.zeros(len(boundary_ids), dtype=bool)
+    for part in np.unique(part_index):
+        cells = cell_index[part_index == part]
+        kept[cells] |= cells_matching_predicate(
+            boundary_cells[cells], polys[part], predicate
+        )
+
+    qtm_ids = []
+    for prefixes in interior:
+        if not compact:
+            prefixes = qtm_descendants(prefixes, resolution)
+        qtm_ids.extend(prefixes.tolist())
+    qtm_ids.extend(boundary_ids[kept].tolist())
 
     if compact and qtm_ids:
         return qtm_compact(qtm_ids)
@@ -178,7 +328,7 @@ class QTMPandas:
             if QTM_COL not in self._df.columns:
                 raise ValueError(f"Column '{QTM_COL}' not found in DataFrame")
             ids = self._df[QTM_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, qtm_to_geo)
+        return dggs_ids_to_geodataframe(self._df, ids, qtm_to_geo, dggs="qtm")
 
     def polyfill(
         self,
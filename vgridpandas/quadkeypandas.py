@@ -6,13 +6,22 @@ from shapely.geometry import (
     MultiLineString,
 )
 import pandas as pd
-import geopandas as gpd
 
-from vgrid.conversion.latlon2dggs import latlon2quadkey as latlon_to_quadkey
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    box_boundaries,
+    dggs_ids_to_geodataframe,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import latlon_arrays, scatter_ids
+from vgridpandas.utils.tile_helpers import (
+    latlon2tile_xy,
+    quadkey2tile_xyz,
+    tile_xy2quadkey,
+    tile_xy2bounds,
+    tile_polyfill_xy,
+)
 
 from vgrid.conversion.dggs2geo.quadkey2geo import quadkey2geo as quadkey_to_geo
 from vgridpandas.utils.const import QUADKEY_COL 
@@ -21,8 +30,6 @@ AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
 from typing import Union, Set
-from vgrid.dggs import mercantile
-from vgrid.utils.geometry import check_predicate
 from vgrid.conversion.dggscompact.quadkeycompact import quadkey_compact
 from vgrid.utils.io import validate_quadkey_resolution
 
@@ -65,31 +72,22 @@ def poly2quadkey(
 
     quadkey_ids = []
     for poly in polys:
-        min_lon, min_lat, max_lon, max_lat = poly.bounds
-        tiles = mercantile.tiles(min_lon, min_lat, max_lon, max_lat, resolution)
-        for tile in tiles:
-            z, x, y = tile.z, tile.x, tile.y
-            bounds = mercantile.bounds(x, y, z)
-            min_lat, min_lon = bounds.south, bounds.west
-            max_lat, max_lon = bounds.north, bounds.east
-            quadkey_id = mercantile.quadkey(tile)
-            cell_polygon = Polygon(
-                [
-                    [min_lon, min_lat],
-                    [max_lon, min_lat],
-                    [max_lon, max_lat],
-                    [min_lon, max_lat],
-                    [min_lon, min_lat],
-                ]
-            )
-            if check_predicate(cell_polygon, poly, predicate):
-                quadkey_ids.append(quadkey_id)
+        if poly.is_empty:
+            continue
+        x, y = tile_polyfill_xy(poly, resolution, predicate)
+        quadkey_ids.extend(tile_xy2quadkey(x, y, resolution).tolist())
 
     if compact:
         return quadkey_compact(quadkey_ids)
     return quadkey_ids
 
 
+def quadkey_boundaries(quadkey_ids):
+    """Return ``(coords, offsets)`` cell rings for an array of quadkey ids."""
+    tile_x, tile_y, zoom = quadkey2tile_xyz(quadkey_ids)
+    return box_boundaries(*tile_xy2bounds(tile_x, tile_y, zoom))
+
+
 def polyfill_row(geometry, resolution, predicate=None, compact=False) -> list:
     """Return cell ids covering a single row geometry."""
     if isinstance(geometry, (Polygon, MultiPolygon)):
@@ -117,6 +115,7 @@ class QuadkeyPandas:
         lat_col: str = "lat",
         lon_col: str = "lon",
         set_index: bool = False,
+        as_zxy: bool = False,
     ) -> AnyDataFrame:
         """Adds quadkey ID to (Geo)DataFrame.
 
@@ -135,28 +134,37 @@ class QuadkeyPandas:
             Name of the longitude column (if used), default 'lon'
         set_index : bool
             If True, the columns with quadkey ID is set as index, default 'True'
+        as_zxy : bool
+            If True, integer tile columns `quadkey_x` and `quadkey_y` are added
+            instead of quadkey IDs (the zoom is kept in `quadkey_res`), default False
 
         Returns
         -------
         (Geo)DataFrame with quadkey IDs added
         """
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        quadkey_ids = [
-            latlon_to_quadkey(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        resolution = validate_quadkey_resolution(resolution)
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        tile_x, tile_y = latlon2tile_xy(lats, lons, resolution)
 
         quadkey_col = QUADKEY_COL
-        assign_arg = {quadkey_col: quadkey_ids, f"{quadkey_col}_res": resolution}
+        if as_zxy:
+            index_col = [f"{quadkey_col}_x", f"{quadkey_col}_y"]
+            assign_arg = {
+                f"{quadkey_col}_res": resolution,
+                index_col[0]: tile_x,
+                index_col[1]: tile_y,
+            }
+        else:
+            valid = tile_x >= 0
+            quadkey_ids = scatter_ids(
+                tile_xy2quadkey(tile_x[valid], tile_y[valid], resolution), valid
+            )
+            index_col = quadkey_col
+            assign_arg = {quadkey_col: quadkey_ids, f"{quadkey_col}_res": resolution}
         df = self._df.assign(**assign_arg)
         if set_index:
-            return df.set_index(quadkey_col)
+            return df.set_index(index_col)
         return df
 
     def quadkey2geo(self, quadkey_col: str = None) -> GeoDataFrame:
@@ -169,7 +177,13 @@ class QuadkeyPandas:
             if QUADKEY_COL not in self._df.columns:
                 raise ValueError(f"Column '{QUADKEY_COL}' not found in DataFrame")
             ids = self._df[QUADKEY_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, quadkey_to_geo)
+        return dggs_ids_to_geodataframe(
+            self._df,
+            ids,
+            quadkey_to_geo,
+            to_boundaries=quadkey_boundaries,
+            dggs="quadkey",
+        )
 
     def polyfill(
         self,
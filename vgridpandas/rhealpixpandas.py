@@ -1,5 +1,8 @@
 from typing import Union, Optional
 from collections import deque
+from math import pi, sqrt
+import numpy as np
+import shapely
 from shapely.geometry import (
     Polygon,
     MultiPolygon,
@@ -8,19 +11,34 @@ from shapely.geometry import (
     box,
 )
 import pandas as pd
-import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import cell_geometry, dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import (
+    ascii_strings,
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 from vgrid.conversion.latlon2dggs import latlon2rhealpix as latlon_to_rhealpix
 from vgrid.conversion.dggs2geo.rhealpix2geo import rhealpix2geo as rhealpix_to_geo
 from vgrid.conversion.dggscompact.rhealpixcompact import rhealpix_compact
-from vgrid.utils.geometry import check_predicate
+from vgrid.utils.geometry import (
+    check_predicate,
+    rhealpix_cell_to_polygon,
+    shift_balanced,
+    shift_east,
+    shift_west,
+)
+from vgrid.utils.antimeridian import fix_polygon
+from vgridpandas.utils.predicate_helpers import filter_cells
 from vgrid.utils.io import validate_rhealpix_resolution
 from vgridpandas.utils.const import RHEALPIX_COL
 from vgrid.dggs.rhealpixdggs.dggs import RHEALPixDGGS
+from vgrid.dggs.rhealpixdggs.cell import CELLS0
 from vgrid.dggs.rhealpixdggs.ellipsoids import WGS84_ELLIPSOID
+from vgrid.dggs.rhealpixdggs.utils import auth_lat, auth_rad
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
@@ -29,6 +47,24 @@ rhealpix_dggs = RHEALPixDGGS(
 )
 
 
+def rhealpix_cell_to_geo(cell, fix_antimeridian: Optional[str] = None) -> Polygon:
+    """Return the polygon of an rHEALPix cell object, as built by ``rhealpix2geo``.
+
+    Works on the cell itself, so cells found while walking the grid are not
+    formatted to ids and parsed back.
+    """
+    cell_polygon = rhealpix_cell_to_polygon(cell)
+    if fix_antimeridian in ("shift", "shift_balanced"):
+        return shift_balanced(cell_polygon, threshold_west=-149, threshold_east=149)
+    if fix_antimeridian == "shift_west":
+        return shift_west(cell_polygon, threshold=-149)
+    if fix_antimeridian == "shift_east":
+        return shift_east(cell_polygon, threshold=149)
+    if fix_antimeridian == "split":
+        return fix_polygon(cell_polygon)
+    return cell_polygon
+
+
 def poly2rhealpix(
     geometry,
     resolution: int,
@@ -36,7 +72,12 @@ def poly2rhealpix(
     compact: bool = False,
     fix_antimeridian: Optional[str] = None,
 ) -> list:
-    """Convert polygon or line geometries to rHEALPix grid cells."""
+    """Convert polygon or line geometries to rHEALPix grid cells.
+
+    Cells are flood-filled from the cell at the bbox center. Each cell polygon
+    is built once, from the cell object, and reused for the predicate; cells
+    outside the bbox stop the walk and are not tested again.
+    """
     resolution = validate_rhealpix_resolution(resolution)
     rhealpix_ids = []
     if isinstance(geometry, (Polygon, LineString)):
@@ -46,6 +87,16 @@ def poly2rhealpix(
     else:
         return []
 
+    visited_cells = {}
+
+    def to_geo(cell_id, fix_antimeridian=None):
+        return rhealpix_cell_to_geo(visited_cells[cell_id], fix_antimeridian)
+
+    def cell_polygon_of(cell_id):
+        return cell_geometry(
+            "rhealpix", cell_id, to_geo, fix_antimeridian=fix_antimeridian
+        )
+
     for poly in polys:
         if poly is None or poly.is_empty:
             continue
@@ -57,42 +108,38 @@ def poly2rhealpix(
         seed_point = (bbox_center_lon, bbox_center_lat)
         seed_cell = rhealpix_dggs.cell_from_point(resolution, seed_point, plane=False)
         seed_cell_id = str(seed_cell)
-        seed_cell_polygon = rhealpix_to_geo(
-            seed_cell_id, fix_antimeridian=fix_antimeridian
-        )
+        visited_cells.clear()
+        visited_cells[seed_cell_id] = seed_cell
+        seed_cell_polygon = cell_polygon_of(seed_cell_id)
 
         if seed_cell_polygon.contains(bbox_polygon):
             if check_predicate(seed_cell_polygon, poly, predicate):
                 rhealpix_ids.append(seed_cell_id)
             continue
 
-        covered_cells = set()
-        queue = deque([seed_cell])
+        shapely.prepare(bbox_polygon)
+        candidate_ids = []
+        candidate_polygons = []
+        queue = deque([seed_cell_id])
         while queue:
-            current_cell = queue.popleft()
-            current_cell_id = str(current_cell)
-            if current_cell_id in covered_cells:
-                continue
-            covered_cells.add(current_cell_id)
-
-            cell_polygon = rhealpix_to_geo(
-                current_cell_id, fix_antimeridian=fix_antimeridian
-            )
+            current_cell_id = queue.popleft()
+            if current_cell_id == seed_cell_id:
+                cell_polygon = seed_cell_polygon
+            else:
+                cell_polygon = cell_polygon_of(current_cell_id)
             if not cell_polygon.intersects(bbox_polygon):
                 continue
+            candidate_ids.append(current_cell_id)
+            candidate_polygons.append(cell_polygon)
 
-            neighbors = current_cell.neighbors(plane=False)
-            for _, neighbor in neighbors.items():
+            neighbors = visited_cells[current_cell_id].neighbors(plane=False)
+            for neighbor in neighbors.values():
                 neighbor_id = str(neighbor)
-                if neighbor_id not in covered_cells:
-                    queue.append(neighbor)
+                if neighbor_id not in visited_cells:
+                    visited_cells[neighbor_id] = neighbor
+                    queue.append(neighbor_id)
 
-        poly_ids = []
-        for cell_id in covered_cells:
-            cell_polygon = rhealpix_to_geo(cell_id, fix_antimeridian=fix_antimeridian)
-            if not check_predicate(cell_polygon, poly, predicate):
-                continue
-            poly_ids.append(cell_id)
+        poly_ids = filter_cells(candidate_ids, candidate_polygons, poly, predicate)
 
         if compact and poly_ids:
             poly_ids = list(rhealpix_compact(poly_ids))
@@ -131,6 +178,192 @@ def polyfill_row(
     return list(tokens)
 
 
+def rhealpix_authalic_latitudes(phi, e: float) -> np.ndarray:
+    """Return the authalic latitudes of latitudes ``phi``, in radians.
+
+    ``e`` is the ellipsoid eccentricity. For flattenings up to 1/150 this is
+    the power series of ``rhealpixdggs.utils.auth_lat``, with the coefficients
+    grouped as there so results match it bit for bit. Larger flattenings,
+    where ``auth_lat`` switches to its direct formula, go through ``auth_lat``.
+    """
+    if e == 0:
+        return phi
+    if abs(1 - sqrt(1 - e**2)) > 1 / 150:
+        return np.array([auth_lat(p, e, radians=True) for p in phi.tolist()])
+    n = (1 - sqrt(1 - e**2)) / (1 + sqrt(1 - e**2))
+    coefficients = [
+        n
+        * (
+            -4 / 3
+            + n
+            * (
+                -4 / 45
+                + n
+                * (
+                    88 / 315
+                    + n * (538 / 4725 + n * (20824 / 467775 + n * (-44732 / 2837835)))
+                )
+            )
+        ),
+        n
+        * (
+            n
+            * (
+                34 / 45
+                + n
+                * (
+                    8 / 105
+                    + n
+                    * (
+                        -2482 / 14175
+                        + n * (-37192 / 467775 + n * (-12467764 / 212837625))
+                    )
+                )
+            )
+        ),
+        n
+        * (
+            n
+            * (
+                n
+                * (
+                    -1532 / 2835
+                    + n
+                    * (-898 / 14175 + n * (54968 / 467775 + n * 100320856 / 1915538625))
+                )
+            )
+        ),
+        n
+        * (
+            n
+            * (
+                n
+                * (
+                    n
+                    * (6007 / 14175 + n * (24496 / 467775 + n * (-5884124 / 70945875)))
+                )
+            )
+        ),
+        n * (n * (n * (n * (n * (-23356 / 66825 + n * (-839792 / 19348875)))))),
+        n * (n * (n * (n * (n * (n * 570284222 / 1915538625))))),
+    ]
+    series = coefficients[0] * np.sin(2 * phi)
+    for k, coefficient in enumerate(coefficients[1:], start=2):
+        series = series + coefficient * np.sin(2 * k * phi)
+    return phi + series
+
+
+def rhealpix_project(lats, lons, dggs: RHEALPixDGGS = rhealpix_dggs) -> tuple:
+    """Return the planar rHEALPix ``(x, y)`` of coordinate arrays on ``dggs``.
+
+    Vectorized ``dggs.rhealpix``: coordinates are wrapped, mapped to authalic
+    latitudes of the ``dggs`` ellipsoid and the HEALPix projection, then the
+    polar triangles are rotated into the north and south squares.
+    """
+    lam = np.where((lons < -180) | (lons >= 180), np.mod(lons, 360), lons)
+    lam = np.where(lam >= 180, lam - 360, lam)
+    phi = np.where((lats < -180) | (lats >= 180), np.mod(lats, 360), lats)
+    phi = np.where(phi >= 180, phi - 360, phi)
+    phi = np.where(np.abs(phi) <= 90, phi, phi - np.copysign(180, phi))
+    lam, phi = np.deg2rad(lam), np.deg2rad(phi)
+    beta = rhealpix_authalic_latitudes(phi, dggs.ellipsoid.e)
+
+    # HEALPix projection of the authalic sphere
+    polar = np.abs(beta) > np.arcsin(2.0 / 3)
+    sigma = np.sqrt(3 * (1 - np.abs(np.sin(beta))))
+    cap = np.minimum(np.floor(2 * lam / pi + 2), 3)
+    lamc = -3 * pi / 4 + (pi / 2) * cap
+    x = np.where(polar, lamc + (lam - lamc) * sigma, lam)
+    y = np.where(polar, np.sign(beta) * pi / 4 * (2 - sigma), 3 * pi / 8 * np.sin(beta))
+
+    # combine_triangles: quarter turns of each polar triangle about its tip
+    north = y > pi / 4
+    south = y < -pi / 4
+    triangle = np.select([x < -pi / 2, x < 0, x < pi / 2], [0, 1, 2], 3)
+    dx = x - (-3 * pi / 4 + triangle * pi / 2)
+    dy = y - np.sign(y) * pi / 2
+    ns, ss = dggs.north_square, dggs.south_square
+    turns = np.where(north, triangle - ns, ss - triangle) % 4
+    rotated_x = np.choose(turns, [dx, -dy, -dx, dy])
+    rotated_y = np.choose(turns, [dy, dx, -dy, -dx])
+    x = np.where(north, rotated_x + (-3 * pi / 4 + ns * pi / 2), x)
+    x = np.where(south, rotated_x + (-3 * pi / 4 + ss * pi / 2), x)
+    y = np.where(north, rotated_y + pi / 2, y)
+    y = np.where(south, rotated_y - pi / 2, y)
+    R_A = auth_rad(dggs.ellipsoid.a, dggs.ellipsoid.e)
+    return R_A * x, R_A * y
+
+
+def latlon2rhealpix_array(lats, lons, resolution: int) -> np.ndarray:
+    """Convert arrays of latitudes and longitudes to rHEALPix ids.
+
+    Points are projected with ``rhealpix_project``, then the resolution 0
+    square and the base-3 row and column of each point are found as in
+    ``RHEALPixDGGS.cell_from_point``. Points the planar lookup cannot place
+    (none on the WGS84 ellipsoid in practice) go through ``latlon2rhealpix``.
+    Rows with non-finite coordinates get ``None``.
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): rHEALPix resolution [0..15]
+
+    Returns:
+        numpy.ndarray: object array of rHEALPix ids
+    """
+    resolution = validate_rhealpix_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    lat, lon = lats[valid], lons[valid]
+    x, y = rhealpix_project(lat, lon)
+
+    R = rhealpix_dggs.ellipsoid.R_A
+    ns, ss = rhealpix_dggs.north_square, rhealpix_dggs.south_square
+    equatorial = (y >= -R * pi / 4) & (y <= R * pi / 4)
+    squares = np.select(
+        [
+            (y > R * pi / 4)
+            & (y < R * 3 * pi / 4)
+            & (x > R * (-pi + ns * (pi / 2)))
+            & (x < R * (-pi / 2 + ns * (pi / 2))),
+            (y > -R * 3 * pi / 4)
+            & (y < -R * pi / 4)
+            & (x > R * (-pi + ss * (pi / 2)))
+            & (x < R * (-pi / 2 + ss * (pi / 2))),
+            equatorial & (x >= -R * pi) & (x < -R * pi / 2),
+            equatorial & (x >= -R * pi / 2) & (x < 0),
+            equatorial & (x >= 0) & (x < R * pi / 2),
+            equatorial & (x >= R * pi / 2) & (x < R * pi),
+        ],
+        [0, 5, 1, 2, 3, 4],
+        -1,
+    )
+    columns = [np.frombuffer("".join(CELLS0).encode(), dtype=np.uint8)[squares]]
+    unplaced = squares < 0
+    if resolution > 0:
+        N = rhealpix_dggs.N_side
+        w = rhealpix_dggs.cell_width(0)
+        smidgen = 0.5 * rhealpix_dggs.cell_width(rhealpix_dggs.max_resolution) / w
+        ul_vertices = np.array([rhealpix_dggs.ul_vertex[s0] for s0 in CELLS0])
+        offsets = []
+        for coord, ul in ((y, ul_vertices[squares, 1]), (x, ul_vertices[squares, 0])):
+            d = np.abs(coord - ul) / w
+            d = np.where(d == 1, d - smidgen, d)
+            offsets.append((d * N**resolution).astype(np.int64))
+        rows, cols = offsets
+        unplaced |= (rows >= N**resolution) | (cols >= N**resolution)
+        child_order = np.array(
+            [[rhealpix_dggs.child_order[(i, j)] for j in range(N)] for i in range(N)]
+        )
+        for power in N ** np.arange(resolution - 1, -1, -1):
+            columns.append(ord("0") + child_order[rows // power % N, cols // power % N])
+    rhealpix_ids = np.array(ascii_strings(columns), dtype=object)
+    for i in np.flatnonzero(unplaced):
+        rhealpix_ids[i] = latlon_to_rhealpix(lat[i], lon[i], resolution)
+    return scatter_ids(rhealpix_ids, valid)
+
+
 @pd.api.extensions.register_dataframe_accessor("rhealpix")
 class rHEALPixPandas:
     def __init__(self, df: DataFrame):
@@ -165,16 +398,8 @@ class rHEALPixPandas:
         -------
         (Geo)DataFrame with rHEALPix rhp_ids added
         """
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        rhealpix_ids = [
-            latlon_to_rhealpix(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        rhealpix_ids = latlon2rhealpix_array(lats, lons, resolution)
 
         rhealpix_col = RHEALPIX_COL
         assign_arg = {rhealpix_col: rhealpix_ids, f"{rhealpix_col}_res": resolution}
@@ -197,7 +422,11 @@ class rHEALPixPandas:
                 raise ValueError(f"Column '{RHEALPIX_COL}' not found in DataFrame")
             ids = self._df[RHEALPIX_COL]
         return dggs_ids_to_geodataframe(
-            self._df, ids, rhealpix_to_geo, fix_antimeridian=fix_antimeridian
+            self._df,
+            ids,
+            rhealpix_to_geo,
+            fix_antimeridian=fix_antimeridian,
+            dggs="rhealpix",
         )
 
     def polyfill(
@@ -1,30 +1,240 @@
 """S2Pandas module for S2 cell operations on pandas DataFrames and GeoDataFrames."""
 
+import math
 from typing import Union, Optional
+import numpy as np
+import shapely
 from shapely.geometry import (
     Polygon,
     MultiPolygon,
     LineString,
     MultiLineString,
+    box,
 )
 from vgrid.dggs import s2
-from vgrid.utils.geometry import check_predicate
+from vgridpandas.utils.predicate_helpers import filter_cells, prepared_geometry
 from vgrid.utils.io import validate_s2_resolution
 import pandas as pd
-import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import cell_geometry, dggs_ids_to_geodataframe
 from vgridpandas.utils.bin_helpers import aggregate_bin
-from vgrid.conversion.latlon2dggs import latlon2s2 as latlon_to_s2
+from vgridpandas.utils.latlon_helpers import (
+    latlon_arrays,
+    scatter_ids,
+    valid_latlon_mask,
+)
 from vgrid.conversion.dggs2geo.s22geo import s22geo as s2_to_geo
 from vgridpandas.utils.const import S2_COL
 
 AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
+S2_LOOKUP_POS = np.array(s2.LOOKUP_POS, dtype=np.uint64)
+
+# Per face: ((axis, sign) of u, (axis, sign) of v, normal axis), so that
+# u = sign * p[axis] / p[normal] as in ``valid_face_xyz_to_uv``.
+S2_FACE_UV_AXES = [
+    ((1, 1), (2, 1), 0),
+    ((0, -1), (2, 1), 1),
+    ((0, -1), (1, -1), 2),
+    ((2, 1), (1, 1), 0),
+    ((2, 1), (0, -1), 1),
+    ((1, -1), (0, -1), 2),
+]
+
+
+def s2_cell_bound(cell) -> Optional[Polygon]:
+    """Return the lat/lng bound of an ``s2.Cell`` as a lon/lat box.
+
+    The box contains every descendant cell polygon. ``None`` is returned when
+    the bound wraps the antimeridian or spans all longitudes.
+    """
+    bound = cell.get_rect_bound()
+    lat, lng = bound.lat(), bound.lng()
+    if lng.is_inverted() or lng.is_full():
+        return None
+    return box(
+        math.degrees(lng.lo()),
+        math.degrees(lat.lo()),
+        math.degrees(lng.hi()),
+        math.degrees(lat.hi()),
+    )
+
+
+def s2_child_ids(cell_id, level: int) -> np.ndarray:
+    """Return the uint64 ids of all descendants of ``cell_id`` at ``level``."""
+    begin = cell_id.child_begin(level).id()
+    step = 2 * s2.CellId.lsb_for_level(level)
+    count = (cell_id.child_end(level).id() - begin) // step
+    return np.uint64(begin) + np.uint64(step) * np.arange(count, dtype=np.uint64)
+
+
+def s2_id_tokens(cell_ids, level: int) -> list:
+    """Format uint64 S2 cell ids at ``level`` as tokens, as ``CellId.to_token``.
+
+    Every cell at one level has its lowest set bit in the same hex digit, so
+    all tokens share one length and are formatted as a single array.
+    """
+    length = 16 - (2 * (s2.CellId.MAX_LEVEL - level)) // 4
+    shifts = np.arange(60, 60 - 4 * length, -4, dtype=np.uint64)
+    cell_ids = np.asarray(cell_ids, dtype=np.uint64)
+    digits = (cell_ids[:, None] >> shifts) & np.uint64(0xF)
+    chars = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)[digits]
+    return chars.view(f"S{length}").ravel().astype(str).tolist()
+
+
+def s2_leaf_ids(lats, lons) -> np.ndarray:
+    """Return the uint64 ids of the leaf cells holding lat/lon points.
+
+    Runs ``CellId.from_lat_lng`` on whole arrays: unit vectors, face and
+    (u, v) projection, the quadratic (s, t) transform, then the Hilbert curve
+    position through the ``LOOKUP_POS`` table, 4 bits of i and j at a time.
+    """
+    phi, theta = np.radians(lats), np.radians(lons)
+    cosphi = np.cos(phi)
+    xyz = np.stack([np.cos(theta) * cosphi, np.sin(theta) * cosphi, np.sin(phi)])
+    ax, ay, az = np.abs(xyz)
+    face = np.where(ax > ay, np.where(ax > az, 0, 2), np.where(ay > az, 1, 2))
+    face = face + 3 * (xyz[face, np.arange(len(face))] < 0)
+
+    u, v = np.empty_like(ax), np.empty_like(ax)
+    for f, ((u_axis, u_sign), (v_axis, v_sign), axis) in enumerate(S2_FACE_UV_AXES):
+        on_face = face == f
+        normal = xyz[axis, on_face]
+        u[on_face] = u_sign * xyz[u_axis, on_face] / normal
+        v[on_face] = v_sign * xyz[v_axis, on_face] / normal
+
+    i, j = (s2_st_to_ij(s2_uv_to_st(coord)) for coord in (u, v))
+    n = face.astype(np.uint64) << np.uint64(s2.CellId.POS_BITS - 1)
+    bits = face.astype(np.uint64) & np.uint64(s2.SWAP_MASK)
+    mask = np.uint64((1 << s2.LOOKUP_BITS) - 1)
+    for k in range(7, -1, -1):
+        shift = np.uint64(k * s2.LOOKUP_BITS)
+        bits = bits + (((i >> shift) & mask) << np.uint64(s2.LOOKUP_BITS + 2))
+        bits = bits + (((j >> shift) & mask) << np.uint64(2))
+        bits = S2_LOOKUP_POS[bits]
+        n |= (bits >> np.uint64(2)) << np.uint64(2 * k * s2.LOOKUP_BITS)
+        bits &= np.uint64(s2.SWAP_MASK | s2.INVERT_MASK)
+    return n * np.uint64(2) + np.uint64(1)
+
+
+def s2_uv_to_st(u) -> np.ndarray:
+    """Quadratic ``CellId.uv_to_st`` over an array."""
+    st = np.empty_like(u)
+    positive = u >= 0
+    st[positive] = 0.5 * np.sqrt(1 + 3 * u[positive])
+    st[~positive] = 1 - 0.5 * np.sqrt(1 - 3 * u[~positive])
+    return st
+
+
+def s2_st_to_ij(st) -> np.ndarray:
+    """``CellId.st_to_ij`` over an array, as uint64 leaf coordinates."""
+    size = s2.CellId.MAX_SIZE
+    return np.clip(np.floor(size * st), 0, size - 1).astype(np.uint64)
+
+
+def s2_parent_ids(cell_ids, level: int) -> np.ndarray:
+    """Return the ids of the ancestors at ``level`` of uint64 cell ids."""
+    lsb = np.uint64(s2.CellId.lsb_for_level(level))
+    return (cell_ids & ~(lsb - np.uint64(1))) | lsb
+
+
+def latlon2s2_array(lats, lons, resolution: int, as_int: bool = False):
+    """Convert arrays of latitudes and longitudes to S2 cells in one batch.
+
+    Gives the same cells as ``latlon2s2`` point by point (see
+    :func:`s2_leaf_ids`). Rows with non-finite coordinates get ``None`` (or
+    ``0``, the S2 null id, when ``as_int`` is True).
+
+    Args:
+        lats (array-like): Latitudes in decimal degrees
+        lons (array-like): Longitudes in decimal degrees
+        resolution (int): S2 resolution level [0..30]
+        as_int (bool): Return uint64 cell ids instead of tokens
+
+    Returns:
+        numpy.ndarray: uint64 array if ``as_int`` else object array of tokens
+    """
+    resolution = validate_s2_resolution(resolution)
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = valid_latlon_mask(lats, lons)
+    cell_ids = s2_parent_ids(s2_leaf_ids(lats[valid], lons[valid]), resolution)
+    if as_int:
+        s2_ids = np.zeros(len(lats), dtype=np.uint64)
+        s2_ids[valid] = cell_ids
+        return s2_ids
+    return scatter_ids(s2_id_tokens(cell_ids, resolution), valid)
+
+
+class S2PolygonRegion:
+    """Bulk cell tests against a shapely geometry in lon/lat.
+
+    A prepared copy of the geometry (exterior and holes) is made once. Cells
+    are tested through their lat/lng bound (see :func:`s2_cell_bound`), so no
+    cell whose polygon meets the geometry is ever dropped. Bounds that wrap
+    the antimeridian fall back to the geometry's lat/lng rectangle.
+    """
+
+    def __init__(self, geometry):
+        self.geometry = prepared_geometry(geometry)
+        min_lon, min_lat, max_lon, max_lat = geometry.bounds
+        self.rect = s2.LatLngRect(
+            s2.LatLng.from_degrees(min_lat, min_lon),
+            s2.LatLng.from_degrees(max_lat, max_lon),
+        )
+
+    def classify(self, cells):
+        """Return ``(inside, touching)`` masks for cells, tested in bulk.
+
+        ``inside`` cells have their whole bound in the geometry, so all of
+        their descendants are too. ``touching`` cells may meet the geometry.
+        """
+        bounds = np.array([s2_cell_bound(cell) for cell in cells], dtype=object)
+        wrapped = np.array([bound is None for bound in bounds], dtype=bool)
+        inside = shapely.contains(self.geometry, bounds)
+        touching = shapely.intersects(self.geometry, bounds)
+        touching[wrapped] = [
+            self.rect.may_intersect(cell) for cell in np.asarray(cells)[wrapped]
+        ]
+        return inside, touching
+
+
+def s2_polyfill_cells(geometry, resolution: int):
+    """Traverse S2 cells top-down from the six faces over ``geometry``.
+
+    A cell whose bound lies inside the geometry is accepted whole, without
+    subdividing it. Cells that only straddle the boundary are split until
+    ``resolution``. Returns ``(interior, boundary)`` lists of ``s2.CellId``:
+    accepted cells at or above ``resolution`` and boundary cells at it.
+    """
+    region = S2PolygonRegion(geometry)
+    interior, boundary = [], []
+    cells = list(s2.FACE_CELLS)
+    while cells:
+        inside, touching = region.classify(cells)
+        next_cells = []
+        for cell, is_inside, is_touching in zip(cells, inside, touching):
+            if is_inside:
+                interior.append(cell.id())
+            elif not is_touching:
+                continue
+            elif cell.level() == resolution:
+                boundary.append(cell.id())
+            else:
+                next_cells.extend(cell.subdivide())
+        cells = next_cells
+    return interior, boundary
+
 
 def poly2s2(geometry, resolution, predicate=None, compact=False, fix_antimeridian=None):
-    """Convert polygon or line geometries to S2 grid cell tokens."""
+    """Convert polygon or line geometries to S2 grid cell tokens.
+
+    Cells are found by :func:`s2_polyfill_cells`. Interior cells pass every
+    predicate, so only boundary cells are converted to polygons and checked.
+    With ``compact`` the interior parents are kept whole; otherwise they are
+    expanded to ``resolution`` by child id ranges.
+    """
     resolution = validate_s2_resolution(resolution)
     s2_tokens = []
     if isinstance(geometry, (Polygon, LineString)):
@@ -35,28 +245,25 @@ def poly2s2(geometry, resolution, predicate=None, compact=False, fix_antimeridia
         return []
 
     for poly in polys:
-        min_lon, min_lat, max_lon, max_lat = poly.bounds
-        level = resolution
-        coverer = s2.RegionCoverer()
-        coverer.min_level = level
-        coverer.max_level = level
-        region = s2.LatLngRect(
-            s2.LatLng.from_degrees(min_lat, min_lon),
-            s2.LatLng.from_degrees(max_lat, max_lon),
-        )
-        covering = coverer.get_covering(region)
-        cell_ids = covering
+        if poly.is_empty:
+            continue
+        interior, boundary = s2_polyfill_cells(poly, resolution)
+        cell_polygons = [
+            cell_geometry(
+                "s2", cell_id.to_token(), s2_to_geo, fix_antimeridian=fix_antimeridian
+            )
+            for cell_id in boundary
+        ]
+        kept = filter_cells(boundary, cell_polygons, poly, predicate)
         if compact:
-            covering = s2.CellUnion(covering)
-            covering.normalize()
-            cell_ids = covering.cell_ids()
-
-        for cell_id in cell_ids:
-            cell_token = s2.CellId.to_token(cell_id)
-            cell_polygon = s2_to_geo(cell_token, fix_antimeridian=fix_antimeridian)
-            if not check_predicate(cell_polygon, poly, predicate):
-                continue
-            s2_tokens.append(cell_token)
+            covering = s2.CellUnion(interior + kept)
+            s2_tokens.extend(cell_id.to_token() for cell_id in covering.cell_ids())
+            continue
+        cell_ids = np.concatenate(
+            [s2_child_ids(cell_id, resolution) for cell_id in interior]
+            + [np.array([cell_id.id() for cell_id in kept], dtype=np.uint64)]
+        )
+        s2_tokens.extend(s2_id_tokens(np.sort(cell_ids), resolution))
 
     return s2_tokens
 
@@ -99,6 +306,7 @@ class S2Pandas:
         lat_col: str = "lat",
         lon_col: str = "lon",
         set_index: bool = False,
+        as_int: bool = False,
     ) -> AnyDataFrame:
         """Adds S2 token to (Geo)DataFrame.
 
@@ -117,6 +325,9 @@ class S2Pandas:
             Name of the longitude column (if used), default 'lon'
         set_index : bool
             If True, the column with S2 token is set as index, default False
+        as_int : bool
+            If True, S2 cell ids are stored as uint64 instead of tokens,
+            default False
 
         Returns
         -------
@@ -124,14 +335,8 @@ class S2Pandas:
 
         """
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
-
-        s2_tokens = [latlon_to_s2(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        s2_tokens = latlon2s2_array(lats, lons, resolution, as_int=as_int)
 
         s2_col = S2_COL
         df = self._df.assign(**{s2_col: s2_tokens, f"{s2_col}_res": resolution})
@@ -151,8 +356,14 @@ class S2Pandas:
             if S2_COL not in self._df.columns:
                 raise ValueError(f"Column '{S2_COL}' not found in DataFrame")
             ids = self._df[S2_COL]
+        if pd.api.types.is_integer_dtype(ids):
+            ids = ids.map(lambda cell_id: s2.CellId(int(cell_id)).to_token())
         return dggs_ids_to_geodataframe(
-            self._df, ids, s2_to_geo, fix_antimeridian=fix_antimeridian
+            self._df,
+            ids,
+            s2_to_geo,
+            fix_antimeridian=fix_antimeridian,
+            dggs="s2",
         )
 
     def polyfill(
@@ -6,13 +6,22 @@ from shapely.geometry import (
     MultiLineString,
 )
 import pandas as pd
-import geopandas as gpd
 from pandas.core.frame import DataFrame
 from geopandas.geodataframe import GeoDataFrame
-from vgridpandas.utils.geo_helpers import dggs_ids_to_geodataframe
+from vgridpandas.utils.geo_helpers import (
+    box_boundaries,
+    dggs_ids_to_geodataframe,
+)
 from vgridpandas.utils.bin_helpers import aggregate_bin
+from vgridpandas.utils.latlon_helpers import latlon_arrays, scatter_ids
+from vgridpandas.utils.tile_helpers import (
+    latlon2tile_xy,
+    tilecode2tile_xyz,
+    tile_xy2tilecode,
+    tile_xy2bounds,
+    tile_polyfill_xy,
+)
 
-from vgrid.conversion.latlon2dggs import latlon2tilecode as latlon_to_tilecode
 from vgrid.conversion.dggs2geo.tilecode2geo import tilecode2geo as tilecode_to_geo
 from vgridpandas.utils.const import TILECODE_COL
 
@@ -20,9 +29,6 @@ AnyDataFrame = Union[DataFrame, GeoDataFrame]
 
 
 from typing import Union, Set
-import re
-from vgrid.dggs import mercantile
-from vgrid.utils.geometry import check_predicate
 from vgrid.conversion.dggscompact.tilecodecompact import tilecode_compact
 from vgrid.utils.io import validate_tilecode_resolution
 
@@ -65,39 +71,21 @@ def poly2tilecode(
 
     tilecode_ids = []
     for poly in polys:
-        tilecode_ids_poly = []
-        min_lon, min_lat, max_lon, max_lat = poly.bounds
-        tilecodes = mercantile.tiles(min_lon, min_lat, max_lon, max_lat, resolution)
-        for tile in tilecodes:
-            tilecode_id_poly = f"z{tile.z}x{tile.x}y{tile.y}"
-            tilecode_ids_poly.append(tilecode_id_poly)
-        for tilecode_id_poly in tilecode_ids_poly:
-            match = re.match(r"z(\d+)x(\d+)y(\d+)", tilecode_id_poly)
-            if not match:
-                raise ValueError("Invalid tilecode format. Expected format: 'zXxYyZ'")
-            z = int(match.group(1))
-            x = int(match.group(2))
-            y = int(match.group(3))
-            bounds = mercantile.bounds(x, y, z)
-
-            min_lat, min_lon = bounds.south, bounds.west
-            max_lat, max_lon = bounds.north, bounds.east
-            cell_polygon = Polygon(
-                [
-                    [min_lon, min_lat],
-                    [max_lon, min_lat],
-                    [max_lon, max_lat],
-                    [min_lon, max_lat],
-                    [min_lon, min_lat],
-                ]
-            )
-            if check_predicate(cell_polygon, poly, predicate):
-                tilecode_ids.append(tilecode_id_poly)
+        if poly.is_empty:
+            continue
+        x, y = tile_polyfill_xy(poly, resolution, predicate)
+        tilecode_ids.extend(tile_xy2tilecode(x, y, resolution).tolist())
     if compact:
         return tilecode_compact(tilecode_ids)
     return tilecode_ids
 
 
+def tilecode_boundaries(tilecode_ids):
+    """Return ``(coords, offsets)`` cell rings for an array of tilecode ids."""
+    tile_x, tile_y, zoom = tilecode2tile_xyz(tilecode_ids)
+    return box_boundaries(*tile_xy2bounds(tile_x, tile_y, zoom))
+
+
 def polyfill_row(geometry, resolution, predicate=None, compact=False) -> list:
     """Return cell ids covering a single row geometry."""
     if isinstance(geometry, (Polygon, MultiPolygon)):
@@ -125,6 +113,7 @@ class TilecodePandas:
         lat_col: str = "lat",
         lon_col: str = "lon",
         set_index: bool = False,
+        as_zxy: bool = False,
     ) -> AnyDataFrame:
         """Adds tilecode ID to (Geo)DataFrame.
 
@@ -143,28 +132,37 @@ class TilecodePandas:
             Name of the longitude column (if used), default 'lon'
         set_index : bool
             If True, the columns with tilecode ID is set as index, default 'True'
+        as_zxy : bool
+            If True, integer tile columns `tilecode_x` and `tilecode_y` are added
+            instead of tilecode IDs (the zoom is kept in `tilecode_res`), default False
 
         Returns
         -------
         (Geo)DataFrame with tilecode IDs added
         """
 
-        if isinstance(self._df, gpd.GeoDataFrame):
-            lons = self._df.geometry.x
-            lats = self._df.geometry.y
-        else:
-            lons = self._df[lon_col]
-            lats = self._df[lat_col]
+        resolution = validate_tilecode_resolution(resolution)
+        lats, lons = latlon_arrays(self._df, lat_col, lon_col)
+        tile_x, tile_y = latlon2tile_xy(lats, lons, resolution)
 
-        tilecode_ids = [
-            latlon_to_tilecode(lat, lon, resolution) for lat, lon in zip(lats, lons)
-        ]
-
-        tilecode_col = TILECODE_COL 
-        assign_arg = {tilecode_col: tilecode_ids, f"{tilecode_col}_res": resolution}
+        tilecode_col = TILECODE_COL
+        if as_zxy:
+            index_col = [f"{tilecode_col}_x", f"{tilecode_col}_y"]
+            assign_arg = {
+                f"{tilecode_col}_res": resolution,
+                index_col[0]: tile_x,
+                index_col[1]: tile_y,
+            }
+        else:
+            valid = tile_x >= 0
+            tilecode_ids = scatter_ids(
+                tile_xy2tilecode(tile_x[valid], tile_y[valid], resolution), valid
+            )
+            index_col = tilecode_col
+            assign_arg = {tilecode_col: tilecode_ids, f"{tilecode_col}_res": resolution}
         df = self._df.assign(**assign_arg)
         if set_index:
-            return df.set_index(tilecode_col)
+            return df.set_index(index_col)
         return df
 
     def tilecode2geo(self, tilecode_col: str = None) -> GeoDataFrame:
@@ -177,7 +175,13 @@ class TilecodePandas:
             if TILECODE_COL not in self._df.columns:
                 raise ValueError(f"Column '{TILECODE_COL}' not found in DataFrame")
             ids = self._df[TILECODE_COL]
-        return dggs_ids_to_geodataframe(self._df, ids, tilecode_to_geo)
+        return dggs_ids_to_geodataframe(
+            self._df,
+            ids,
+            tilecode_to_geo,
+            to_boundaries=tilecode_boundaries,
+            dggs="tilecode",
+        )
 
     def polyfill(
         self,
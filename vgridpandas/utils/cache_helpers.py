@@ -0,0 +1,108 @@
+"""Opt-in, process-wide LRU cache of DGGS cell geometries."""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+DEFAULT_CACHE_SIZE = 100_000
+
+MISSING = object()
+
+
+class CellGeometryCache:
+    """Bounded LRU mapping of cell keys to geometries, with hit/miss counters.
+
+    Keys are built by :func:`geometry_cache_key`. Access is thread-safe.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
+
+
+_geometry_cache = None
+
+
+def enable_geometry_cache(maxsize: int = DEFAULT_CACHE_SIZE) -> CellGeometryCache:
+    """Turn on the shared cell-geometry cache, replacing any previous one.
+
+    Args:
+        maxsize (int): Maximum number of cell geometries kept before the least
+            recently used ones are evicted.
+
+    Returns:
+        CellGeometryCache: The active cache.
+
+    Example:
+        >>> from vgridpandas.utils.cache_helpers import enable_geometry_cache
+        >>> cache = enable_geometry_cache(maxsize=10_000)
+        >>> cache.info().currsize
+        0
+    """
+    global _geometry_cache
+    _geometry_cache = CellGeometryCache(maxsize)
+    return _geometry_cache
+
+
+def disable_geometry_cache():
+    """Turn off the shared cell-geometry cache and drop its contents."""
+    global _geometry_cache
+    _geometry_cache = None
+
+
+def get_geometry_cache():
+    """Return the active :class:`CellGeometryCache`, or None when disabled."""
+    return _geometry_cache
+
+
+def geometry_cache_info():
+    """Return the active cache's :class:`CacheInfo`, or None when disabled."""
+    return None if _geometry_cache is None else _geometry_cache.info()
+
+
+def geometry_cache_key(dggs: str, dggs_id, to_geo_kwargs: dict):
+    """Key a cell by DGGS name, id and its antimeridian (to_geo) options.
+
+    Options left at None are dropped, so callers passing ``fix_antimeridian=None``
+    share entries with callers that omit it.
+    """
+    options = {k: v for k, v in to_geo_kwargs.items() if v is not None}
+    return dggs, dggs_id, tuple(sorted(options.items()))
@@ -2,54 +2,178 @@
 
 from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
+import shapely
 from shapely.geometry import MultiPolygon, Polygon
 
+from vgridpandas.utils.cache_helpers import (
+    MISSING,
+    geometry_cache_key,
+    get_geometry_cache,
+)
+
 
 def dggs_id_to_polygon(dggs_id, to_geo: Callable, **to_geo_kwargs) -> Polygon:
     geom = to_geo(dggs_id, **to_geo_kwargs)
     if isinstance(geom, list):
+        if len(geom) == 0:
+            return Polygon()
         return MultiPolygon(geom) if len(geom) > 1 else geom[0]
     return geom if geom is not None else Polygon()
 
 
-def dggs_ids_to_geometries(dggs_ids, to_geo: Callable, **to_geo_kwargs) -> list:
-    """Process DGGS ids (scalar or list per row) into geometries."""
-    geometries = []
-    for row_dggs_ids in dggs_ids:
+def cell_geometry(dggs: str, dggs_id, to_geo: Callable, **to_geo_kwargs) -> Polygon:
+    """Return the polygon of one cell, through the shared cache when enabled.
+
+    See :func:`vgridpandas.utils.cache_helpers.enable_geometry_cache`.
+    """
+    cache = get_geometry_cache()
+    if cache is None:
+        return dggs_id_to_polygon(dggs_id, to_geo, **to_geo_kwargs)
+    key = geometry_cache_key(dggs, dggs_id, to_geo_kwargs)
+    geom = cache.get(key)
+    if geom is MISSING:
+        geom = dggs_id_to_polygon(dggs_id, to_geo, **to_geo_kwargs)
+        cache.put(key, geom)
+    return geom
+
+
+def box_boundaries(west, south, east, north):
+    """Return ``(coords, offsets)`` rings for arrays of cell bounding boxes.
+
+    Vertices follow the order used by the vgrid ``*2geo`` converters:
+    (w, s), (e, s), (e, n), (w, n), (w, s).
+    """
+    west, south, east, north = np.broadcast_arrays(west, south, east, north)
+    lons = np.stack([west, east, east, west, west], axis=1)
+    lats = np.stack([south, south, north, north, south], axis=1)
+    coords = np.stack([lons.ravel(), lats.ravel()], axis=1)
+    offsets = np.arange(0, 5 * len(west) + 1, 5)
+    return coords, offsets
+
+
+def polygons_from_boundaries(coords, offsets) -> np.ndarray:
+    """Build polygons in bulk from flat ring vertices and per-cell offsets.
+
+    Cell ``i`` owns ``coords[offsets[i]:offsets[i + 1]]``; open rings are closed.
+    """
+    coords = np.asarray(coords, dtype="float64")
+    counts = np.diff(np.asarray(offsets))
+    ring_index = np.repeat(np.arange(len(counts)), counts)
+    rings = shapely.linearrings(coords, indices=ring_index)
+    return shapely.polygons(rings)
+
+
+def flatten_dggs_ids(dggs_ids):
+    """Flatten DGGS ids (scalar or list per row) into one id list.
+
+    Returns ``(flat_ids, flat_rows, is_list_row)``: every non-missing id, the
+    row it came from, and a mask of rows holding a non-empty id list.
+    """
+    flat_ids, flat_rows = [], []
+    is_list_row = np.zeros(len(dggs_ids), dtype=bool)
+    for i, row_dggs_ids in enumerate(dggs_ids):
+        if isinstance(row_dggs_ids, list):
+            is_list_row[i] = bool(row_dggs_ids)
+            flat_ids.extend(row_dggs_ids)
+            flat_rows.extend([i] * len(row_dggs_ids))
+        elif not pd.isna(row_dggs_ids):
+            flat_ids.append(row_dggs_ids)
+            flat_rows.append(i)
+    return flat_ids, np.asarray(flat_rows, dtype=np.int64), is_list_row
+
+
+def dggs_ids_to_polygons(
+    dggs_ids,
+    to_geo: Callable,
+    to_boundaries: Optional[Callable] = None,
+    dggs: Optional[str] = None,
+    **to_geo_kwargs,
+) -> np.ndarray:
+    """Convert an array of distinct DGGS ids into one polygon per id.
+
+    When ``to_boundaries`` is given, all cells are built at once by
+    :func:`polygons_from_boundaries`; ids it cannot handle fall back to
+    ``to_geo`` cell by cell. Invalid ids become empty polygons.
+    When ``dggs`` is given and the shared geometry cache is enabled, cached
+    cells are reused and only the missing ones are converted.
+    """
+    cache = get_geometry_cache() if dggs is not None else None
+    if cache is not None:
+        keys = [
+            geometry_cache_key(dggs, dggs_id, to_geo_kwargs) for dggs_id in dggs_ids
+        ]
+        polygons = np.empty(len(keys), dtype=object)
+        polygons[:] = [cache.get(key) for key in keys]
+        missing = np.flatnonzero([polygon is MISSING for polygon in polygons])
+        if len(missing):
+            polygons[missing] = dggs_ids_to_polygons(
+                dggs_ids[missing], to_geo, to_boundaries, **to_geo_kwargs
+            )
+            for i in missing:
+                cache.put(keys[i], polygons[i])
+        return polygons
+
+    if to_boundaries is not None:
         try:
-            if pd.isna(row_dggs_ids):
-                geometries.append(Polygon())
-            elif isinstance(row_dggs_ids, list):
-                if len(row_dggs_ids) == 0:
-                    geometries.append(Polygon())
-                else:
-                    cell_geometries = [
-                        dggs_id_to_polygon(dggs_id, to_geo, **to_geo_kwargs)
-                        for dggs_id in row_dggs_ids
-                    ]
-                    geometries.append(MultiPolygon(cell_geometries))
-            else:
-                geometries.append(
-                    dggs_id_to_polygon(row_dggs_ids, to_geo, **to_geo_kwargs)
-                )
+            return polygons_from_boundaries(*to_boundaries(dggs_ids))
         except (ValueError, TypeError):
-            if isinstance(row_dggs_ids, list):
-                if len(row_dggs_ids) == 0:
-                    geometries.append(Polygon())
-                else:
-                    cell_geometries = [
-                        dggs_id_to_polygon(dggs_id, to_geo, **to_geo_kwargs)
-                        for dggs_id in row_dggs_ids
-                    ]
-                    geometries.append(MultiPolygon(cell_geometries))
-            else:
-                try:
-                    geometries.append(
-                        dggs_id_to_polygon(row_dggs_ids, to_geo, **to_geo_kwargs)
-                    )
-                except Exception:
-                    geometries.append(Polygon())
+            pass
+
+    polygons = np.empty(len(dggs_ids), dtype=object)
+    for i, dggs_id in enumerate(dggs_ids):
+        try:
+            polygons[i] = dggs_id_to_polygon(dggs_id, to_geo, **to_geo_kwargs)
+        except (ValueError, TypeError):
+            polygons[i] = Polygon()
+    return polygons
+
+
+def dggs_ids_to_geometries(
+    dggs_ids,
+    to_geo: Callable,
+    to_boundaries: Optional[Callable] = None,
+    dggs: Optional[str] = None,
+    **to_geo_kwargs,
+) -> np.ndarray:
+    """Process DGGS ids (scalar or list per row) into geometries.
+
+    The ids are factorized first, so each distinct cell is converted once by
+    :func:`dggs_ids_to_polygons` and scattered back to every row holding it.
+    Rows holding a list of ids become multipolygons. ``dggs`` names the grid
+    for the shared geometry cache, see :func:`dggs_ids_to_polygons`.
+    """
+    rows = list(dggs_ids)
+    geometries = np.full(len(rows), Polygon(), dtype=object)
+    flat_ids, flat_rows, is_list_row = flatten_dggs_ids(rows)
+    if not flat_ids:
+        return geometries
+
+    codes, unique_ids = pd.factorize(np.asarray(flat_ids, dtype=object))
+    polygons = dggs_ids_to_polygons(
+        np.asarray(unique_ids, dtype=object),
+        to_geo,
+        to_boundaries,
+        dggs,
+        **to_geo_kwargs,
+    )[codes]
+
+    single = ~is_list_row[flat_rows]
+    geometries[flat_rows[single]] = polygons[single]
+    if not is_list_row.any():
+        return geometries
+
+    parts, part_rows = polygons[~single], flat_rows[~single]
+    list_rows, starts, part_index = np.unique(
+        part_rows, return_index=True, return_inverse=True
+    )
+    is_polygon = shapely.get_type_id(parts) == shapely.GeometryType.POLYGON
+    if is_polygon.all() and not shapely.is_empty(parts).any():
+        geometries[list_rows] = shapely.multipolygons(parts, indices=part_index)
+    else:
+        for row, row_parts in zip(list_rows, np.split(parts, starts[1:])):
+            geometries[row] = MultiPolygon(list(row_parts))
     return geometries
 
 
@@ -59,14 +183,22 @@ def dggs_ids_to_geodataframe(
     to_geo: Callable,
     fix_antimeridian: Optional[str] = None,
     to_geo_kwargs: Optional[dict] = None,
+    to_boundaries: Optional[Callable] = None,
+    dggs: Optional[str] = None,
 ):
-    """Build a GeoDataFrame from a DGGS id series using ``to_geo``."""
+    """Build a GeoDataFrame from a DGGS id series using ``to_geo``.
+
+    ``to_boundaries`` enables the bulk path and ``dggs`` the shared geometry
+    cache, see :func:`dggs_ids_to_geometries`.
+    """
     import geopandas as gpd
 
     kwargs = dict(to_geo_kwargs or {})
     if fix_antimeridian is not None and "fix_antimeridian" not in kwargs:
         kwargs["fix_antimeridian"] = fix_antimeridian
-    geometries = dggs_ids_to_geometries(dggs_ids, to_geo, **kwargs)
+    geometries = dggs_ids_to_geometries(
+        dggs_ids, to_geo, to_boundaries=to_boundaries, dggs=dggs, **kwargs
+    )
     result_df = df.copy()
     result_df["geometry"] = geometries
     return gpd.GeoDataFrame(result_df, crs="epsg:4326")
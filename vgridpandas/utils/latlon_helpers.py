@@ -0,0 +1,48 @@
+"""Shared helpers for batched lat/lon to DGGS id conversion."""
+
+import geopandas as gpd
+import numpy as np
+
+
+def latlon_arrays(df, lat_col: str = "lat", lon_col: str = "lon"):
+    """Return ``(lats, lons)`` as float64 NumPy arrays.
+
+    pd.DataFrame: uses `lat_col` and `lon_col`
+    gpd.GeoDataFrame: uses the x/y of `geometry`
+    """
+    if isinstance(df, gpd.GeoDataFrame):
+        lons = df.geometry.x.to_numpy(dtype="float64")
+        lats = df.geometry.y.to_numpy(dtype="float64")
+    else:
+        lons = df[lon_col].to_numpy(dtype="float64")
+        lats = df[lat_col].to_numpy(dtype="float64")
+    return lats, lons
+
+
+def valid_latlon_mask(lats, lons):
+    """Return a boolean mask of rows holding finite coordinates."""
+    return np.isfinite(lats) & np.isfinite(lons)
+
+
+def scatter_ids(ids, valid, fill=None):
+    """Scatter ids computed for ``valid`` rows into an object array of ``fill``."""
+    out = np.full(len(valid), fill, dtype=object)
+    out[valid] = ids
+    return out
+
+
+def ascii_strings(columns) -> list:
+    """Join per-position arrays of ASCII codes into one string per row.
+
+    ``columns`` holds one integer array per character position, so every
+    string has the same length.
+    """
+    codes = np.ascontiguousarray(np.stack(columns, axis=1), dtype=np.uint8)
+    return codes.view(f"S{codes.shape[1]}").ravel().astype(str).tolist()
+
+
+def digit_columns(values, width: int) -> list:
+    """Return the ASCII codes of non-negative integers zero-padded to ``width``."""
+    values = np.asarray(values, dtype=np.int64)
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return [ord("0") + values // power % 10 for power in powers]
@@ -0,0 +1,104 @@
+"""Shared bulk evaluation of spatial predicates between cells and a geometry."""
+
+import copy
+
+import numpy as np
+import shapely
+
+PREDICATE_ALIASES = {
+    "intersect": "intersects",
+    "intersects": "intersects",
+    "within": "within",
+    "centroid_within": "centroid_within",
+    "centroid": "centroid_within",
+    "largest_overlap": "largest_overlap",
+    "overlap": "largest_overlap",
+    "majority": "largest_overlap",
+}
+
+PREDICATE_CODES = {1: "within", 2: "centroid_within", 3: "largest_overlap"}
+
+
+def normalize_predicate(predicate) -> str:
+    """Return the canonical name of a ``check_predicate`` predicate.
+
+    Accepts the same strings and integer codes as
+    ``vgrid.utils.geometry.check_predicate`` and, like it, falls back to
+    ``"intersects"`` for anything unknown.
+    """
+    if isinstance(predicate, str):
+        return PREDICATE_ALIASES.get(predicate.lower(), "intersects")
+    if isinstance(predicate, int):
+        return PREDICATE_CODES.get(predicate, "intersects")
+    return "intersects"
+
+
+def prepared_geometry(geometry):
+    """Return a prepared version of ``geometry``.
+
+    ``shapely.prepare`` works in place, so an unprepared geometry is copied
+    first and the caller's object is left untouched.
+    """
+    if shapely.is_prepared(geometry):
+        return geometry
+    geometry = copy.copy(geometry)
+    shapely.prepare(geometry)
+    return geometry
+
+
+def classify_cells(cell_polygons, geometry):
+    """Split cells into fully inside, fully outside and boundary cells.
+
+    ``geometry`` is prepared once (see :func:`prepared_geometry`), then all
+    cells are tested with vectorized Shapely predicates. Returns boolean
+    ``(inside, boundary)`` masks; cells in neither are outside.
+    """
+    cells = np.asarray(cell_polygons, dtype=object)
+    geometry = prepared_geometry(geometry)
+    inside = shapely.contains_properly(geometry, cells)
+    boundary = ~inside & shapely.intersects(geometry, cells)
+    return inside, boundary
+
+
+def cells_matching_predicate(cell_polygons, geometry, predicate=None) -> np.ndarray:
+    """Return a mask of cells kept by ``predicate`` against ``geometry``.
+
+    Gives the same answer as calling ``check_predicate`` on every cell, but
+    cells are classified in bulk by :func:`classify_cells` and the exact test
+    only runs on cells crossing the geometry boundary.
+    """
+    cells = np.asarray(cell_polygons, dtype=object)
+    if len(cells) == 0:
+        return np.zeros(0, dtype=bool)
+    predicate = normalize_predicate(predicate)
+    geometry = prepared_geometry(geometry)
+
+    if predicate == "centroid_within":
+        return shapely.contains(geometry, shapely.centroid(cells))
+
+    inside, boundary = classify_cells(cells, geometry)
+    if predicate == "intersects":
+        return inside | boundary
+
+    keep = inside.copy()
+    if predicate == "within":
+        keep[boundary] = shapely.contains(geometry, cells[boundary])
+        return keep
+
+    # largest_overlap: at least half of the cell area lies in the geometry.
+    keep[inside] = shapely.area(cells[inside]) > 0
+    boundary_cells = cells[boundary]
+    cell_area = shapely.area(boundary_cells)
+    overlap_area = shapely.area(shapely.intersection(boundary_cells, geometry))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        keep[boundary] = (overlap_area > 0) & (overlap_area / cell_area >= 0.5)
+    return keep
+
+
+def filter_cells(cell_ids, cell_polygons, geometry, predicate=None) -> list:
+    """Return the ``cell_ids`` whose polygons satisfy ``predicate``.
+
+    See :func:`cells_matching_predicate`.
+    """
+    keep = cells_matching_predicate(cell_polygons, geometry, predicate)
+    return [cell_id for cell_id, kept in zip(cell_ids, keep) if kept]
@@ -0,0 +1,181 @@
+"""Shared vectorized Web-Mercator tile math for Quadkey and Tilecode."""
+
+import numpy as np
+import pandas as pd
+from vgrid.dggs.mercantile import EPSILON, LL_EPSILON, InvalidLatitudeError
+
+from vgridpandas.utils.geo_helpers import box_boundaries, polygons_from_boundaries
+from vgridpandas.utils.predicate_helpers import (
+    cells_matching_predicate,
+    classify_cells,
+)
+
+
+def latlon2tile_xy(lats, lons, zoom: int):
+    """Return Web-Mercator tile ``(x, y)`` int64 arrays at ``zoom``.
+
+    Same closed-form math as ``mercantile.tile`` applied to whole arrays,
+    including its edge clamping and EPSILON nudge towards the next tile.
+    Rows with non-finite coordinates get ``-1``.
+
+    Raises
+    ------
+    InvalidLatitudeError
+        When a latitude has no Mercator y (the poles)
+    """
+    lats = np.asarray(lats, dtype="float64")
+    lons = np.asarray(lons, dtype="float64")
+    valid = np.isfinite(lats) & np.isfinite(lons)
+
+    x = np.where(valid, lons, 0.0) / 360.0 + 0.5
+    sinlat = np.sin(np.radians(np.where(valid, lats, 0.0)))
+    if ((1.0 - sinlat) == 0.0).any() or ((1.0 + sinlat) == 0.0).any():
+        lat = lats[valid & (np.abs(sinlat) == 1.0)][0]
+        raise InvalidLatitudeError(f"Y can not be computed: lat={lat!r}")
+    y = 0.5 - 0.25 * np.log((1.0 + sinlat) / (1.0 - sinlat)) / np.pi
+
+    z2 = 2.0**zoom
+    xtile = np.floor((x + EPSILON) * z2).astype(np.int64)
+    xtile = np.where(x <= 0, 0, np.where(x >= 1, int(z2 - 1), xtile))
+    ytile = np.floor((y + EPSILON) * z2).astype(np.int64)
+    ytile = np.where(y <= 0, 0, np.where(y >= 1, int(z2 - 1), ytile))
+    xtile[~valid] = -1
+    ytile[~valid] = -1
+    return xtile, ytile
+
+
+def tile_xy2quadkey(x, y, zoom: int):
+    """Format tile ``(x, y)`` arrays at ``zoom`` as quadkey strings."""
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    if zoom == 0:
+        return np.full(len(x), "", dtype=object)
+    shifts = np.arange(zoom - 1, -1, -1, dtype=np.int64)
+    digits = ((x[:, None] >> shifts) & 1) + 2 * ((y[:, None] >> shifts) & 1)
+    chars = (digits + ord("0")).astype(np.uint8)
+    return chars.view(f"S{zoom}").ravel().astype(str).astype(object)
+
+
+def tile_xy2tilecode(x, y, zoom: int):
+    """Format tile ``(x, y)`` arrays at ``zoom`` as ``zXxYyZ`` tilecode strings."""
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    tilecodes = np.char.add(f"z{zoom}x", x.astype(str))
+    tilecodes = np.char.add(np.char.add(tilecodes, "y"), y.astype(str))
+    return tilecodes.astype(object)
+
+
+def tile_xy2bounds(x, y, zoom):
+    """Return tile ``(west, south, east, north)`` arrays, as ``mercantile.bounds``."""
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    z2 = 2.0 ** np.asarray(zoom, dtype="float64")
+    west = x / z2 * 360.0 - 180.0
+    east = (x + 1) / z2 * 360.0 - 180.0
+    north = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y / z2))))
+    south = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * (y + 1) / z2))))
+    return west, south, east, north
+
+
+def quadkey2tile_xyz(quadkey_ids):
+    """Parse quadkey strings into tile ``(x, y, z)`` int64 arrays.
+
+    Raises
+    ------
+    ValueError
+        When a quadkey holds a digit other than 0-3
+    """
+    quadkey_ids = np.asarray(quadkey_ids, dtype=str)
+    zoom = np.char.str_len(quadkey_ids).astype(np.int64)
+    x = np.zeros(len(quadkey_ids), dtype=np.int64)
+    y = np.zeros(len(quadkey_ids), dtype=np.int64)
+    for length in np.unique(zoom[zoom > 0]):
+        rows = zoom == length
+        digits = quadkey_ids[rows].astype(f"S{length}").view(np.uint8)
+        digits = digits.reshape(-1, length).astype(np.int64) - ord("0")
+        if ((digits < 0) | (digits > 3)).any():
+            raise ValueError("Unexpected quadkey digit")
+        shifts = np.arange(length - 1, -1, -1, dtype=np.int64)
+        x[rows] = ((digits & 1) << shifts).sum(axis=1)
+        y[rows] = (((digits >> 1) & 1) << shifts).sum(axis=1)
+    return x, y, zoom
+
+
+def tilecode2tile_xyz(tilecode_ids):
+    """Parse ``zXxYyZ`` tilecode strings into tile ``(x, y, z)`` int64 arrays.
+
+    Raises
+    ------
+    ValueError
+        When a tilecode does not match the ``zXxYyZ`` format
+    """
+    parts = pd.Series(tilecode_ids, dtype=object).str.extract(r"^z(\d+)x(\d+)y(\d+)")
+    if parts.isna().any(axis=None):
+        raise ValueError("Invalid tilecode format. Expected format: 'zXxYyZ'")
+    zoom, x, y = (parts[col].to_numpy().astype(np.int64) for col in range(3))
+    return x, y, zoom
+
+
+def bbox2tile_range(west, south, east, north, zoom: int):
+    """Return the inclusive tile ranges ``(x0, x1, y0, y1)`` of a bbox at ``zoom``.
+
+    Same tiles as ``mercantile.tiles`` yields for a bbox with ``west <= east``,
+    including its clamping to the Web-Mercator latitude limits.
+    """
+    west, east = max(-180.0, west), min(180.0, east)
+    south, north = max(-85.051129, south), min(85.051129, north)
+    x, y = latlon2tile_xy([north, south + LL_EPSILON], [west, east - LL_EPSILON], zoom)
+    return x[0], x[1], y[0], y[1]
+
+
+def tile_xy_polygons(x, y, zoom):
+    """Build tile polygons in bulk from ``(x, y)`` arrays at ``zoom``."""
+    return polygons_from_boundaries(*box_boundaries(*tile_xy2bounds(x, y, zoom)))
+
+
+def tile_polyfill_xy(geometry, zoom: int, predicate=None):
+    """Return tile ``(x, y)`` arrays at ``zoom`` kept by ``predicate``.
+
+    Tiles are searched by integer x/y range inside the tile range of the
+    geometry bbox, from zoom 0 down. Each level's tiles are classified in bulk
+    with :func:`classify_cells`: tiles outside are pruned, tiles fully inside
+    are accepted whole and expanded to their x/y ranges at ``zoom``, and only
+    tiles on the boundary are split. Boundary tiles at ``zoom`` are checked
+    against ``predicate``. Tiles are returned sorted by x, then y, like
+    ``mercantile.tiles``.
+    """
+    x0, x1, y0, y1 = bbox2tile_range(*geometry.bounds, zoom)
+    tiles_x, tiles_y = [], []
+    x = y = np.zeros(1, dtype=np.int64)
+    for level in range(zoom + 1):
+        shift = zoom - level
+        in_range = (
+            ((x + 1) << shift > x0)
+            & (x << shift <= x1)
+            & ((y + 1) << shift > y0)
+            & (y << shift <= y1)
+        )
+        x, y = x[in_range], y[in_range]
+        if len(x) == 0:
+            break
+        cells = tile_xy_polygons(x, y, level)
+        if level == zoom:
+            keep = cells_matching_predicate(cells, geometry, predicate)
+            tiles_x.append(x[keep])
+            tiles_y.append(y[keep])
+            break
+        inside, boundary = classify_cells(cells, geometry)
+        offsets = np.arange(1 << shift, dtype=np.int64)
+        block_x = (x[inside, None, None] << shift) + offsets[None, None, :]
+        block_y = (y[inside, None, None] << shift) + offsets[None, :, None]
+        block_x, block_y = np.broadcast_arrays(block_x, block_y)
+        tiles_x.append(block_x.ravel())
+        tiles_y.append(block_y.ravel())
+        x = ((x[boundary, None] << 1) + [0, 1, 0, 1]).ravel()
+        y = ((y[boundary, None] << 1) + [0, 0, 1, 1]).ravel()
+
+    if not tiles_x:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    x, y = np.concatenate(tiles_x), np.concatenate(tiles_y)
+    order = np.lexsort((y, x))
+    return x[order], y[order]